@@ -6,29 +6,41 @@ Core functionality:
 - Direct integration with Copper CRM API
 """
 
+import atexit
 import json
 import logging
 import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+import requests
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from slack_sdk import WebClient
 
 from business_intelligence import BusinessIntelligence
+from cache import TTLCache
 from config import Config
 from copper_client import CopperClient
 from csv_handler import CSVHandler
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+from slack_common import (
+    GATHERING_ACK,
+    SUPPORTED_FILE_MIMETYPES,
+    SUPPORTED_FILE_RE,
+    configure_logging,
+    create_slack_client,
+    first_delivery,
+    get_bot_mention_re,
+    ruled_out_by_stub,
+    strip_bot_mention,
 )
 
+configure_logging(Config.LOG_LEVEL, sys.stdout)
 logger = logging.getLogger(__name__)
 
 # Type aliases
@@ -42,20 +54,168 @@ SlackAction = dict
 try:
     Config.validate()
 except ValueError as e:
-    logger.error(f"Configuration error: {e}")
-    exit(1)
-
-# Initialize Slack app
-app = App(token=Config.SLACK_BOT_TOKEN)
+    logger.error("Configuration error: %s", e)
+    sys.exit(1)
+
+# One Slack client for the app; see create_slack_client
+slack_client = create_slack_client(Config.SLACK_BOT_TOKEN)
+
+# Initialize Slack app. Listeners run on a dedicated pool so a slow Copper
+# query does not hold up other mentions, DMs or file uploads.
+app = App(
+    client=slack_client,
+    listener_executor=ThreadPoolExecutor(
+        max_workers=Config.SLACK_LISTENER_WORKERS,
+        thread_name_prefix="slack-listener",
+    ),
+)
 
 # Initialize components
 copper_client = CopperClient()
+atexit.register(copper_client.close)
 business_intel = BusinessIntelligence(copper_client)
 csv_handler = CSVHandler(copper_client)
 
 # State tracking for confirmations
 # Key: (user_id, channel_id), Value: {confirmation_data, analysis, timestamp}
+# (timestamp is time.monotonic(), used only for expiry)
+# Listeners run concurrently, so writes and removals go through the lock and
+# a reply only acts on a confirmation it managed to claim.
 pending_confirmations = {}
+_pending_confirmations_lock = threading.Lock()
+
+# Prompts left unanswered this long are dropped, so a reply hours later
+# isn't matched against stale options and abandoned entries don't pile up
+CONFIRMATION_TTL_SECONDS = 600
+
+
+def _get_confirmation(confirmation_key: tuple) -> Optional[dict]:
+    """Return the unexpired pending confirmation for the key, if any.
+
+    Args:
+        confirmation_key: (user_id, channel_id)
+
+    Returns:
+        Confirmation dict, or None if there is none or it has expired
+    """
+    with _pending_confirmations_lock:
+        pending = pending_confirmations.get(confirmation_key)
+        if pending and time.monotonic() - pending["timestamp"] > CONFIRMATION_TTL_SECONDS:
+            del pending_confirmations[confirmation_key]
+            return None
+        return pending
+
+
+def _store_confirmation(confirmation_key: tuple, confirmation: dict) -> None:
+    """Store a pending confirmation and drop any that have expired.
+
+    Args:
+        confirmation_key: (user_id, channel_id)
+        confirmation: {confirmation_data, analysis, timestamp}
+    """
+    cutoff = time.monotonic() - CONFIRMATION_TTL_SECONDS
+    with _pending_confirmations_lock:
+        for key in [k for k, v in pending_confirmations.items() if v["timestamp"] < cutoff]:
+            del pending_confirmations[key]
+        pending_confirmations[confirmation_key] = confirmation
+
+
+def _claim_confirmation(confirmation_key: tuple, pending: dict) -> bool:
+    """Remove ``pending`` if it is still the current confirmation for the key.
+
+    Args:
+        confirmation_key: (user_id, channel_id)
+        pending: Confirmation the caller read earlier
+
+    Returns:
+        True if this caller removed it, False if another reply already
+        consumed it or a newer query replaced it
+    """
+    with _pending_confirmations_lock:
+        if pending_confirmations.get(confirmation_key) is not pending:
+            return False
+        del pending_confirmations[confirmation_key]
+        return True
+
+
+# Reply to a bare mention; ``{user}`` is the mentioning user's ID
+MENTION_GREETING = (
+    "Hi <@{user}>! I'm your intelligent Copper CRM assistant. "
+    "Ask me anything in natural language!\n\n"
+    "*Examples:*\n"
+    "• 'What's the status of PubX?'\n"
+    "• 'Show me everything about Acme Corp'\n"
+    "• 'Who are we talking to at Microsoft?'\n"
+    "• 'What deals are in progress?'\n\n"
+    "*CSV Upload:*\n"
+    "• Upload a CSV file to enrich with Copper data"
+)
+
+# Reply to "help" in a DM
+HELP_TEXT = (
+    "*Copper CRM Bot - Intelligent Assistant*\n\n"
+    "*Business Intelligence:*\n"
+    "Ask me anything about your business! Examples:\n"
+    "• 'What's the status of PubX?'\n"
+    "• 'Show me everything about Acme Corp'\n"
+    "• 'Who are we talking to at Microsoft?'\n"
+    "• 'What deals are in progress?'\n\n"
+    "*CSV Upload:*\n"
+    "• Upload a CSV file for data enrichment"
+)
+
+# DM texts that ask for help, and replies that cancel a pending confirmation
+HELP_TOKENS = frozenset({"help", "?", "commands"})
+CANCEL_TOKENS = frozenset({"cancel", "abort", "quit", "exit"})
+
+# Read size when copying an upload's download stream to disk
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+# Recently processed upload file IDs. Slack sends file_shared once per channel
+# the file lands in and again on retries, so skip repeats within this window.
+SEEN_FILE_TTL_SECONDS = 300
+_seen_files: TTLCache[bool] = TTLCache(maxsize=1024)
+
+# Posts "working on it" acks in the background so the Copper query can start
+# without waiting on a Slack round-trip
+_ack_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack-ack")
+
+# Runs the Copper/NLP query pipeline off the Slack listener threads. Bounded
+# so a burst of heavy queries can't starve uploads and quick replies.
+_query_pool = ThreadPoolExecutor(
+    max_workers=Config.QUERY_WORKERS, thread_name_prefix="copper-query"
+)
+
+# Downloads, enriches and re-uploads CSV files off the Slack listener
+# threads. Each job already checks rows in parallel, so keep this small.
+_file_pool = ThreadPoolExecutor(
+    max_workers=Config.FILE_WORKERS, thread_name_prefix="csv-upload"
+)
+
+# DM queries waiting out the coalescing window, per (user, channel):
+# (timer, texts so far, say, client). Each new DM restarts the timer.
+_pending_dms: Dict[tuple, Tuple[threading.Timer, List[str], SayFunction, WebClient]] = {}
+_pending_dms_lock = threading.Lock()
+
+
+def _finish_ack(ack: Future, client: WebClient, say: SayFunction, text: str) -> None:
+    """Replace a background ack message with the final reply.
+
+    Falls back to posting a new message if the ack could not be sent or
+    edited.
+
+    Args:
+        ack: Future returned by submitting ``say`` to the ack pool
+        client: Slack client
+        say: Function to send messages
+        text: Final reply text
+    """
+    try:
+        ack_response = ack.result()
+        client.chat_update(channel=ack_response["channel"], ts=ack_response["ts"], text=text)
+    except Exception as e:
+        logger.warning("Could not update ack message, posting reply instead: %s", e)
+        say(text=text)
 
 
 def handle_confirmation_response(text: str, user: str, channel: str, say: SayFunction) -> None:
@@ -71,7 +231,7 @@ def handle_confirmation_response(text: str, user: str, channel: str, say: SayFun
 
     try:
         # Get pending confirmation
-        pending = pending_confirmations.get(confirmation_key)
+        pending = _get_confirmation(confirmation_key)
         if not pending:
             say(text="❌ No pending confirmation found. Please start a new query.")
             return
@@ -81,9 +241,9 @@ def handle_confirmation_response(text: str, user: str, channel: str, say: SayFun
         matches = confirmation_data.get("matches", [])
 
         # Check for cancel
-        if text.lower() in ["cancel", "abort", "quit", "exit"]:
-            del pending_confirmations[confirmation_key]
-            say(text="✅ Cancelled. Feel free to start a new query!")
+        if text.lower() in CANCEL_TOKENS:
+            if _claim_confirmation(confirmation_key, pending):
+                say(text="✅ Cancelled. Feel free to start a new query!")
             return
 
         # Try to parse selection number
@@ -100,10 +260,15 @@ def handle_confirmation_response(text: str, user: str, channel: str, say: SayFun
         selected_entity, score = matches[selection - 1]
         entity_type = confirmation_data.get("entity_type")
 
-        logger.info(f"User {user} confirmed selection {selection}: {selected_entity.get('name')} (score: {score:.1f})")
+        logger.info(
+            "User %s confirmed selection %d: %s (score: %.1f)",
+            user, selection, selected_entity.get('name'), score
+        )
 
-        # Clear the pending confirmation
-        del pending_confirmations[confirmation_key]
+        # Clear the pending confirmation; a concurrent reply that got there
+        # first has already answered
+        if not _claim_confirmation(confirmation_key, pending):
+            return
 
         # Now process with the confirmed entity
         say(text=f"✅ Got it! Gathering information about *{selected_entity.get('name')}*...")
@@ -120,113 +285,133 @@ def handle_confirmation_response(text: str, user: str, channel: str, say: SayFun
         }
 
         # Gather related data based on the original analysis
-        primary_id = selected_entity.get("id")
-        include = analysis.get("include", [])
-
-        if "contacts" in include or "all" in include:
-            intelligence["related_contacts"] = business_intel._get_related_contacts(
-                primary_id, entity_type
-            )
-
-        if "opportunities" in include or "deals" in include or "all" in include:
-            intelligence["related_opportunities"] = business_intel._get_related_opportunities(
-                primary_id, entity_type
-            )
-
-        if "leads" in include or "all" in include:
-            intelligence["related_leads"] = business_intel._get_related_leads(
-                primary_id, entity_type
-            )
-
-        if "tasks" in include or "all" in include:
-            intelligence["related_tasks"] = business_intel._get_related_tasks(
-                primary_id, entity_type
-            )
-
-        if "companies" in include or "all" in include:
-            intelligence["related_companies"] = business_intel._get_related_companies(
-                primary_id, entity_type
-            )
+        intelligence.update(business_intel.gather_related(
+            selected_entity.get("id"), entity_type, analysis.get("include", [])
+        ))
 
         # Format and send
         result_message = business_intel.format_intelligence(intelligence, "")
         say(text=result_message)
 
     except Exception as e:
-        logger.error(f"Error handling confirmation response: {e}", exc_info=True)
+        logger.error("Error handling confirmation response: %s", e, exc_info=True)
         # Clear the confirmation on error
-        if confirmation_key in pending_confirmations:
-            del pending_confirmations[confirmation_key]
+        with _pending_confirmations_lock:
+            pending_confirmations.pop(confirmation_key, None)
         say(text=f"❌ Error processing confirmation: {str(e)}")
 
 
-@app.event("app_mention")
-def handle_mention(event: SlackEvent, say: SayFunction, client: WebClient) -> None:
-    """Handle when the bot is mentioned in a channel.
+def _answer_query(
+    text: str,
+    user: str,
+    channel: str,
+    say: SayFunction,
+    client: WebClient,
+    source: str = "mention",
+) -> None:
+    """Answer a natural-language query from a mention or DM.
+
+    Routes the text to a pending confirmation if the user has one in this
+    channel, otherwise runs it through business intelligence and replies.
 
     Args:
-        event: Slack event data
+        text: Query text with any bot mention removed
+        user: User ID
+        channel: Channel ID
         say: Function to send messages
         client: Slack client
+        source: Where the query came from, for logging
     """
-    try:
-        user: str = event.get("user", "")
-        text: str = event.get("text", "")
-        channel: str = event.get("channel", "")
+    # Check for confirmation response
+    confirmation_key = (user, channel)
+    if _get_confirmation(confirmation_key) is not None:
+        handle_confirmation_response(text, user, channel, say)
+        return
 
-        # Remove bot mention from text
-        bot_user_id: str = client.auth_test()["user_id"]
-        text = text.replace(f"<@{bot_user_id}>", "").strip()
+    # Process as an intelligent business query on the query pool so this
+    # listener thread is free for the next event straight away
+    logger.info("Processing business intelligence query from %s (%s): %s", user, source, text)
+    ack = _ack_pool.submit(say, text=GATHERING_ACK)
+    _query_pool.submit(_run_business_query, text, confirmation_key, ack, say, client)
 
-        if not text:
-            say(
-                text=f"Hi <@{user}>! I'm your intelligent Copper CRM assistant. "
-                     "Ask me anything in natural language!\n\n"
-                     "*Examples:*\n"
-                     "• 'What's the status of PubX?'\n"
-                     "• 'Show me everything about Acme Corp'\n"
-                     "• 'Who are we talking to at Microsoft?'\n"
-                     "• 'What deals are in progress?'\n\n"
-                     "*CSV Upload:*\n"
-                     "• Upload a CSV file to enrich with Copper data"
-            )
-            return
 
-        # Check for confirmation response
-        confirmation_key = (user, channel)
-        if confirmation_key in pending_confirmations:
-            handle_confirmation_response(text, user, channel, say)
-            return
+def _run_business_query(
+    text: str,
+    confirmation_key: tuple,
+    ack: Future,
+    say: SayFunction,
+    client: WebClient,
+) -> None:
+    """Run a business intelligence query and replace the ack with the answer.
 
-        # Process as an intelligent business query
-        logger.info(f"Processing business intelligence query from {user}: {text}")
-        say(text=f"🔍 Gathering intelligence from Copper CRM...")
+    Runs on ``_query_pool``, so it reports its own errors to the user.
 
+    Args:
+        text: Query text
+        confirmation_key: (user_id, channel_id) for storing a confirmation
+        ack: Future for the "Gathering intelligence" ack message
+        say: Function to send messages
+        client: Slack client
+    """
+    try:
         # Use business intelligence to process the query
         result = business_intel.process_query(text)
 
         # Check if confirmation is needed
         if result.get("needs_confirmation"):
             # Store confirmation state
-            pending_confirmations[confirmation_key] = {
+            _store_confirmation(confirmation_key, {
                 "confirmation_data": result["confirmation_data"],
                 "analysis": result["analysis"],
-                "timestamp": __import__("time").time()
-            }
+                "timestamp": time.monotonic()
+            })
+
+        _finish_ack(ack, client, say, result["message"])
+
+    except Exception as e:
+        logger.error("Error answering query: %s", e, exc_info=True)
+        _finish_ack(ack, client, say, f"Sorry, I encountered an error: {str(e)}")
+
+
+@app.event("app_mention")
+def handle_mention(event: SlackEvent, body: dict, say: SayFunction, client: WebClient) -> None:
+    """Handle when the bot is mentioned in a channel.
+
+    Args:
+        event: Slack event data
+        body: Event envelope (for ``event_id``)
+        say: Function to send messages
+        client: Slack client
+    """
+    if not first_delivery(body):
+        return
+
+    try:
+        user: str = event.get("user", "")
+        text: str = event.get("text", "")
+        channel: str = event.get("channel", "")
+
+        # Remove bot mention from text
+        text = strip_bot_mention(text, client)
 
-        say(text=result["message"])
+        if not text:
+            say(text=MENTION_GREETING.format(user=user))
+            return
+
+        _answer_query(text, user, channel, say, client)
 
     except Exception as e:
-        logger.error(f"Error handling mention: {str(e)}", exc_info=True)
+        logger.error("Error handling mention: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
 @app.event("message")
-def handle_message(event: SlackEvent, say: SayFunction, client: WebClient) -> None:
+def handle_message(event: SlackEvent, body: dict, say: SayFunction, client: WebClient) -> None:
     """Handle direct messages to the bot.
 
     Args:
         event: Slack event data
+        body: Event envelope (for ``event_id``)
         say: Function to send messages
         client: Slack client
     """
@@ -238,6 +423,9 @@ def handle_message(event: SlackEvent, say: SayFunction, client: WebClient) -> No
     if event.get("subtype") == "bot_message":
         return
 
+    if not first_delivery(body):
+        return
+
     try:
         user: str = event.get("user", "")
         text: str = event.get("text", "").strip()
@@ -247,46 +435,68 @@ def handle_message(event: SlackEvent, say: SayFunction, client: WebClient) -> No
             return
 
         # Check for help commands
-        if text.lower() in ["help", "?", "commands"]:
-            say(
-                text="*Copper CRM Bot - Intelligent Assistant*\n\n"
-                     "*Business Intelligence:*\n"
-                     "Ask me anything about your business! Examples:\n"
-                     "• 'What's the status of PubX?'\n"
-                     "• 'Show me everything about Acme Corp'\n"
-                     "• 'Who are we talking to at Microsoft?'\n"
-                     "• 'What deals are in progress?'\n\n"
-                     "*CSV Upload:*\n"
-                     "• Upload a CSV file for data enrichment"
-            )
+        if text.lower() in HELP_TOKENS:
+            say(text=HELP_TEXT)
             return
 
-        # Check for confirmation response
-        confirmation_key = (user, channel)
-        if confirmation_key in pending_confirmations:
-            handle_confirmation_response(text, user, channel, say)
-            return
+        # Replies to a pending confirmation are answered straight away;
+        # new questions wait briefly in case the user is still typing
+        if (Config.DM_COALESCE_SECONDS > 0 and
+                _get_confirmation((user, channel)) is None):
+            _coalesce_dm(text, user, channel, say, client)
+        else:
+            _answer_query(text, user, channel, say, client, source="DM")
 
-        # Process as an intelligent business query
-        logger.info(f"Processing business intelligence query from {user} (DM): {text}")
-        say(text="🔍 Gathering intelligence from Copper CRM...")
+    except Exception as e:
+        logger.error("Error handling message: %s", e, exc_info=True)
+        say(text=f"Sorry, I encountered an error: {str(e)}")
 
-        # Use business intelligence to process the query
-        result = business_intel.process_query(text)
 
-        # Check if confirmation is needed
-        if result.get("needs_confirmation"):
-            # Store confirmation state
-            pending_confirmations[confirmation_key] = {
-                "confirmation_data": result["confirmation_data"],
-                "analysis": result["analysis"],
-                "timestamp": __import__("time").time()
-            }
+def _coalesce_dm(text: str, user: str, channel: str, say: SayFunction, client: WebClient) -> None:
+    """Queue a DM query, restarting the user's coalescing window.
 
-        say(text=result["message"])
+    A question sent as several quick messages is answered once, with the
+    messages joined, instead of running a Copper lookup per fragment.
+
+    Args:
+        text: Message text
+        user: User ID
+        channel: DM channel ID
+        say: Function to send messages
+        client: Slack client
+    """
+    key = (user, channel)
+    with _pending_dms_lock:
+        pending = _pending_dms.get(key)
+        texts = [text]
+        if pending is not None:
+            pending[0].cancel()
+            texts = pending[1] + texts
+        timer = threading.Timer(Config.DM_COALESCE_SECONDS, _flush_dm, args=(key,))
+        timer.daemon = True
+        _pending_dms[key] = (timer, texts, say, client)
+        timer.start()
+
+
+def _flush_dm(key: tuple) -> None:
+    """Answer the DMs queued for ``key`` once its window closes.
+
+    Runs on the window's timer thread. A timer that fired just as a newer
+    message restarted the window finds a different timer queued and leaves
+    the messages to that one.
+    """
+    with _pending_dms_lock:
+        pending = _pending_dms.get(key)
+        if pending is None or pending[0] is not threading.current_thread():
+            return
+        del _pending_dms[key]
 
+    _, texts, say, client = pending
+    user, channel = key
+    try:
+        _answer_query("\n".join(texts), user, channel, say, client, source="DM")
     except Exception as e:
-        logger.error(f"Error handling message: {str(e)}", exc_info=True)
+        logger.error("Error handling message: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
@@ -294,18 +504,51 @@ def handle_message(event: SlackEvent, say: SayFunction, client: WebClient) -> No
 def handle_file_upload(event: SlackEvent, client: WebClient, say: SayFunction) -> None:
     """Handle CSV file uploads for processing.
 
+    Only de-duplicates the event here; the download, processing and upload
+    run on ``_file_pool`` so this listener returns straight away.
+
     Args:
         event: Slack event data
         client: Slack client
         say: Function to send messages
     """
-    try:
-        file_id = event.get("file_id")
-        user_id = event.get("user_id")
+    file_id = event.get("file_id")
+    if not file_id:
+        return
 
-        if not file_id:
-            return
+    # Skip images, PDFs and the like without a files.info round-trip
+    if ruled_out_by_stub(event.get("file") or {}):
+        logger.info("Ignoring non-CSV file: %s", file_id)
+        return
+
+    if not _seen_files.add(file_id, True, ttl=SEEN_FILE_TTL_SECONDS):
+        logger.info("Ignoring duplicate file_shared event for %s", file_id)
+        return
+
+    _file_pool.submit(
+        _process_file_upload, file_id, event.get("user_id"), event.get("channel_id"), client, say
+    )
 
+
+def _process_file_upload(
+    file_id: str,
+    user_id: str,
+    channel_id: str,
+    client: WebClient,
+    say: SayFunction,
+) -> None:
+    """Download an uploaded CSV, enrich it and post the result.
+
+    Runs on ``_file_pool``, so it reports its own errors to the user.
+
+    Args:
+        file_id: Slack file ID
+        user_id: Uploading user's ID
+        channel_id: Channel the file was shared in
+        client: Slack client
+        say: Function to send messages
+    """
+    try:
         # Get file info
         file_info = client.files_info(file=file_id)
         file_data = file_info.get("file", {})
@@ -313,58 +556,67 @@ def handle_file_upload(event: SlackEvent, client: WebClient, say: SayFunction) -
         file_name = file_data.get("name", "")
         file_url = file_data.get("url_private_download", "")
 
-        # Check if it's a CSV or Excel file
-        if not (file_name.endswith('.csv') or
-                file_name.endswith('.xlsx') or
-                file_name.endswith('.xls')):
-            logger.info(f"Ignoring non-CSV file: {file_name}")
+        # Check if it's a CSV or Excel file before downloading anything
+        if not (SUPPORTED_FILE_RE.search(file_name) or
+                file_data.get("mimetype") in SUPPORTED_FILE_MIMETYPES):
+            logger.info("Ignoring non-CSV file: %s", file_name)
             return
 
-        logger.info(f"Processing file upload from {user_id}: {file_name}")
-        say(text=f"📄 Processing {file_name}... this may take a moment.")
-
-        # Download the file
-        import requests
-        headers = {"Authorization": f"Bearer {Config.SLACK_BOT_TOKEN}"}
-        response = requests.get(file_url, headers=headers)
-
-        if response.status_code != 200:
-            say(text=f"❌ Failed to download file: {file_name}")
+        file_size = file_data.get("size", 0)
+        if file_size > Config.MAX_CSV_BYTES:
+            logger.info("Ignoring oversized file %s: %s bytes", file_name, file_size)
+            say(
+                text=f"❌ {file_name} is too large to process "
+                     f"(limit {Config.MAX_CSV_BYTES // (1024 * 1024)} MB)."
+            )
             return
 
-        # Save temporarily
-        temp_path = f"/tmp/{file_name}"
-        with open(temp_path, 'wb') as f:
-            f.write(response.content)
-
-        # Process the CSV
-        result = csv_handler.process_csv(temp_path, user_id)
+        logger.info("Processing file upload from %s: %s", user_id, file_name)
+        say(text=f"📄 Processing {file_name}... this may take a moment.")
 
-        # Clean up
-        os.remove(temp_path)
+        # Stream the download straight to a private temp file. The upload's
+        # name only supplies the extension process_csv dispatches on, so it
+        # can't pick the path or collide with another user's upload.
+        upload = tempfile.NamedTemporaryFile(
+            prefix="upload_", suffix=os.path.splitext(file_name)[1].lower(), delete=False
+        )
+        temp_path = upload.name
+        try:
+            with upload:
+                try:
+                    with csv_handler.open_download(file_url, Config.SLACK_BOT_TOKEN) as stream:
+                        shutil.copyfileobj(stream, upload, DOWNLOAD_CHUNK_BYTES)
+                except requests.RequestException:
+                    say(text=f"❌ Failed to download file: {file_name}")
+                    return
+
+            # Process the CSV
+            result = csv_handler.process_csv(temp_path, user_id)
+        finally:
+            os.remove(temp_path)
 
         # Send results
         if result.get("success"):
             output_file = result.get("output_file")
             summary = result.get("summary", "")
 
-            # Upload the result
-            client.files_upload_v2(
-                channel=event.get("channel_id"),
-                file=output_file,
-                title=f"Enriched_{file_name}",
-                initial_comment=f"✅ Processing complete!\n\n{summary}"
-            )
-
-            # Clean up output file
-            if os.path.exists(output_file):
-                os.remove(output_file)
+            # Upload the result, removing the output file even if that fails
+            try:
+                client.files_upload_v2(
+                    channel=channel_id,
+                    file=output_file,
+                    title=f"Enriched_{file_name}",
+                    initial_comment=f"✅ Processing complete!\n\n{summary}"
+                )
+            finally:
+                if output_file and os.path.exists(output_file):
+                    os.remove(output_file)
         else:
             error = result.get("error", "Unknown error")
             say(text=f"❌ Error processing file: {error}")
 
     except Exception as e:
-        logger.error(f"Error handling file upload: {str(e)}", exc_info=True)
+        logger.error("Error handling file upload: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error processing your file: {str(e)}")
 
 
@@ -372,16 +624,24 @@ def main():
     """Start the bot."""
     try:
         logger.info("Starting Copper CRM Slack Bot...")
+
+        # Resolve the bot's user ID now rather than on the first mention
+        get_bot_mention_re(app.client)
+
         logger.info("Bot is running in Socket Mode!")
         logger.info("Press Ctrl+C to stop")
 
-        handler = SocketModeHandler(app, Config.SLACK_APP_TOKEN)
+        handler = SocketModeHandler(
+            app,
+            Config.SLACK_APP_TOKEN,
+            concurrency=Config.SLACK_SOCKET_CONCURRENCY,
+        )
         handler.start()
 
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
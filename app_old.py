@@ -1,5 +1,6 @@
 """Copper CRM Slack Bot - Main Application."""
 
+import hashlib
 import json
 import logging
 import os
@@ -7,10 +8,11 @@ import re
 import signal
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from types import FrameType
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
@@ -18,6 +20,7 @@ from slack_sdk import WebClient
 
 from approval_system import ApprovalSystem
 from business_intelligence import BusinessIntelligence
+from cache import TTLCache
 from config import Config
 from copper_client import CopperClient
 from csv_handler import CSVHandler
@@ -32,6 +35,19 @@ from metrics import (
     SLACK_EVENTS_TOTAL,
     ERRORS_TOTAL,
 )
+from notifier import ApproverNotifier
+from rate_limiter import bulk
+from slack_common import (
+    GATHERING_ACK,
+    SUPPORTED_FILE_MIMETYPES,
+    SUPPORTED_FILE_RE,
+    configure_logging,
+    create_slack_client,
+    first_delivery,
+    get_bot_mention_re,
+    ruled_out_by_stub,
+    strip_bot_mention,
+)
 
 # Type aliases for common patterns
 JsonDict = Dict[str, Any]
@@ -39,6 +55,7 @@ SlackEvent = Dict[str, Any]
 SlackCommand = Dict[str, Any]
 SlackAction = Dict[str, Any]
 SayFunction = Callable[..., Any]
+RespondFunction = Callable[..., Any]
 AckFunction = Callable[[], None]
 CsvRow = Dict[str, str]
 ReconciliationResult = Dict[str, Any]
@@ -46,22 +63,31 @@ ReconciliationResult = Dict[str, Any]
 # Track startup time for uptime calculation
 _start_time: datetime = datetime.now()
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging(Config.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 # Validate configuration
 try:
     Config.validate()
 except ValueError as e:
-    logger.error(f"Configuration error: {e}")
-    exit(1)
-
-# Initialize Slack app
-app = App(token=Config.SLACK_BOT_TOKEN)
+    logger.error("Configuration error: %s", e)
+    sys.exit(1)
+
+# One Slack client for the app; see create_slack_client
+slack_client = create_slack_client(Config.SLACK_BOT_TOKEN)
+
+# Initialize Slack app. Bolt acks each event before running its listener;
+# listeners run on this pool so slow Copper calls in one handler don't queue
+# up the next event behind them. The bot token is checked in main() rather
+# than with an auth.test call on import.
+app = App(
+    client=slack_client,
+    token_verification_enabled=False,
+    listener_executor=ThreadPoolExecutor(
+        max_workers=Config.SLACK_LISTENER_WORKERS,
+        thread_name_prefix="slack-listener",
+    ),
+)
 
 # Initialize components
 copper_client = CopperClient()
@@ -71,95 +97,640 @@ approval_system = ApprovalSystem()
 business_intel = BusinessIntelligence(copper_client)
 task_processor = TaskProcessor(copper_client)
 
+# Plural form of each Copper entity type; commands accept either form
+ENTITY_PLURALS: Dict[str, str] = {
+    'person': 'people',
+    'company': 'companies',
+    'opportunity': 'opportunities',
+    'lead': 'leads',
+    'task': 'tasks',
+    'project': 'projects',
+}
+
+# Singular entity type for every accepted spelling (singular or plural)
+ENTITY_ALIASES: Dict[str, str] = {
+    **{singular: singular for singular in ENTITY_PLURALS},
+    **{plural: singular for singular, plural in ENTITY_PLURALS.items()},
+}
+SUPPORTED_ENTITY_TYPES: str = ', '.join(ENTITY_PLURALS)
+
+
+def _with_plurals(by_singular: Dict[str, Callable[..., Any]]) -> Dict[str, Callable[..., Any]]:
+    """
+    Key a per-entity dispatch table by both singular and plural entity names.
+
+    Args:
+        by_singular: Mapping of singular entity type to handler
+
+    Returns:
+        Mapping that also contains each plural entity type
+    """
+    table = dict(by_singular)
+    table.update({ENTITY_PLURALS[name]: handler for name, handler in by_singular.items()})
+    return table
+
+
+# Copper operations per entity type, looked up instead of if/elif chains
+SEARCH_DISPATCH: Dict[str, Callable[[JsonDict], List[JsonDict]]] = {
+    'people': copper_client.search_people,
+    'companies': copper_client.search_companies,
+    'opportunities': copper_client.search_opportunities,
+    'leads': copper_client.search_leads,
+    'tasks': copper_client.search_tasks,
+    'projects': copper_client.search_projects,
+}
+CREATE_DISPATCH: Dict[str, Callable[[JsonDict], Optional[JsonDict]]] = _with_plurals({
+    'person': copper_client.create_person,
+    'company': copper_client.create_company,
+    'opportunity': copper_client.create_opportunity,
+    'lead': copper_client.create_lead,
+    'task': copper_client.create_task,
+    'project': copper_client.create_project,
+})
+GET_DISPATCH: Dict[str, Callable[[int], Optional[JsonDict]]] = _with_plurals({
+    'person': copper_client.get_person,
+    'company': copper_client.get_company,
+    'opportunity': copper_client.get_opportunity,
+    'lead': copper_client.get_lead,
+    'task': copper_client.get_task,
+    'project': copper_client.get_project,
+})
+UPDATE_DISPATCH: Dict[str, Callable[[int, JsonDict], Optional[JsonDict]]] = _with_plurals({
+    'person': copper_client.update_person,
+    'company': copper_client.update_company,
+    'opportunity': copper_client.update_opportunity,
+    'lead': copper_client.update_lead,
+    'task': copper_client.update_task,
+    'project': copper_client.update_project,
+})
+DELETE_DISPATCH: Dict[str, Callable[[int], bool]] = _with_plurals({
+    'person': copper_client.delete_person,
+    'company': copper_client.delete_company,
+    'opportunity': copper_client.delete_opportunity,
+    'lead': copper_client.delete_lead,
+    'task': copper_client.delete_task,
+    'project': copper_client.delete_project,
+})
+OPERATION_DISPATCH: Dict[str, Dict[str, Callable[..., Any]]] = {
+    'create': CREATE_DISPATCH,
+    'update': UPDATE_DISPATCH,
+    'delete': DELETE_DISPATCH,
+}
+
+# field=value argument; values may be quoted to include spaces
+FIELD_ARG_RE = re.compile(r"""(\w+)=("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|\S+)""")
+# Backslash escape inside a quoted value, e.g. \" or \\
+QUOTED_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+def _parse_field_args(text: str) -> Dict[str, str]:
+    """
+    Parse ``field=value`` pairs from slash command text in one pass.
+
+    Args:
+        text: Argument text, e.g. ``name="Acme Corp" city=Austin``
+
+    Returns:
+        Mapping of field name to value, with surrounding quotes and
+        backslash escapes inside them removed
+    """
+    fields = {}
+    for key, value in FIELD_ARG_RE.findall(text):
+        if len(value) > 1 and value[0] == value[-1] and value[0] in '"\'':
+            value = QUOTED_ESCAPE_RE.sub(r"\1", value[1:-1])
+        fields[key] = value
+    return fields
+
+
+# Append-only log of auto-approved operations, and their only record. They
+# stay out of approval_system.approval_history, so recording one costs a
+# single line write and never grows the approval state snapshot.
+HISTORY_LOG_PATH: str = os.path.join(Config.DATA_DIR, 'approval_history.jsonl')
+_history_lock = threading.Lock()
+
+
+def _append_history(entry: JsonDict) -> None:
+    """
+    Record an auto-approved operation in the history log.
+
+    Args:
+        entry: History entry to record
+    """
+    line = json.dumps(entry, default=str) + '\n'
+    with _history_lock:
+        os.makedirs(Config.DATA_DIR, exist_ok=True)
+        with open(HISTORY_LOG_PATH, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+
+
+# Set when a handler has changed in-memory approval state since the last
+# snapshot; _flush_state_periodically writes at most one snapshot per interval
+_state_dirty = threading.Event()
+
+
+def _flush_state_periodically(interval: float) -> None:
+    """
+    Snapshot approval state every ``interval`` seconds if it has changed.
+
+    Runs until shutdown begins; the shutdown handler writes the final
+    snapshot.
+
+    Args:
+        interval: Seconds between checks
+    """
+    while not _shutdown_event.wait(interval):
+        if not _state_dirty.is_set():
+            continue
+        _state_dirty.clear()
+        try:
+            approval_system._save_state()
+        except Exception as e:
+            _state_dirty.set()
+            logger.error("Failed to save approval state: %s", e)
+
+
+# A repeat of the same request by the same user within this many seconds
+# (a double-submitted command) points at the first request instead of
+# creating another one and notifying approvers again
+REQUEST_DEDUP_SECONDS: float = 30
+_recent_requests: TTLCache[str] = TTLCache(maxsize=2048)
+
+
+def _request_key(user: str, operation: str, entity_type: str, payload: Any) -> str:
+    """
+    Fingerprint a request for duplicate detection.
+
+    Args:
+        user: Slack user ID of the requester
+        operation: Operation name (create, update, delete)
+        entity_type: Entity type
+        payload: Operation details (data, entity ID or request text)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    raw = json.dumps([user, operation, entity_type, payload], sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+# Placeholder held under a request key while its request is being created
+PENDING_REQUEST_ID: str = ""
+
+
+def _claim_request(request_key: str) -> Optional[str]:
+    """
+    Claim ``request_key`` for a new request, atomically.
+
+    Concurrent listeners handling a double-submit race on the same key; only
+    one of them claims it and the rest are told it's a duplicate. The claimer
+    must call _remember_request once the request exists, or
+    _release_request if creating it fails.
+
+    Returns:
+        None if the key was claimed, else a message for the user
+    """
+    if _recent_requests.add(request_key, PENDING_REQUEST_ID, REQUEST_DEDUP_SECONDS):
+        return None
+    request_id = _recent_requests.get(request_key)
+    if not request_id:
+        return "You already submitted this request. It's being created."
+    return f"You already submitted this request (`{request_id}`). It's waiting for approval."
+
+
+def _remember_request(request_key: str, request_id: str) -> None:
+    """Record the ID of the request created under a claimed key."""
+    _recent_requests.set(request_key, request_id, REQUEST_DEDUP_SECONDS)
+
+
+def _release_request(request_key: str) -> None:
+    """Drop a claim whose request was never created, so a retry isn't refused."""
+    if _recent_requests.get(request_key) == PENDING_REQUEST_ID:
+        _recent_requests.pop(request_key)
+
+
+# Sends approver/reviewer DMs in parallel so N approvers cost ~one Slack
+# round-trip instead of N
+NOTIFY_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="approver-notify")
+
+# Posts "working on it" acks in the background so the Copper query can start
+# without waiting on a Slack round-trip
+_ack_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack-ack")
+
+# Coalesces bursts of approval cards into one DM per approver per window
+APPROVER_NOTIFIER = ApproverNotifier(
+    window=Config.APPROVER_NOTIFY_WINDOW_SECONDS,
+    max_batch=Config.APPROVER_NOTIFY_MAX_BATCH,
+    executor=NOTIFY_POOL
+)
+
+# Slack group DMs hold at most 8 people besides the bot
+MPIM_MAX_MEMBERS: int = 8
+
+# Group DM channel per approver set, opened once via conversations.open.
+# Keyed by the set itself, so adding or removing an approver opens a new one.
+_approver_channels: Dict[frozenset, str] = {}
+_approver_channels_lock = threading.Lock()
+
+# Approver sets whose group DM failed to open recently; they get individual
+# DMs until the entry expires and opening is tried again
+APPROVER_CHANNEL_RETRY_SECONDS: float = 60
+_approver_channel_failures: TTLCache[bool] = TTLCache(maxsize=256)
+
+
+def _approver_channel(client: WebClient, approver_ids: List[str]) -> Optional[str]:
+    """
+    Return a group DM channel containing every approver, opening it on first use.
+
+    Args:
+        client: Slack client
+        approver_ids: Slack user IDs of the approvers
+
+    Returns:
+        Channel ID, or None if a group DM can't be used (a single approver,
+        more than MPIM_MAX_MEMBERS, or Slack refused to open one)
+    """
+    members = frozenset(approver_ids)
+    if not 1 < len(members) <= MPIM_MAX_MEMBERS:
+        return None
+
+    with _approver_channels_lock:
+        if members in _approver_channels:
+            return _approver_channels[members]
+        if _approver_channel_failures.get(members):
+            return None
+
+    # Opened outside the lock so one slow call doesn't hold up requests for
+    # other approver sets; conversations.open returns the same channel for
+    # the same members, so a concurrent first use just keeps the first answer
+    try:
+        response = client.conversations_open(users=",".join(sorted(members)))
+        channel_id = response["channel"]["id"]
+    except Exception as e:
+        logger.warning("Could not open approver group DM, messaging approvers individually: %s", e)
+        _approver_channel_failures.set(members, True, APPROVER_CHANNEL_RETRY_SECONDS)
+        return None
+    with _approver_channels_lock:
+        return _approver_channels.setdefault(members, channel_id)
+
+
+def _notify_approvers(
+    client: WebClient,
+    approver_ids: List[str],
+    text: str,
+    blocks: Optional[List[JsonDict]] = None
+) -> None:
+    """
+    Queue the same message for the approvers.
+
+    With APPROVALS_CHANNEL_ID configured the message is posted once to that
+    channel (mentioning APPROVER_USERGROUP_ID if set). Otherwise several
+    approvers share one group DM, or each approver gets a DM.
+    APPROVER_NOTIFIER batches cards that arrive within its window into one
+    message per channel and sends them on NOTIFY_POOL. This returns without
+    waiting, so callers can reply to the requester straight away.
+    Failures are logged per channel and do not stop the others.
+
+    Args:
+        client: Slack client
+        approver_ids: Slack user IDs to notify
+        text: Message text (and notification fallback when blocks are set)
+        blocks: Optional Block Kit blocks
+    """
+    # A new request changes the pending list shown on the App Home tab
+    _schedule_home_refresh(client)
+
+    if Config.APPROVALS_CHANNEL_ID:
+        if Config.APPROVER_USERGROUP_ID:
+            mention = f"<!subteam^{Config.APPROVER_USERGROUP_ID}> {text}"
+            blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": mention}}] + (blocks or [])
+            text = mention
+        APPROVER_NOTIFIER.enqueue(client, Config.APPROVALS_CHANNEL_ID, text, blocks)
+        return
+
+    group_channel = _approver_channel(client, approver_ids)
+    for channel_id in [group_channel] if group_channel else approver_ids:
+        APPROVER_NOTIFIER.enqueue(client, channel_id, text, blocks)
+
+
+# App Home "Pending Approvals" tab: refreshes triggered within this window
+# are coalesced into one views.publish per approver
+HOME_REFRESH_DELAY_SECONDS: float = 0.5
+HOME_MAX_REQUESTS: int = 20
+_home_refresh_timer: Optional[threading.Timer] = None
+_home_refresh_lock = threading.Lock()
+
+
+def _render_home_view(is_approver: bool) -> JsonDict:
+    """
+    Build the App Home view listing pending approval requests.
+
+    Args:
+        is_approver: Whether the viewing user may see pending requests
+
+    Returns:
+        Home tab view for views.publish
+    """
+    if not is_approver:
+        blocks: List[JsonDict] = [{"type": "section", "text": {
+            "type": "mrkdwn",
+            "text": "Mention me or DM me to query Copper CRM. Pending approvals appear here for approvers."
+        }}]
+        return {"type": "home", "blocks": blocks}
+
+    pending = approval_system.get_pending_requests()
+    blocks = [{"type": "header", "text": {
+        "type": "plain_text", "text": f"Pending Approvals ({len(pending)})"
+    }}]
+    if not pending:
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": "Nothing waiting for approval."}})
+    for req in pending[:HOME_MAX_REQUESTS]:
+        summary = approval_system.format_request_for_approval(req)
+        blocks.append({"type": "divider"})
+        blocks.append({"type": "section", "text": {
+            "type": "mrkdwn", "text": f"{summary[:2900]}\nRequest ID: `{req['request_id']}`"
+        }})
+    if len(pending) > HOME_MAX_REQUESTS:
+        blocks.append({"type": "context", "elements": [{
+            "type": "mrkdwn",
+            "text": f"Showing first {HOME_MAX_REQUESTS} of {len(pending)}. Use `/copper-pending` for more."
+        }]})
+    return {"type": "home", "blocks": blocks}
+
+
+def _publish_home(client: WebClient, user_id: str, view: Optional[JsonDict] = None) -> None:
+    """Publish the App Home tab for one user, rendering it unless ``view`` is given."""
+    if view is None:
+        view = _render_home_view(approval_system.is_approver(user_id))
+    try:
+        client.views_publish(user_id=user_id, view=view)
+    except Exception as e:
+        logger.warning("Failed to publish App Home for %s: %s", user_id, e)
+
+
+def _refresh_home_tabs(client: WebClient) -> None:
+    """Render the pending list once and publish it to every approver's App Home."""
+    global _home_refresh_timer
+    with _home_refresh_lock:
+        _home_refresh_timer = None
+    view = _render_home_view(True)
+    for approver_id in approval_system.get_approvers():
+        NOTIFY_POOL.submit(_publish_home, client, approver_id, view)
+
+
+def _schedule_home_refresh(client: WebClient) -> None:
+    """
+    Refresh approvers' App Home tabs shortly, coalescing bursts of changes.
+
+    Args:
+        client: Slack client
+    """
+    global _home_refresh_timer
+    with _home_refresh_lock:
+        if _home_refresh_timer is not None:
+            return
+        _home_refresh_timer = threading.Timer(HOME_REFRESH_DELAY_SECONDS, _refresh_home_tabs, args=(client,))
+        _home_refresh_timer.daemon = True
+        _home_refresh_timer.start()
+
+
+# A user mention as Slack sends it in command text, e.g. ``<@U123|john>``
+USER_MENTION_RE: Pattern[str] = re.compile(r"<@([A-Z0-9]+)(?:\|[^>]*)?>")
+
+
+def _user_id_from_mention(text: str) -> str:
+    """Return the user ID from a ``<@ID|name>`` mention, or ``text`` as a bare ID."""
+    match = USER_MENTION_RE.match(text)
+    return match.group(1) if match else text.lstrip('@')
+
+
+# Ack posted while a /copper search runs against Copper
+SEARCHING_ACK = "Searching Copper CRM... :mag:"
+
+
+def _answer_query(
+    text: str,
+    user: str,
+    say: SayFunction,
+    client: WebClient,
+    source: str = "mention"
+) -> None:
+    """
+    Answer free text from a mention or DM.
+
+    Task requests go to the task flow, update requests are forwarded to
+    reviewers, and anything else is run as a business intelligence query.
+
+    Args:
+        text: Message text with any bot mention removed
+        user: User ID
+        say: Function to send messages
+        client: Slack client
+        source: Where the text came from ("mention" or "DM")
+    """
+    # Check if this is a task request
+    if task_processor.is_task_request(text):
+        _handle_task_request(text, user, say, client)
+        return
+
+    # Check if this is an update request
+    text_lower = text.lower()
+    if any(word in text_lower for word in ["update", "change", "modify", "set", "edit"]):
+        # This is an update request - notify for approval
+        logger.info("Update request from %s (%s): %s", user, source, text)
+        requested_by = "" if source == "DM" else f" from <@{user}>"
+        say(text=f"🔔 Update request received{requested_by}:\n\n_{text}_\n\n"
+                 f"An admin will review this request shortly.")
+
+        # Notify admins/approvers
+        approvers = approval_system.get_approvers()
+        admins = approval_system.get_admins()
+        all_reviewers = list(set(approvers + admins))
+
+        if all_reviewers:
+            _notify_approvers(
+                client,
+                all_reviewers,
+                text=f"📝 *Update Request*\n\n"
+                     f"From: <@{user}>\n"
+                     f"Request: _{text}_\n\n"
+                     f"Please review and process this update in Copper CRM."
+            )
+        return
+
+    # Process as an intelligent business query
+    logger.info("Processing business intelligence query from %s (%s): %s", user, source, text)
+    _ack_pool.submit(say, text=GATHERING_ACK)
+
+    # Use business intelligence to process the query
+    result = business_intel.process_query(text)
+
+    say(text=result)
+
+
+# Reply to a search query from /copper
+SEARCH_RESULT_TEMPLATE = "*Query*: {query}\n*Found*: {count} {entity_type}\n\n{results}"
+
+
+# Recent /copper search parses. Kept briefly: a parse may resolve relative
+# dates ("this quarter") against the current time.
+SEARCH_PARSE_TTL_SECONDS: float = 60
+_search_parses: TTLCache[Tuple[str, JsonDict]] = TTLCache(maxsize=1024)
+
+
+def _parse_search_query(text: str) -> Tuple[str, JsonDict]:
+    """
+    Parse a search query into its entity type and Copper search criteria.
+
+    Repeated phrasings within SEARCH_PARSE_TTL_SECONDS are served from the
+    cache. Don't mutate the returned criteria.
+
+    Args:
+        text: Search query text
+
+    Returns:
+        (entity type, search criteria)
+    """
+    cached = _search_parses.get(text)
+    if cached is not None:
+        return cached
+    parsed = query_processor.parse_query(text)
+    result = (parsed["entity_type"], parsed["search_criteria"])
+    _search_parses.set(text, result, SEARCH_PARSE_TTL_SECONDS)
+    return result
+
+
+def _run_search_pipeline(text: str, say: SayFunction) -> None:
+    """
+    Parse a search query, run it against Copper and reply with the results.
+
+    Args:
+        text: Search query text
+        say: Function to send messages
+    """
+    _ack_pool.submit(say, text=SEARCHING_ACK)
+
+    # Parse query
+    entity_type, criteria = _parse_search_query(text)
+
+    logger.info("Entity: %s, Criteria: %s", entity_type, criteria)
+
+    # Reject unknown entity types instead of reporting "Found: 0"
+    search = SEARCH_DISPATCH.get(entity_type)
+    if search is None:
+        say(text=f"Unknown entity type '{entity_type}'. "
+                 f"Try one of: {', '.join(SEARCH_DISPATCH)}.")
+        return
+
+    # Query Copper
+    results = search(criteria)
+
+    # Format and send results
+    formatted_results = query_processor.format_results(results, entity_type)
+
+    say(text=SEARCH_RESULT_TEMPLATE.format(
+        query=text, count=len(results), entity_type=entity_type, results=formatted_results
+    ))
+
+
+@app.event("app_home_opened")
+def handle_app_home_opened(event: SlackEvent, client: WebClient) -> None:
+    """
+    Show the pending approvals dashboard when a user opens the Home tab.
+
+    Args:
+        event: Slack event data
+        client: Slack client
+    """
+    if event.get("tab") == "home":
+        _publish_home(client, event.get("user", ""))
+
+
+# Reply to a bare mention; ``{user}`` is the mentioning user's ID
+MENTION_GREETING = (
+    "Hi <@{user}>! I'm your intelligent Copper CRM assistant. "
+    "Ask me anything in natural language!\n\n"
+    "*Business Intelligence:*\n"
+    "• 'What's the status of PubX?'\n"
+    "• 'Show me everything about Acme Corp'\n"
+    "• 'Who are we talking to at Microsoft?'\n"
+    "• 'What deals are in progress?'\n\n"
+    "*Tasks:*\n"
+    "• 'Remind me to follow up with CNN next week'\n\n"
+    "*Updates:*\n"
+    "• 'Update the PubX deal status to closed'\n"
+    "• _(Will notify admins for approval)_"
+)
+
 
 @app.event("app_mention")
-def handle_mention(event: SlackEvent, say: SayFunction, client: WebClient) -> None:
+def handle_mention(
+    event: SlackEvent, body: JsonDict, say: SayFunction, client: WebClient
+) -> None:
     """
     Handle when the bot is mentioned in a channel.
 
     Args:
         event: Slack event data
+        body: Event envelope (for ``event_id``)
         say: Function to send messages
         client: Slack client
     """
+    if not first_delivery(body):
+        return
+
     try:
         user: str = event.get("user", "")
         text: str = event.get("text", "")
 
         # Remove bot mention from text
-        bot_user_id: str = client.auth_test()["user_id"]
-        text = text.replace(f"<@{bot_user_id}>", "").strip()
+        text = strip_bot_mention(text, client)
 
         if not text:
-            say(
-                text=f"Hi <@{user}>! I'm your intelligent Copper CRM assistant. "
-                     "Ask me anything in natural language!\n\n"
-                     "*Business Intelligence:*\n"
-                     "• 'What's the status of PubX?'\n"
-                     "• 'Show me everything about Acme Corp'\n"
-                     "• 'Who are we talking to at Microsoft?'\n"
-                     "• 'What deals are in progress?'\n\n"
-                     "*Tasks:*\n"
-                     "• 'Remind me to follow up with CNN next week'\n\n"
-                     "*Updates:*\n"
-                     "• 'Update the PubX deal status to closed'\n"
-                     "• _(Will notify admins for approval)_"
-            )
+            say(text=MENTION_GREETING.format(user=user))
             return
 
-        # Check if this is a task request
-        if task_processor.is_task_request(text):
-            _handle_task_request(text, user, say, client)
-            return
+        _answer_query(text, user, say, client)
 
-        # Check if this is an update request
-        text_lower = text.lower()
-        if any(word in text_lower for word in ["update", "change", "modify", "set", "edit"]):
-            # This is an update request - notify for approval
-            logger.info(f"Update request from {user}: {text}")
-            say(text=f"🔔 Update request received from <@{user}>:\n\n_{text}_\n\n"
-                     f"An admin will review this request shortly.")
-
-            # Notify admins/approvers
-            approvers = approval_system.get_approvers()
-            admins = approval_system.get_admins()
-            all_reviewers = list(set(approvers + admins))
-
-            if all_reviewers:
-                for reviewer in all_reviewers:
-                    try:
-                        client.chat_postMessage(
-                            channel=reviewer,
-                            text=f"📝 *Update Request*\n\n"
-                                 f"From: <@{user}>\n"
-                                 f"Request: _{text}_\n\n"
-                                 f"Please review and process this update in Copper CRM."
-                        )
-                    except Exception as e:
-                        logger.error(f"Error notifying reviewer {reviewer}: {e}")
-            return
-
-        # Process as an intelligent business query
-        logger.info(f"Processing business intelligence query from {user}: {text}")
-        say(text=f"🔍 Gathering intelligence from Copper CRM...")
+    except Exception as e:
+        logger.error("Error handling mention: %s", e, exc_info=True)
+        say(text=f"Sorry, I encountered an error: {str(e)}")
 
-        # Use business intelligence to process the query
-        result = business_intel.process_query(text)
 
-        say(text=result)
+# Reply to "help" in a DM
+HELP_TEXT = (
+    "*Copper CRM Bot - Intelligent Assistant*\n\n"
+    "*Business Intelligence:*\n"
+    "Ask me anything about your business! I'll gather comprehensive information:\n"
+    "• 'What's the status of PubX?'\n"
+    "• 'Show me everything about Acme Corp'\n"
+    "• 'Who are we talking to at Microsoft?'\n"
+    "• 'What deals are in progress?'\n\n"
+    "*Task Creation:*\n"
+    "• 'Remind me to follow up with CNN next week'\n"
+    "• 'Call John at Acme tomorrow at 2pm'\n\n"
+    "*Update Requests:*\n"
+    "• 'Update the PubX deal to closed won'\n"
+    "• _(Sends notification to admins for approval)_\n\n"
+    "*CSV Upload:*\n"
+    "Upload a CSV file for data enrichment.\n\n"
+    "Need more help? Contact your admin!"
+)
 
-    except Exception as e:
-        logger.error(f"Error handling mention: {str(e)}", exc_info=True)
-        say(text=f"Sorry, I encountered an error: {str(e)}")
+# DM texts that ask for help
+HELP_TOKENS = frozenset({"help", "?", "commands"})
 
 
 @app.event("message")
-def handle_message(event: SlackEvent, say: SayFunction, client: WebClient) -> None:
+def handle_message(
+    event: SlackEvent, body: JsonDict, say: SayFunction, client: WebClient
+) -> None:
     """
     Handle direct messages to the bot.
 
     Args:
         event: Slack event data
+        body: Event envelope (for ``event_id``)
         say: Function to send messages
         client: Slack client
     """
@@ -171,6 +742,9 @@ def handle_message(event: SlackEvent, say: SayFunction, client: WebClient) -> No
     if event.get("subtype") == "bot_message":
         return
 
+    if not first_delivery(body):
+        return
+
     try:
         user: str = event.get("user", "")
         text: str = event.get("text", "").strip()
@@ -179,75 +753,21 @@ def handle_message(event: SlackEvent, say: SayFunction, client: WebClient) -> No
             return
 
         # Check for help commands
-        if text.lower() in ["help", "?", "commands"]:
-            say(
-                text="*Copper CRM Bot - Intelligent Assistant*\n\n"
-                     "*Business Intelligence:*\n"
-                     "Ask me anything about your business! I'll gather comprehensive information:\n"
-                     "• 'What's the status of PubX?'\n"
-                     "• 'Show me everything about Acme Corp'\n"
-                     "• 'Who are we talking to at Microsoft?'\n"
-                     "• 'What deals are in progress?'\n\n"
-                     "*Task Creation:*\n"
-                     "• 'Remind me to follow up with CNN next week'\n"
-                     "• 'Call John at Acme tomorrow at 2pm'\n\n"
-                     "*Update Requests:*\n"
-                     "• 'Update the PubX deal to closed won'\n"
-                     "• _(Sends notification to admins for approval)_\n\n"
-                     "*CSV Upload:*\n"
-                     "Upload a CSV file for data enrichment.\n\n"
-                     "Need more help? Contact your admin!"
-            )
-            return
-
-        # Check if this is a task request
-        if task_processor.is_task_request(text):
-            _handle_task_request(text, user, say, client)
+        if text.lower() in HELP_TOKENS:
+            say(text=HELP_TEXT)
             return
 
-        # Check if this is an update request
-        text_lower = text.lower()
-        if any(word in text_lower for word in ["update", "change", "modify", "set", "edit"]):
-            # This is an update request - notify for approval
-            logger.info(f"Update request from {user} (DM): {text}")
-            say(text=f"🔔 Update request received:\n\n_{text}_\n\n"
-                     f"An admin will review this request shortly.")
-
-            # Notify admins/approvers
-            approvers = approval_system.get_approvers()
-            admins = approval_system.get_admins()
-            all_reviewers = list(set(approvers + admins))
-
-            if all_reviewers:
-                for reviewer in all_reviewers:
-                    try:
-                        client.chat_postMessage(
-                            channel=reviewer,
-                            text=f"📝 *Update Request*\n\n"
-                                 f"From: <@{user}>\n"
-                                 f"Request: _{text}_\n\n"
-                                 f"Please review and process this update in Copper CRM."
-                        )
-                    except Exception as e:
-                        logger.error(f"Error notifying reviewer {reviewer}: {e}")
-            return
-
-        # Process as an intelligent business query
-        logger.info(f"Processing business intelligence query from {user} (DM): {text}")
-        say(text="🔍 Gathering intelligence from Copper CRM...")
-
-        # Use business intelligence to process the query
-        result = business_intel.process_query(text)
-
-        say(text=result)
+        _answer_query(text, user, say, client, source="DM")
 
     except Exception as e:
-        logger.error(f"Error handling message: {str(e)}", exc_info=True)
+        logger.error("Error handling message: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
 @app.event("file_shared")
-def handle_file_upload(event: SlackEvent, say: SayFunction, client: WebClient) -> None:
+def handle_file_upload(
+    event: SlackEvent, body: JsonDict, say: SayFunction, client: WebClient
+) -> None:
     """
     Handle file uploads for CSV/Excel processing.
 
@@ -258,9 +778,13 @@ def handle_file_upload(event: SlackEvent, say: SayFunction, client: WebClient) -
 
     Args:
         event: Slack event data
+        body: Event envelope (for ``event_id``)
         say: Function to send messages
         client: Slack client
     """
+    if not first_delivery(body):
+        return
+
     try:
         file_id: str = event.get("file_id", "")
         user_id: str = event.get("user_id", "")
@@ -270,32 +794,37 @@ def handle_file_upload(event: SlackEvent, say: SayFunction, client: WebClient) -
             say(text="No file ID found in event.")
             return
 
+        # Skip images, PDFs and the like without a files.info round-trip
+        file_stub: JsonDict = event.get("file") or {}
+        if ruled_out_by_stub(file_stub):
+            stub_name = file_stub.get("name") or file_stub.get("filetype")
+            say(
+                text=f"<@{user_id}> Please upload a CSV or Excel file. "
+                     f"Received: {stub_name}"
+            )
+            return
+
         # Get file info
         file_info = client.files_info(file=file_id)
         file_data: JsonDict = file_info["file"]
         filename: str = file_data["name"]
 
-        # Check if it's a supported file type
-        supported_extensions = ('.csv', '.xlsx', '.xls')
-        if not any(filename.lower().endswith(ext) for ext in supported_extensions):
+        # Check if it's a supported file type before downloading anything
+        if not (SUPPORTED_FILE_RE.search(filename) or
+                file_data.get("mimetype") in SUPPORTED_FILE_MIMETYPES):
             say(
                 text=f"<@{user_id}> Please upload a CSV or Excel file. "
                      f"Received: {filename}"
             )
             return
 
-        logger.info(f"Processing file upload from {user_id}: {filename}")
+        logger.info("Processing file upload from %s: %s", user_id, filename)
         say(text="Processing your file... :page_facing_up:")
 
-        # Download file
+        # Download into a spooled temp file and parse (CSV or Excel) from it
         token: str = Config.SLACK_BOT_TOKEN or ""
-        file_content = csv_handler.download_file(
-            file_data["url_private"],
-            token
-        )
-
-        # Parse file (CSV or Excel)
-        rows = csv_handler.parse_file(file_content, filename)
+        with csv_handler.download_file_stream(file_data["url_private"], token) as stream:
+            rows = csv_handler.parse_file_stream(stream, filename)
 
         if not rows:
             say(text="The file appears to be empty.")
@@ -320,18 +849,77 @@ def handle_file_upload(event: SlackEvent, say: SayFunction, client: WebClient) -
             _handle_crm_lookup(rows, filename, channel_id, say, client)
 
     except Exception as e:
-        logger.error(f"Error handling file upload: {str(e)}", exc_info=True)
+        logger.error("Error handling file upload: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error processing your file: {str(e)}")
 
 
+# Lower-cased column names that suggest a file holds contact/person data
+CONTACT_INDICATOR_COLUMNS = frozenset({
+    'email', 'first name', 'last name', 'firstname', 'lastname',
+    'full name', 'name', 'company', 'position', 'title', 'linkedin',
+})
+
+
+def _column_key_map(rows: List[CsvRow]) -> Dict[str, str]:
+    """Map each lower-cased column name of a file to its original spelling."""
+    return {k.lower(): k for k in rows[0].keys()} if rows else {}
+
+
+def _column_value(row: CsvRow, key_map: Dict[str, str], *aliases: str) -> str:
+    """
+    Return the first non-empty value among the given column aliases.
+
+    Args:
+        row: File row
+        key_map: Lower-cased to original column names, from _column_key_map
+        *aliases: Lower-cased column names to try, in order
+
+    Returns:
+        Column value, or an empty string if none are set
+    """
+    for alias in aliases:
+        key = key_map.get(alias)
+        if key is not None and row.get(key):
+            return row[key]
+    return ''
+
+
 def _has_contact_data(rows: List[CsvRow]) -> bool:
     """Check if rows contain contact/person data for reconciliation."""
-    if not rows:
-        return False
-    columns = set(k.lower() for k in rows[0].keys())
-    contact_indicators = {'email', 'first name', 'last name', 'firstname', 'lastname',
-                          'full name', 'name', 'company', 'position', 'title', 'linkedin'}
-    return len(columns.intersection(contact_indicators)) >= 2
+    return len(CONTACT_INDICATOR_COLUMNS.intersection(_column_key_map(rows))) >= 2
+
+
+def _post_report(
+    text: str,
+    attachments: List[Tuple[str, bytes]],
+    channel_id: str,
+    say: SayFunction,
+    client: WebClient
+) -> None:
+    """Post a summary with its detail files in a single upload.
+
+    Falls back to a plain message when there is nothing to attach.
+
+    Args:
+        text: Summary posted as the upload's comment
+        attachments: (filename, content) pairs; empty contents are skipped
+        channel_id: Channel to post to
+        say: Function to send messages
+        client: Slack client
+    """
+    file_uploads = [
+        {'filename': filename, 'content': content, 'title': filename}
+        for filename, content in attachments if content
+    ]
+    if not file_uploads:
+        say(text=text)
+        return
+
+    client.files_upload_v2(
+        channel=channel_id,
+        file_uploads=file_uploads,
+        initial_comment=text
+    )
 
 
 def _handle_crm_lookup(
@@ -370,13 +958,20 @@ def _handle_opportunity_import(
     preview = csv_handler.format_import_preview(import_results)
 
     if is_admin:
-        say(text=f"{preview}\n\nExecuting import (admin bypass)...")
+        say(text="Executing import (admin bypass)...")
         execution = csv_handler.execute_opportunity_import(import_results)
-        say(text=csv_handler.format_import_results(execution))
+
+        # Preview, results and the full failure list go out in one upload
+        _post_report(
+            f"{preview}\n\n{csv_handler.format_import_results(execution)}",
+            [('import_errors.csv', csv_handler.generate_enriched_csv(execution['failed']))],
+            channel_id,
+            say,
+            client
+        )
 
         # Log to history
-        from datetime import datetime
-        approval_system.approval_history.append({
+        _append_history({
             'operation': 'bulk_import',
             'entity_type': 'opportunity',
             'created': len(execution['created']),
@@ -386,7 +981,6 @@ def _handle_opportunity_import(
             'status': 'auto_approved',
             'approved_at': datetime.now().isoformat()
         })
-        approval_system._save_state()
     else:
         request_id = approval_system.create_request(
             requester_id=user_id,
@@ -399,20 +993,24 @@ def _handle_opportunity_import(
             },
             entity_name=f"Opportunity Import ({len(rows)} rows)"
         )
+        _state_dirty.set()
 
         say(text=f"{preview}\n\n*Submitted for approval.*\nRequest ID: `{request_id}`")
 
         request = approval_system.get_request(request_id)
-        for approver_id in approval_system.get_approvers():
-            try:
-                blocks = approval_system.create_approval_blocks(request_id, request)
-                client.chat_postMessage(
-                    channel=approver_id,
-                    text=f"New bulk import request from <@{user_id}>",
-                    blocks=blocks
-                )
-            except Exception as e:
-                logger.error(f"Failed to notify approver: {e}")
+        blocks = approval_system.create_approval_blocks(request_id, request)
+        _notify_approvers(
+            client,
+            approval_system.get_approvers(),
+            text=f"New bulk import request from <@{user_id}>",
+            blocks=blocks
+        )
+
+
+def _search_person_by_name(name: str) -> List[JsonDict]:
+    """Search Copper for people by name, paced as bulk traffic."""
+    with bulk():
+        return copper_client.search_people({'name': name})
 
 
 def _handle_contact_reconciliation(
@@ -426,35 +1024,64 @@ def _handle_contact_reconciliation(
     """Handle contact reconciliation (LinkedIn exports, etc.)."""
     say(text="Cross-referencing contacts with CRM... :mag:")
 
+    # Matches are only counted; mismatches and misses keep just the fields
+    # the summary and approval need, not copies of the row and CRM record
     reconciliation: ReconciliationResult = {
-        'matches': [],
+        'matches': 0,
         'not_found': [],
         'mismatches': [],
         'total': len(rows)
     }
 
-    for row in rows:
-        row_lower = {k.lower(): v for k, v in row.items()}
+    # Columns are the same for every row, so resolve names case-insensitively once
+    key_map = _column_key_map(rows)
 
+    # First pass: pull the person fields out of each row
+    row_meta = []
+    for row in rows:
         # Extract person info
-        email = row_lower.get('email', row_lower.get('e-mail', ''))
-        name = row_lower.get('name', row_lower.get('full name', ''))
+        email = _column_value(row, key_map, 'email', 'e-mail')
+        name = _column_value(row, key_map, 'name', 'full name')
         if not name:
-            first = row_lower.get('first name', row_lower.get('firstname', ''))
-            last = row_lower.get('last name', row_lower.get('lastname', ''))
+            first = _column_value(row, key_map, 'first name', 'firstname')
+            last = _column_value(row, key_map, 'last name', 'lastname')
             name = f"{first} {last}".strip()
 
-        company = row_lower.get('company', row_lower.get('company name', row_lower.get('organization', '')))
+        company = _column_value(row, key_map, 'company', 'company name', 'organization')
 
         if not (email or name):
             continue
 
-        # Search in CRM
-        criteria = {'emails': [email]} if email else {'name': name}
-        crm_results = copper_client.search_people(criteria)
-
-        if crm_results:
-            crm_person = crm_results[0]
+        row_meta.append((email, name, company, row))
+
+    # Look up every email in bulk instead of one search per row. These are
+    # file-sized batches, so they're paced as bulk Copper traffic.
+    by_email: Dict[str, JsonDict] = {}
+    emails = [email for email, _, _, _ in row_meta if email]
+    with bulk():
+        people_by_email = copper_client.search_people_by_emails(emails)
+    for person in people_by_email:
+        for person_email in person.get('emails') or []:
+            address = (person_email.get('email') or '').lower()
+            if address:
+                by_email.setdefault(address, person)
+
+    # Rows without an email need a name search each; run those concurrently
+    names = [name for email, name, _, _ in row_meta if not email]
+    by_name: Dict[str, Optional[JsonDict]] = {}
+    if names:
+        unique_names = list(dict.fromkeys(names))
+        workers = min(Config.CSV_MAX_WORKERS, len(unique_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            name_results = executor.map(_search_person_by_name, unique_names)
+            for person_name, crm_results in zip(unique_names, name_results):
+                by_name[person_name] = crm_results[0] if crm_results else None
+
+    # Second pass: compare each row with its CRM record
+    for email, name, company, row in row_meta:
+        crm_person = by_email.get(email.lower()) if email else by_name.get(name)
+
+        if crm_person:
             crm_company = crm_person.get('company_name', '')
 
             mismatched_fields = []
@@ -469,22 +1096,20 @@ def _handle_contact_reconciliation(
                 reconciliation['mismatches'].append({
                     'name': name or email,
                     'crm_id': crm_person['id'],
-                    'crm_data': crm_person,
-                    'file_data': row,
                     'mismatched_fields': mismatched_fields
                 })
             else:
-                reconciliation['matches'].append({'name': name or email, 'crm_id': crm_person['id']})
+                reconciliation['matches'] += 1
         else:
             reconciliation['not_found'].append({
-                'name': name or email, 'email': email, 'company': company, 'file_data': row
+                'name': name or email, 'email': email, 'company': company
             })
 
     # Format results
     summary = [
         "*Contact Reconciliation Results*\n",
         f"📊 Total contacts: {reconciliation['total']}",
-        f"✅ Matches: {len(reconciliation['matches'])}",
+        f"✅ Matches: {reconciliation['matches']}",
         f"⚠️ Mismatches: {len(reconciliation['mismatches'])}",
         f"❓ Not in CRM: {len(reconciliation['not_found'])}"
     ]
@@ -498,8 +1123,7 @@ def _handle_contact_reconciliation(
                     f"in CRM but \"{field['file_value']}\" in file"
                 )
 
-    say(text='\n'.join(summary))
-
+    request_id = None
     if reconciliation['mismatches']:
         request_id = approval_system.create_request(
             requester_id=user_id,
@@ -508,7 +1132,28 @@ def _handle_contact_reconciliation(
             data={'mismatches': reconciliation['mismatches'], 'not_found': reconciliation['not_found']},
             entity_name=f"Contact Reconciliation ({len(reconciliation['mismatches'])} updates)"
         )
+        _state_dirty.set()
+        if not is_admin:
+            summary.append(f"\nSubmitted for approval. Request ID: `{request_id}`")
+
+    # Summary and full detail files go out in one upload
+    mismatch_rows = [
+        {'name': item['name'], 'crm_id': item['crm_id'], **field}
+        for item in reconciliation['mismatches']
+        for field in item['mismatched_fields']
+    ]
+    _post_report(
+        '\n'.join(summary),
+        [
+            ('mismatches.csv', csv_handler.generate_enriched_csv(mismatch_rows)),
+            ('not_in_crm.csv', csv_handler.generate_enriched_csv(reconciliation['not_found']))
+        ],
+        channel_id,
+        say,
+        client
+    )
 
+    if request_id:
         if is_admin:
             say(
                 text=f"\n*Do you want to update these {len(reconciliation['mismatches'])} contacts?*",
@@ -524,14 +1169,15 @@ def _handle_contact_reconciliation(
                 ]
             )
         else:
-            say(text=f"\nSubmitted for approval. Request ID: `{request_id}`")
-            for approver_id in approval_system.get_approvers():
-                try:
-                    blocks = approval_system.create_approval_blocks(request_id, approval_system.get_request(request_id))
-                    client.chat_postMessage(channel=approver_id,
-                        text=f"Contact reconciliation from <@{user_id}>", blocks=blocks)
-                except Exception as e:
-                    logger.error(f"Failed to notify approver: {e}")
+            blocks = approval_system.create_approval_blocks(
+                request_id, approval_system.get_request(request_id)
+            )
+            _notify_approvers(
+                client,
+                approval_system.get_approvers(),
+                text=f"Contact reconciliation from <@{user_id}>",
+                blocks=blocks
+            )
 
 
 @app.command("/copper")
@@ -557,40 +1203,11 @@ def handle_copper_command(ack: AckFunction, command: SlackCommand, say: SayFunct
             return
 
         # Process the query
-        logger.info(f"Processing /copper command from {user}: {text}")
-        say(text="Searching Copper CRM... :mag:")
-
-        # Parse query
-        parsed = query_processor.parse_query(text)
-        entity_type = parsed["entity_type"]
-        criteria = parsed["search_criteria"]
-
-        logger.info(f"Entity: {entity_type}, Criteria: {criteria}")
-
-        # Query Copper
-        results = []
-        if entity_type == "people":
-            results = copper_client.search_people(criteria)
-        elif entity_type == "companies":
-            results = copper_client.search_companies(criteria)
-        elif entity_type == "opportunities":
-            results = copper_client.search_opportunities(criteria)
-        elif entity_type == "leads":
-            results = copper_client.search_leads(criteria)
-        elif entity_type == "tasks":
-            results = copper_client.search_tasks(criteria)
-        elif entity_type == "projects":
-            results = copper_client.search_projects(criteria)
-
-        # Format and send results
-        formatted_results = query_processor.format_results(results, entity_type)
-
-        response_text = f"*Query*: {text}\n*Found*: {len(results)} {entity_type}\n\n{formatted_results}"
-
-        say(text=response_text)
+        logger.info("Processing /copper command from %s: %s", user, text)
+        _run_search_pipeline(text, say)
 
     except Exception as e:
-        logger.error(f"Error handling /copper command: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
@@ -599,6 +1216,7 @@ def handle_update_command(
     ack: AckFunction,
     command: SlackCommand,
     say: SayFunction,
+    respond: RespondFunction,
     client: WebClient
 ) -> None:
     """
@@ -608,6 +1226,7 @@ def handle_update_command(
         ack: Acknowledge function
         command: Command data
         say: Function to send messages
+        respond: Function to reply only to the invoking user
         client: Slack client
     """
     ack()
@@ -617,62 +1236,64 @@ def handle_update_command(
         user: str = command.get("user_id", "")
 
         if not text:
-            say(
+            respond(
                 text=f"<@{user}> Usage: `/copper-update [entity_type] [entity_id] field=value field2=value2`\n"
                      f"Example: `/copper-update person 12345 email=newemail@example.com phone=555-1234`"
             )
             return
 
         # Parse command: entity_type entity_id field=value field=value
-        parts: List[str] = text.split()
+        parts: List[str] = text.split(maxsplit=2)
         if len(parts) < 3:
-            say(text="Invalid format. Need at least: entity_type entity_id field=value")
+            respond(text="Invalid format. Need at least: entity_type entity_id field=value")
             return
 
-        entity_type = parts[0].lower()
+        entity_type = ENTITY_ALIASES.get(parts[0].lower())
+        if entity_type is None:
+            respond(text=f"Unknown entity type '{parts[0]}'. Supported types: {SUPPORTED_ENTITY_TYPES}")
+            return
         try:
             entity_id = int(parts[1])
         except ValueError:
-            say(text=f"Invalid entity ID: {parts[1]}")
+            respond(text=f"Invalid entity ID: {parts[1]}")
             return
 
         # Parse updates
-        updates = {}
-        for part in parts[2:]:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                updates[key] = value
+        updates = _parse_field_args(parts[2])
 
         if not updates:
-            say(text="No updates specified. Use format: field=value")
+            respond(text="No updates specified. Use format: field=value")
             return
 
         # Get entity details for display
-        entity_data = None
-        if entity_type in ['person', 'people']:
-            entity_data = copper_client.get_person(entity_id)
-            entity_type = 'person'
-        elif entity_type in ['company', 'companies']:
-            entity_data = copper_client.get_company(entity_id)
-            entity_type = 'company'
-        elif entity_type in ['opportunity', 'opportunities']:
-            entity_data = copper_client.get_opportunity(entity_id)
-            entity_type = 'opportunity'
+        entity_data = GET_DISPATCH[entity_type](entity_id)
 
         if not entity_data:
-            say(text=f"Could not find {entity_type} with ID {entity_id}")
+            respond(text=f"Could not find {entity_type} with ID {entity_id}")
             return
 
         entity_name = entity_data.get('name', 'Unknown')
 
+        request_key = _request_key(user, 'update', entity_type, [entity_id, updates])
+        duplicate = _claim_request(request_key)
+        if duplicate:
+            respond(text=duplicate)
+            return
+
         # Create update request
-        request_id = approval_system.create_update_request(
-            requester_id=user,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            updates=updates,
-            entity_name=entity_name
-        )
+        try:
+            request_id = approval_system.create_update_request(
+                requester_id=user,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                updates=updates,
+                entity_name=entity_name
+            )
+            _state_dirty.set()
+        except Exception:
+            _release_request(request_key)
+            raise
+        _remember_request(request_key, request_id)
 
         request = approval_system.get_request(request_id)
 
@@ -683,21 +1304,18 @@ def handle_update_command(
         # Notify approvers
         approvers = approval_system.get_approvers()
         if approvers:
-            for approver_id in approvers:
-                try:
-                    blocks = approval_system.create_approval_blocks(request_id, request)
-                    client.chat_postMessage(
-                        channel=approver_id,
-                        text=f"New update request from <@{user}>",
-                        blocks=blocks
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to notify approver {approver_id}: {e}")
+            blocks = approval_system.create_approval_blocks(request_id, request)
+            _notify_approvers(
+                client,
+                approvers,
+                text=f"New update request from <@{user}>",
+                blocks=blocks
+            )
         else:
             say(text="⚠️ Warning: No approvers configured! Use `/copper-add-approver` to add approvers.")
 
     except Exception as e:
-        logger.error(f"Error handling /copper-update command: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper-update command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
@@ -726,14 +1344,15 @@ def handle_add_approver_command(
             return
 
         # Extract user ID from mention or direct ID
-        approver_id = text.strip('<@>').split('|')[0]
+        approver_id = _user_id_from_mention(text)
 
         approval_system.add_approver(approver_id)
+        _state_dirty.set()
         say(text=f"✅ Added <@{approver_id}> as an approver.\n"
                  f"Current approvers: {len(approval_system.get_approvers())}")
 
     except Exception as e:
-        logger.error(f"Error handling /copper-add-approver command: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper-add-approver command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
@@ -767,18 +1386,23 @@ def handle_add_admin_command(
             return
 
         # Extract user ID from mention or direct ID
-        admin_id = text.strip('<@>').split('|')[0]
+        admin_id = _user_id_from_mention(text)
 
         approval_system.add_admin(admin_id)
+        _state_dirty.set()
         say(text=f"Added <@{admin_id}> as an admin.\n"
                  f"They can now bypass approval for their own actions.\n"
                  f"Current admins: {len(approval_system.get_admins())}")
 
     except Exception as e:
-        logger.error(f"Error handling /copper-add-admin command: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper-add-admin command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
+# Rule between requests in the /copper-pending listing
+PENDING_REQUEST_SEPARATOR = "─" * 40 + "\n\n"
+
+
 @app.command("/copper-pending")
 def handle_pending_command(
     ack: AckFunction,
@@ -808,32 +1432,37 @@ def handle_pending_command(
             say(text="No pending approval requests.")
             return
 
-        message = f"*Pending Approval Requests: {len(pending)}*\n\n"
+        parts: List[str] = [f"*Pending Approval Requests: {len(pending)}*\n\n"]
 
         for req in pending[:10]:  # Show first 10
-            message += approval_system.format_request_for_approval(req)
-            message += f"Request ID: `{req['request_id']}`\n"
-            message += "─" * 40 + "\n\n"
+            parts.append(approval_system.format_request_for_approval(req))
+            parts.append(f"Request ID: `{req['request_id']}`\n")
+            parts.append(PENDING_REQUEST_SEPARATOR)
 
         if len(pending) > 10:
-            message += f"\n_Showing first 10 of {len(pending)} requests_"
+            parts.append(f"\n_Showing first 10 of {len(pending)} requests_")
 
-        say(text=message)
+        say(text="".join(parts))
 
     except Exception as e:
-        logger.error(f"Error handling /copper-pending command: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper-pending command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
-@app.action(re.compile("^approve_"))
-def handle_approve_button(
+# action_id of the Approve/Reject buttons on an approval card, e.g.
+# "approve_<request_id>"; one listener handles both
+APPROVAL_ACTION_RE: Pattern[str] = re.compile(r"^(approve|reject)_")
+
+
+@app.action(APPROVAL_ACTION_RE)
+def handle_approval_button(
     ack: AckFunction,
     action: SlackAction,
     say: SayFunction,
     client: WebClient
 ) -> None:
     """
-    Handle approve button clicks.
+    Handle Approve and Reject button clicks.
 
     Args:
         ack: Acknowledge function
@@ -843,12 +1472,13 @@ def handle_approve_button(
     """
     ack()
 
+    decision = APPROVAL_ACTION_RE.match(action["action_id"]).group(1)
     try:
         request_id: str = action["value"]
         user_id: str = action["user"]["id"]
 
         if not approval_system.is_approver(user_id):
-            say(text="You are not authorized to approve requests.")
+            say(text=f"You are not authorized to {decision} requests.")
             return
 
         request: Optional[JsonDict] = approval_system.get_request(request_id)
@@ -856,128 +1486,131 @@ def handle_approve_button(
             say(text=f"Request {request_id} not found.")
             return
 
-        # Approve the request
-        if not approval_system.approve_request(request_id, user_id):
-            say(text="Failed to approve request.")
-            return
+        if decision == 'approve':
+            _approve_request(request_id, request, user_id, say, client)
+        else:
+            _reject_request(request_id, request, user_id, say, client)
 
-        # Execute the operation in Copper
-        operation: str = request.get('operation', 'update')
-        entity_type: str = request['entity_type']
-        entity_id: Optional[int] = request.get('entity_id')
-        data: JsonDict = request.get('data', request.get('updates', {}) or {})
+    except Exception as e:
+        logger.error("Error handling %s button: %s", decision, e, exc_info=True)
+        say(text=f"Sorry, I encountered an error: {str(e)}")
 
-        result = None
-        success = False
 
-        try:
-            if operation == 'create':
-                # Create new entity
-                if entity_type in ['person', 'people']:
-                    result = copper_client.create_person(data)
-                elif entity_type in ['company', 'companies']:
-                    result = copper_client.create_company(data)
-                elif entity_type in ['opportunity', 'opportunities']:
-                    result = copper_client.create_opportunity(data)
-                elif entity_type in ['lead', 'leads']:
-                    result = copper_client.create_lead(data)
-                elif entity_type in ['task', 'tasks']:
-                    result = copper_client.create_task(data)
-                elif entity_type in ['project', 'projects']:
-                    result = copper_client.create_project(data)
-
-                if result:
-                    success = True
-                    new_id = result.get('id', 'Unknown')
-                    new_name = result.get('name', request['entity_name'])
-                    approval_system.complete_request(request_id)
-                    say(text=f"✅ Approved and created {entity_type} '{new_name}' (ID: {new_id}) in Copper CRM!")
-
-                    # Notify requester
-                    requester_id = request['requester_id']
-                    try:
-                        client.chat_postMessage(
-                            channel=requester_id,
-                            text=f"Your create request for {entity_type} has been approved!\nNew record: {new_name} (ID: {new_id})"
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to notify requester: {e}")
+def _approve_request(
+    request_id: str,
+    request: JsonDict,
+    user_id: str,
+    say: SayFunction,
+    client: WebClient
+) -> None:
+    """
+    Approve a pending request, run its operation in Copper and tell the requester.
 
+    Args:
+        request_id: Approval request ID
+        request: The pending request
+        user_id: Approver's Slack user ID
+        say: Function to send messages
+        client: Slack client
+    """
+    # Approve the request
+    if not approval_system.approve_request(request_id, user_id):
+        say(text="Failed to approve request.")
+        return
+    _state_dirty.set()
+    _schedule_home_refresh(client)
+
+    # Execute the operation in Copper; anything other than create/delete
+    # is an update
+    operation: str = request.get('operation', 'update')
+    if operation not in OPERATION_DISPATCH:
+        operation = 'update'
+    entity_type: str = request['entity_type']
+    entity_id: Optional[int] = request.get('entity_id')
+    entity_name: str = request['entity_name']
+    data: JsonDict = request['data'] if 'data' in request else (request.get('updates') or {})
+
+    if operation != 'create' and entity_id is None:
+        say(text=f"❌ Cannot {operation}: entity ID is missing.")
+        return
+
+    try:
+        method = OPERATION_DISPATCH[operation].get(entity_type)
+        result = None
+        if method is not None:
+            if operation == 'create':
+                result = method(data)
             elif operation == 'delete':
-                # Delete entity (requires valid entity_id)
-                if entity_id is None:
-                    say(text="❌ Cannot delete: entity ID is missing.")
-                    return
-                if entity_type in ['person', 'people']:
-                    success = copper_client.delete_person(entity_id)
-                elif entity_type in ['company', 'companies']:
-                    success = copper_client.delete_company(entity_id)
-                elif entity_type in ['opportunity', 'opportunities']:
-                    success = copper_client.delete_opportunity(entity_id)
-                elif entity_type in ['lead', 'leads']:
-                    success = copper_client.delete_lead(entity_id)
-                elif entity_type in ['task', 'tasks']:
-                    success = copper_client.delete_task(entity_id)
-                elif entity_type in ['project', 'projects']:
-                    success = copper_client.delete_project(entity_id)
-
-                if success:
-                    approval_system.complete_request(request_id)
-                    say(text=f"✅ Approved and deleted {entity_type} '{request['entity_name']}' from Copper CRM!")
-
-                    # Notify requester
-                    requester_id = request['requester_id']
-                    try:
-                        client.chat_postMessage(
-                            channel=requester_id,
-                            text=f"Your delete request for {entity_type} '{request['entity_name']}' has been approved and completed!"
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to notify requester: {e}")
-
-            else:  # update
-                # Update entity (requires valid entity_id)
-                if entity_id is None:
-                    say(text="❌ Cannot update: entity ID is missing.")
-                    return
-                if entity_type in ['person', 'people']:
-                    result = copper_client.update_person(entity_id, data)
-                elif entity_type in ['company', 'companies']:
-                    result = copper_client.update_company(entity_id, data)
-                elif entity_type in ['opportunity', 'opportunities']:
-                    result = copper_client.update_opportunity(entity_id, data)
-                elif entity_type in ['lead', 'leads']:
-                    result = copper_client.update_lead(entity_id, data)
-                elif entity_type in ['task', 'tasks']:
-                    result = copper_client.update_task(entity_id, data)
-                elif entity_type in ['project', 'projects']:
-                    result = copper_client.update_project(entity_id, data)
-
-                if result:
-                    success = True
-                    approval_system.complete_request(request_id)
-                    say(text=f"✅ Approved and updated {entity_type} '{request['entity_name']}' in Copper CRM!")
-
-                    # Notify requester
-                    requester_id = request['requester_id']
-                    try:
-                        client.chat_postMessage(
-                            channel=requester_id,
-                            text=f"Your update request for {entity_type} '{request['entity_name']}' has been approved and completed!"
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to notify requester: {e}")
-
-            if not success and not result:
-                say(text=f"❌ Approved but failed to {operation} in Copper CRM. Please check manually.")
+                result = method(entity_id)
+            else:
+                result = method(entity_id, data)
+
+        if not result:
+            say(text=f"❌ Approved but failed to {operation} in Copper CRM. Please check manually.")
+            return
+
+        approval_system.complete_request(request_id)
+        _state_dirty.set()
+        if operation == 'create':
+            new_id = result.get('id', 'Unknown')
+            entity_name = result.get('name', entity_name)
+            say(text=f"✅ Approved and created {entity_type} '{entity_name}' (ID: {new_id}) in Copper CRM!")
+            requester_text = (f"Your create request for {entity_type} has been approved!\n"
+                              f"New record: {entity_name} (ID: {new_id})")
+        else:
+            if operation == 'delete':
+                say(text=f"✅ Approved and deleted {entity_type} '{entity_name}' from Copper CRM!")
+            else:
+                say(text=f"✅ Approved and updated {entity_type} '{entity_name}' in Copper CRM!")
+            requester_text = (f"Your {operation} request for {entity_type} '{entity_name}' "
+                              f"has been approved and completed!")
 
+        # Notify requester
+        try:
+            client.chat_postMessage(channel=request['requester_id'], text=requester_text)
         except Exception as e:
-            logger.error(f"Error executing {operation}: {e}")
-            say(text=f"❌ Error executing {operation}: {str(e)}")
+            logger.error("Failed to notify requester: %s", e)
 
     except Exception as e:
-        logger.error(f"Error handling approve button: {str(e)}", exc_info=True)
-        say(text=f"Sorry, I encountered an error: {str(e)}")
+        logger.error("Error executing %s: %s", operation, e)
+        say(text=f"❌ Error executing {operation}: {str(e)}")
+
+
+def _reject_request(
+    request_id: str,
+    request: JsonDict,
+    user_id: str,
+    say: SayFunction,
+    client: WebClient
+) -> None:
+    """
+    Reject a pending request and tell the requester.
+
+    Args:
+        request_id: Approval request ID
+        request: The pending request
+        user_id: Approver's Slack user ID
+        say: Function to send messages
+        client: Slack client
+    """
+    # Reject the request
+    if not approval_system.reject_request(request_id, user_id, "Rejected by approver"):
+        say(text="Failed to reject request.")
+        return
+    _state_dirty.set()
+    _schedule_home_refresh(client)
+
+    say(text=f"❌ Rejected update request for {request['entity_type']} '{request['entity_name']}'")
+
+    # Notify requester
+    requester_id = request['requester_id']
+    try:
+        client.chat_postMessage(
+            channel=requester_id,
+            text=f"Your update request for {request['entity_type']} '{request['entity_name']}' has been rejected."
+        )
+    except Exception as e:
+        logger.error("Failed to notify requester: %s", e)
 
 
 @app.command("/copper-create")
@@ -985,6 +1618,7 @@ def handle_create_command(
     ack: AckFunction,
     command: SlackCommand,
     say: SayFunction,
+    respond: RespondFunction,
     client: WebClient
 ) -> None:
     """
@@ -994,6 +1628,7 @@ def handle_create_command(
         ack: Acknowledge function
         command: Command data
         say: Function to send messages
+        respond: Function to reply only to the invoking user
         client: Slack client
     """
     ack()
@@ -1003,7 +1638,7 @@ def handle_create_command(
         user = command.get("user_id")
 
         if not text:
-            say(
+            respond(
                 text=f"<@{user}> Usage: `/copper-create [entity_type] field=value field2=value2`\n"
                      f"Example: `/copper-create person name=\"John Smith\" email=john@example.com`\n"
                      f"Supported types: person, company, opportunity, lead, task, project"
@@ -1011,66 +1646,72 @@ def handle_create_command(
             return
 
         # Parse command: entity_type field=value field=value
-        parts = text.split()
+        parts = text.split(maxsplit=1)
         if len(parts) < 2:
-            say(text="Invalid format. Need at least: entity_type field=value")
+            respond(text="Invalid format. Need at least: entity_type field=value")
             return
 
-        entity_type = parts[0].lower()
+        entity_type = ENTITY_ALIASES.get(parts[0].lower())
+        if entity_type is None:
+            respond(text=f"Unknown entity type '{parts[0]}'. Supported types: {SUPPORTED_ENTITY_TYPES}")
+            return
 
         # Parse data
-        data = {}
-        for part in parts[1:]:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                # Remove quotes if present
-                value = value.strip('"').strip("'")
-                data[key] = value
+        data = _parse_field_args(parts[1])
 
         if not data:
-            say(text="No data specified. Use format: field=value")
+            respond(text="No data specified. Use format: field=value")
             return
 
         # Validate required fields
-        if 'name' not in data and entity_type not in ['person', 'people']:
-            say(text=f"Missing required field: 'name'")
+        if 'name' not in data and entity_type != 'person':
+            respond(text=f"Missing required field: 'name'")
             return
 
         entity_name = data.get('name', 'New Record')
 
+        request_key = _request_key(user, 'create', entity_type, data)
+        duplicate = _claim_request(request_key)
+        if duplicate:
+            respond(text=duplicate)
+            return
+
         # Create request
-        request_id = approval_system.create_request(
-            requester_id=user,
-            operation='create',
-            entity_type=entity_type,
-            data=data,
-            entity_name=entity_name
-        )
+        try:
+            request_id = approval_system.create_request(
+                requester_id=user,
+                operation='create',
+                entity_type=entity_type,
+                data=data,
+                entity_name=entity_name
+            )
+            _state_dirty.set()
+        except Exception:
+            _release_request(request_key)
+            raise
+        _remember_request(request_key, request_id)
 
         request = approval_system.get_request(request_id)
 
+        # Notify approvers; the DMs go out while the requester is answered
+        approvers = approval_system.get_approvers()
+        if approvers:
+            blocks = approval_system.create_approval_blocks(request_id, request)
+            _notify_approvers(
+                client,
+                approvers,
+                text=f"New create request from <@{user}>",
+                blocks=blocks
+            )
+
         # Notify user
         say(text=f"Create request submitted! Request ID: `{request_id}`\n"
                  f"Waiting for approval from authorized users.")
-
-        # Notify approvers
-        approvers = approval_system.get_approvers()
-        if approvers:
-            for approver_id in approvers:
-                try:
-                    blocks = approval_system.create_approval_blocks(request_id, request)
-                    client.chat_postMessage(
-                        channel=approver_id,
-                        text=f"New create request from <@{user}>",
-                        blocks=blocks
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to notify approver {approver_id}: {e}")
-        else:
+        if not approvers:
             say(text="⚠️ Warning: No approvers configured! Use `/copper-add-approver` to add approvers.")
 
     except Exception as e:
-        logger.error(f"Error handling /copper-create command: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper-create command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
@@ -1079,6 +1720,7 @@ def handle_delete_command(
     ack: AckFunction,
     command: SlackCommand,
     say: SayFunction,
+    respond: RespondFunction,
     client: WebClient
 ) -> None:
     """
@@ -1088,6 +1730,7 @@ def handle_delete_command(
         ack: Acknowledge function
         command: Command data
         say: Function to send messages
+        respond: Function to reply only to the invoking user
         client: Slack client
     """
     ack()
@@ -1097,7 +1740,7 @@ def handle_delete_command(
         user = command.get("user_id")
 
         if not text:
-            say(
+            respond(
                 text=f"<@{user}> Usage: `/copper-delete [entity_type] [entity_id]`\n"
                      f"Example: `/copper-delete person 12345`\n"
                      f"Supported types: person, company, opportunity, lead, task, project"
@@ -1107,130 +1750,71 @@ def handle_delete_command(
         # Parse command: entity_type entity_id
         parts = text.split()
         if len(parts) < 2:
-            say(text="Invalid format. Need: entity_type entity_id")
+            respond(text="Invalid format. Need: entity_type entity_id")
             return
 
-        entity_type = parts[0].lower()
+        entity_type = ENTITY_ALIASES.get(parts[0].lower())
+        if entity_type is None:
+            respond(text=f"Unknown entity type '{parts[0]}'. Supported types: {SUPPORTED_ENTITY_TYPES}")
+            return
         try:
             entity_id = int(parts[1])
         except ValueError:
-            say(text=f"Invalid entity ID: {parts[1]}")
+            respond(text=f"Invalid entity ID: {parts[1]}")
             return
 
         # Get entity details for display
-        entity_data = None
-        if entity_type in ['person', 'people']:
-            entity_data = copper_client.get_person(entity_id)
-            entity_type = 'person'
-        elif entity_type in ['company', 'companies']:
-            entity_data = copper_client.get_company(entity_id)
-            entity_type = 'company'
-        elif entity_type in ['opportunity', 'opportunities']:
-            entity_data = copper_client.get_opportunity(entity_id)
-            entity_type = 'opportunity'
-        elif entity_type in ['lead', 'leads']:
-            entity_data = copper_client.get_lead(entity_id)
-            entity_type = 'lead'
-        elif entity_type in ['task', 'tasks']:
-            entity_data = copper_client.get_task(entity_id)
-            entity_type = 'task'
-        elif entity_type in ['project', 'projects']:
-            entity_data = copper_client.get_project(entity_id)
-            entity_type = 'project'
+        entity_data = GET_DISPATCH[entity_type](entity_id)
 
         if not entity_data:
-            say(text=f"Could not find {entity_type} with ID {entity_id}")
+            respond(text=f"Could not find {entity_type} with ID {entity_id}")
             return
 
         entity_name = entity_data.get('name', 'Unknown')
 
+        request_key = _request_key(user, 'delete', entity_type, entity_id)
+        duplicate = _claim_request(request_key)
+        if duplicate:
+            respond(text=duplicate)
+            return
+
         # Create delete request
-        request_id = approval_system.create_request(
-            requester_id=user,
-            operation='delete',
-            entity_type=entity_type,
-            entity_id=entity_id,
-            entity_name=entity_name
-        )
+        try:
+            request_id = approval_system.create_request(
+                requester_id=user,
+                operation='delete',
+                entity_type=entity_type,
+                entity_id=entity_id,
+                entity_name=entity_name
+            )
+            _state_dirty.set()
+        except Exception:
+            _release_request(request_key)
+            raise
+        _remember_request(request_key, request_id)
 
         request = approval_system.get_request(request_id)
 
+        # Notify approvers; the DMs go out while the requester is answered
+        approvers = approval_system.get_approvers()
+        if approvers:
+            blocks = approval_system.create_approval_blocks(request_id, request)
+            _notify_approvers(
+                client,
+                approvers,
+                text=f"⚠️ DELETE request from <@{user}>",
+                blocks=blocks
+            )
+
         # Notify user
         say(text=f"⚠️ Delete request created! Request ID: `{request_id}`\n"
                  f"Entity: {entity_name}\n"
                  f"Waiting for approval from authorized users.")
-
-        # Notify approvers
-        approvers = approval_system.get_approvers()
-        if approvers:
-            for approver_id in approvers:
-                try:
-                    blocks = approval_system.create_approval_blocks(request_id, request)
-                    client.chat_postMessage(
-                        channel=approver_id,
-                        text=f"⚠️ DELETE request from <@{user}>",
-                        blocks=blocks
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to notify approver {approver_id}: {e}")
-        else:
+        if not approvers:
             say(text="⚠️ Warning: No approvers configured! Use `/copper-add-approver` to add approvers.")
 
     except Exception as e:
-        logger.error(f"Error handling /copper-delete command: {str(e)}", exc_info=True)
-        say(text=f"Sorry, I encountered an error: {str(e)}")
-
-
-@app.action(re.compile("^reject_"))
-def handle_reject_button(
-    ack: AckFunction,
-    action: SlackAction,
-    say: SayFunction,
-    client: WebClient
-) -> None:
-    """
-    Handle reject button clicks.
-
-    Args:
-        ack: Acknowledge function
-        action: Action data
-        say: Function to send messages
-        client: Slack client
-    """
-    ack()
-
-    try:
-        request_id = action["value"]
-        user_id = action["user"]["id"]
-
-        if not approval_system.is_approver(user_id):
-            say(text="You are not authorized to reject requests.")
-            return
-
-        request = approval_system.get_request(request_id)
-        if not request:
-            say(text=f"Request {request_id} not found.")
-            return
-
-        # Reject the request
-        if not approval_system.reject_request(request_id, user_id, "Rejected by approver"):
-            say(text="Failed to reject request.")
-            return
-
-        say(text=f"❌ Rejected update request for {request['entity_type']} '{request['entity_name']}'")
-
-        # Notify requester
-        requester_id = request['requester_id']
-        try:
-            client.chat_postMessage(
-                channel=requester_id,
-                text=f"Your update request for {request['entity_type']} '{request['entity_name']}' has been rejected."
-            )
-        except Exception as e:
-            logger.error(f"Failed to notify requester: {e}")
-
-    except Exception as e:
-        logger.error(f"Error handling reject button: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper-delete command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
@@ -1266,7 +1850,7 @@ def _execute_copper_operation(
             )
             if not is_valid:
                 logger.warning(
-                    f"Validation failed for {operation} {entity_type}: {errors}"
+                    "Validation failed for %s %s: %s", operation, entity_type, errors
                 )
                 return {
                     "validation_error": True,
@@ -1278,55 +1862,20 @@ def _execute_copper_operation(
         if operation in ['update', 'delete']:
             validated_id = validate_entity_id(entity_id)
             if validated_id is None:
-                logger.warning(f"Invalid entity_id: {entity_id}")
+                logger.warning("Invalid entity_id: %s", entity_id)
                 return None
             entity_id = validated_id
 
+        method = OPERATION_DISPATCH.get(operation, {}).get(entity_type)
+        if method is None:
+            return None
         if operation == 'create':
-            if entity_type in ['task', 'tasks']:
-                return copper_client.create_task(data)
-            elif entity_type in ['person', 'people']:
-                return copper_client.create_person(data)
-            elif entity_type in ['company', 'companies']:
-                return copper_client.create_company(data)
-            elif entity_type in ['opportunity', 'opportunities']:
-                return copper_client.create_opportunity(data)
-            elif entity_type in ['lead', 'leads']:
-                return copper_client.create_lead(data)
-            elif entity_type in ['project', 'projects']:
-                return copper_client.create_project(data)
-        elif operation == 'update':
-            if entity_id is None:
-                return None
-            if entity_type in ['task', 'tasks']:
-                return copper_client.update_task(entity_id, data)
-            elif entity_type in ['person', 'people']:
-                return copper_client.update_person(entity_id, data)
-            elif entity_type in ['company', 'companies']:
-                return copper_client.update_company(entity_id, data)
-            elif entity_type in ['opportunity', 'opportunities']:
-                return copper_client.update_opportunity(entity_id, data)
-            elif entity_type in ['lead', 'leads']:
-                return copper_client.update_lead(entity_id, data)
-            elif entity_type in ['project', 'projects']:
-                return copper_client.update_project(entity_id, data)
-        elif operation == 'delete':
-            if entity_id is None:
-                return None
-            if entity_type in ['task', 'tasks']:
-                return copper_client.delete_task(entity_id)
-            elif entity_type in ['person', 'people']:
-                return copper_client.delete_person(entity_id)
-            elif entity_type in ['company', 'companies']:
-                return copper_client.delete_company(entity_id)
-            elif entity_type in ['opportunity', 'opportunities']:
-                return copper_client.delete_opportunity(entity_id)
-            elif entity_type in ['lead', 'leads']:
-                return copper_client.delete_lead(entity_id)
-            elif entity_type in ['project', 'projects']:
-                return copper_client.delete_project(entity_id)
+            return method(data)
+        if entity_id is None:
+            return None
+        return method(entity_id, data) if operation == 'update' else method(entity_id)
     except Exception as e:
-        logger.error(f"Error executing {operation} on {entity_type}: {e}")
+        logger.error("Error executing %s on %s: %s", operation, entity_type, e)
         return None
 
     return None
@@ -1347,10 +1896,20 @@ def _handle_task_request(
         say: Function to send messages
         client: Slack client
     """
+    claimed_key: Optional[str] = None
     try:
         # Check if user is admin (can bypass approval)
         is_admin = approval_system.is_admin(user)
 
+        # Skip parsing and Copper lookups for a task that was just submitted
+        request_key = _request_key(user, 'create', 'task', text)
+        if not is_admin:
+            duplicate = _claim_request(request_key)
+            if duplicate:
+                say(text=duplicate)
+                return
+            claimed_key = request_key
+
         if is_admin:
             say(text="Creating task... :pencil:")
         else:
@@ -1358,7 +1917,7 @@ def _handle_task_request(
 
         # Parse the task
         parsed = task_processor.parse_task(text, user)
-        logger.info(f"Parsed task: {parsed}")
+        logger.info("Parsed task: %s", parsed)
 
         # Find related entity in Copper
         related_entity = None
@@ -1398,7 +1957,7 @@ def _handle_task_request(
                          f"Copper Task ID: `{task_id}`")
 
                 # Log to history
-                approval_system.approval_history.append({
+                _append_history({
                     'operation': 'create',
                     'entity_type': 'task',
                     'entity_name': parsed['task_description'],
@@ -1406,10 +1965,9 @@ def _handle_task_request(
                     'requester_id': user,
                     'status': 'auto_approved',
                     'approved_by': user,
-                    'approved_at': __import__('datetime').datetime.now().isoformat(),
+                    'approved_at': datetime.now().isoformat(),
                     'copper_id': task_id
                 })
-                approval_system._save_state()
             else:
                 say(text=f"Failed to create task in Copper. Please try again.")
             return
@@ -1422,29 +1980,30 @@ def _handle_task_request(
             data=task_data,
             entity_name=parsed['task_description']
         )
+        _state_dirty.set()
+        _remember_request(request_key, request_id)
 
-        say(text=f"Task request submitted for approval:\n\n{confirmation}\n\n"
-                 f"Request ID: `{request_id}`")
-
-        # Notify approvers
+        # Notify approvers; the DMs go out while the requester is answered
         request = approval_system.get_request(request_id)
         approvers = approval_system.get_approvers()
         if approvers:
-            for approver_id in approvers:
-                try:
-                    blocks = approval_system.create_approval_blocks(request_id, request)
-                    client.chat_postMessage(
-                        channel=approver_id,
-                        text=f"New task request from <@{user}>",
-                        blocks=blocks
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to notify approver {approver_id}: {e}")
-        else:
+            blocks = approval_system.create_approval_blocks(request_id, request)
+            _notify_approvers(
+                client,
+                approvers,
+                text=f"New task request from <@{user}>",
+                blocks=blocks
+            )
+
+        say(text=f"Task request submitted for approval:\n\n{confirmation}\n\n"
+                 f"Request ID: `{request_id}`")
+        if not approvers:
             say(text="Warning: No approvers configured. Use `/copper-add-approver` to add approvers.")
 
     except Exception as e:
-        logger.error(f"Error handling task request: {str(e)}", exc_info=True)
+        if claimed_key is not None:
+            _release_request(claimed_key)
+        logger.error("Error handling task request: %s", e, exc_info=True)
         say(text=f"Sorry, I couldn't create that task: {str(e)}")
 
 
@@ -1453,6 +2012,7 @@ def handle_task_command(
     ack: AckFunction,
     command: SlackCommand,
     say: SayFunction,
+    respond: RespondFunction,
     client: WebClient
 ) -> None:
     """
@@ -1467,7 +2027,7 @@ def handle_task_command(
         user: str = command.get("user_id", "")
 
         if not text:
-            say(
+            respond(
                 text="*Create a task with natural language!*\n\n"
                      "*Examples:*\n"
                      "• `/copper-task follow up with CNN next Monday`\n"
@@ -1486,7 +2046,7 @@ def handle_task_command(
         _handle_task_request(text, user, say, client)
 
     except Exception as e:
-        logger.error(f"Error handling /copper-task command: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper-task command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
@@ -1494,7 +2054,8 @@ def handle_task_command(
 def handle_map_user_command(
     ack: AckFunction,
     command: SlackCommand,
-    say: SayFunction
+    say: SayFunction,
+    respond: RespondFunction
 ) -> None:
     """
     Handle /copper-map-user command to map Slack users to Copper users.
@@ -1508,7 +2069,7 @@ def handle_map_user_command(
         user = command.get("user_id")
 
         if not text:
-            say(
+            respond(
                 text="*Map a Slack user to their Copper user ID*\n\n"
                      "Usage: `/copper-map-user @user COPPER_USER_ID`\n"
                      "Example: `/copper-map-user @john 12345`\n\n"
@@ -1518,25 +2079,26 @@ def handle_map_user_command(
 
         parts = text.split()
         if len(parts) < 2:
-            say(text="Invalid format. Use: `/copper-map-user @user COPPER_USER_ID`")
+            respond(text="Invalid format. Use: `/copper-map-user @user COPPER_USER_ID`")
             return
 
         # Extract Slack user ID from mention
-        slack_user_id = parts[0].strip('<@>').split('|')[0]
+        slack_user_id = _user_id_from_mention(parts[0])
 
         try:
             copper_user_id = int(parts[1])
         except ValueError:
-            say(text=f"Invalid Copper user ID: {parts[1]}. Must be a number.")
+            respond(text=f"Invalid Copper user ID: {parts[1]}. Must be a number.")
             return
 
         # Save the mapping
         approval_system.set_user_mapping(slack_user_id, copper_user_id)
+        _state_dirty.set()
 
         say(text=f"Mapped <@{slack_user_id}> to Copper user ID `{copper_user_id}`")
 
     except Exception as e:
-        logger.error(f"Error handling /copper-map-user command: {str(e)}", exc_info=True)
+        logger.error("Error handling /copper-map-user command: %s", e, exc_info=True)
         say(text=f"Sorry, I encountered an error: {str(e)}")
 
 
@@ -1632,7 +2194,7 @@ class HealthHandler(BaseHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(metrics_output)
         except Exception as e:
-            logger.error(f"Error generating metrics: {e}")
+            logger.error("Error generating metrics: %s", e)
             self.send_error(500, 'Error generating metrics')
 
     def _handle_root(self) -> None:
@@ -1653,7 +2215,7 @@ def start_health_server(port: int, server_ready: threading.Event) -> None:
     """Start the health check HTTP server in a background thread."""
     global _health_server
     _health_server = HTTPServer(('0.0.0.0', port), HealthHandler)
-    logger.info(f"Health server running on port {port}")
+    logger.info("Health server running on port %s", port)
     server_ready.set()
     _health_server.serve_forever()
 
@@ -1661,7 +2223,7 @@ def start_health_server(port: int, server_ready: threading.Event) -> None:
 def shutdown_handler(signum: int, frame: Optional[FrameType]) -> None:
     """Handle graceful shutdown on SIGTERM/SIGINT."""
     sig_name = signal.Signals(signum).name
-    logger.info(f"Received {sig_name}, initiating graceful shutdown...")
+    logger.info("Received %s, initiating graceful shutdown...", sig_name)
 
     # Prevent multiple shutdown attempts
     if _shutdown_event.is_set():
@@ -1675,6 +2237,9 @@ def shutdown_handler(signum: int, frame: Optional[FrameType]) -> None:
         approval_system._save_state()
         logger.info("Approval state saved successfully")
 
+        # Send approval cards still waiting for their batch window
+        APPROVER_NOTIFIER.flush()
+
         # Stop the Socket Mode handler
         if _socket_handler is not None:
             logger.info("Stopping Slack Socket Mode handler...")
@@ -1691,7 +2256,7 @@ def shutdown_handler(signum: int, frame: Optional[FrameType]) -> None:
         sys.exit(0)
 
     except Exception as e:
-        logger.error(f"Error during shutdown: {e}", exc_info=True)
+        logger.error("Error during shutdown: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -1717,16 +2282,33 @@ def main() -> None:
         )
         health_thread.start()
         server_ready.wait(timeout=5)  # Wait for server to be ready
-        logger.info(f"Health endpoint available at http://localhost:{health_port}/health")
+        logger.info("Health endpoint available at http://localhost:%s/health", health_port)
+
+        # Resolve the bot's user ID now rather than on the first mention.
+        # This is also the bot token check, which importing the module skips.
+        get_bot_mention_re(app.client)
+
+        # Persist approval state changes in batches rather than per operation
+        threading.Thread(
+            target=_flush_state_periodically,
+            args=(Config.APPROVAL_STATE_FLUSH_SECONDS,),
+            name="approval-state-flush",
+            daemon=True
+        ).start()
 
         # Start the app using Socket Mode
-        _socket_handler = SocketModeHandler(app, Config.SLACK_APP_TOKEN)
+        # Several Socket Mode threads so one slow event doesn't delay the next
+        _socket_handler = SocketModeHandler(
+            app,
+            Config.SLACK_APP_TOKEN,
+            concurrency=Config.SLACK_SOCKET_CONCURRENCY
+        )
         logger.info("Bot is running in Socket Mode!")
         logger.info("Press Ctrl+C to stop gracefully")
         _socket_handler.start()
 
     except Exception as e:
-        logger.error(f"Failed to start bot: {str(e)}", exc_info=True)
+        logger.error("Failed to start bot: %s", e, exc_info=True)
         raise
 
 
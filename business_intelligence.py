@@ -2,6 +2,8 @@
 
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
@@ -17,6 +19,16 @@ JsonDict = Dict[str, Any]
 JsonList = List[JsonDict]
 MatchResult = Tuple[JsonDict, float]  # (record, score)
 
+# Entity types whose own records get a small score boost over matches found
+# in other record types
+BOOSTED_ENTITY_TYPES = frozenset({"company", "person", "opportunity"})
+
+# Entity types Copper tasks can be related to
+TASK_RELATED_TYPES = frozenset({"company", "person", "opportunity"})
+
+# Related-record fetches one query runs at once; one per kind of record
+RELATED_FETCH_WORKERS = 5
+
 
 class BusinessIntelligence:
     """Intelligent business query processor for Copper CRM."""
@@ -31,26 +43,98 @@ class BusinessIntelligence:
         self.copper_client = copper_client
         self.claude_proxy_url = Config.CLAUDE_PROXY_URL
         self.fuzzy_matcher = FuzzyMatcher(threshold=fuzzy_threshold)
-        self.use_claude = False
-
-        # Check if Claude proxy is available
-        if Config.CLAUDE_PROXY_URL:
-            try:
-                response = requests.get(f"{self.claude_proxy_url}/health", timeout=10)
-                if response.status_code == 200:
-                    health = response.json()
-                    if health.get("configured"):
-                        self.use_claude = True
-                        auth_method = health.get("auth_method", "unknown")
-                        logger.info(f"Business Intelligence initialized with Claude proxy ({auth_method})")
-                    else:
-                        logger.warning("Claude proxy available but not configured")
-                else:
-                    logger.warning("Claude proxy health check failed - using basic query parsing")
-            except Exception as e:
-                logger.warning(f"Claude proxy not available ({e}) - using basic query parsing")
-        else:
+
+        # Search plan per entity type: (match_type, search method, matcher).
+        # The first entry is the primary record type for that entity.
+        copper, matcher = self.copper_client, self.fuzzy_matcher
+        self._search_plans = {
+            "company": [
+                ("company", copper.search_companies, matcher.match_companies),
+                ("lead", copper.search_leads, matcher.match_companies),
+                ("opportunity", copper.search_opportunities, matcher.match_opportunities),
+            ],
+            "person": [
+                ("person", copper.search_people, matcher.match_contacts),
+                ("lead", copper.search_leads, matcher.match_contacts),
+                ("opportunity", copper.search_opportunities, matcher.match_opportunities),
+            ],
+            "opportunity": [
+                ("opportunity", copper.search_opportunities, matcher.match_opportunities),
+                ("company", copper.search_companies, matcher.match_companies),
+                ("lead", copper.search_leads, matcher.match_companies),
+            ],
+            "task": [
+                ("task", copper.search_tasks, matcher.match_tasks),
+            ],
+        }
+        self._fallback_search_plan = [
+            ("company", copper.search_companies, matcher.match_companies),
+            ("person", copper.search_people, matcher.match_contacts),
+            ("opportunity", copper.search_opportunities, matcher.match_opportunities),
+            ("lead", copper.search_leads, matcher.match_companies),
+        ]
+
+        # Related-record fetchers: (result key, include keywords that ask for
+        # it, fetcher). "all" asks for every kind.
+        self._related_fetchers = [
+            ("related_contacts", frozenset({"contacts", "all"}), self._get_related_contacts),
+            ("related_opportunities", frozenset({"opportunities", "deals", "all"}),
+             self._get_related_opportunities),
+            ("related_leads", frozenset({"leads", "all"}), self._get_related_leads),
+            ("related_tasks", frozenset({"tasks", "all"}), self._get_related_tasks),
+            ("related_companies", frozenset({"companies", "all"}), self._get_related_companies),
+        ]
+
+        # Whether the Claude proxy is usable; probed on first query rather than
+        # here so constructing the bot never waits on the proxy health check
+        self._use_claude: Optional[bool] = None
+        self._claude_probe_lock = threading.Lock()
+
+        # Related records are independent Copper calls, so fetch them at once.
+        # Sized so every concurrent query (one per QUERY_WORKERS thread) gets
+        # its full fan-out instead of queueing behind the others.
+        self._related_pool = ThreadPoolExecutor(
+            max_workers=RELATED_FETCH_WORKERS * Config.QUERY_WORKERS,
+            thread_name_prefix="bi-related"
+        )
+
+    @property
+    def use_claude(self) -> bool:
+        """Whether queries are analyzed via the Claude proxy (probed once, lazily)."""
+        if self._use_claude is None:
+            with self._claude_probe_lock:
+                if self._use_claude is None:
+                    self._use_claude = self._probe_claude_proxy()
+        return self._use_claude
+
+    @use_claude.setter
+    def use_claude(self, value: bool) -> None:
+        self._use_claude = value
+
+    def _probe_claude_proxy(self) -> bool:
+        """Check the Claude proxy health endpoint.
+
+        Returns:
+            True if the proxy is reachable and configured
+        """
+        if not Config.CLAUDE_PROXY_URL:
             logger.warning("No Claude proxy URL - using basic query parsing")
+            return False
+
+        try:
+            response = requests.get(f"{self.claude_proxy_url}/health", timeout=10)
+            if response.status_code == 200:
+                health = response.json()
+                if health.get("configured"):
+                    auth_method = health.get("auth_method", "unknown")
+                    logger.info(f"Business Intelligence initialized with Claude proxy ({auth_method})")
+                    return True
+                logger.warning("Claude proxy available but not configured")
+            else:
+                logger.warning("Claude proxy health check failed - using basic query parsing")
+        except Exception as e:
+            logger.warning(f"Claude proxy not available ({e}) - using basic query parsing")
+        return False
 
     def analyze_query(self, query: str) -> Dict[str, Any]:
         """Analyze a natural language business query.
@@ -239,161 +323,33 @@ Examples:
             all_matches = []
             total_search_count = 0
 
-            if entity_type == "company":
-                # For company names, search across multiple entity types
-                # 1. Search actual companies
-                companies = self.copper_client.search_companies({})
-                if companies:
-                    company_matches = self.fuzzy_matcher.match_companies(entity_name, companies)
-                    all_matches.extend([(match, score, "company") for match, score in company_matches])
-                    total_search_count += len(companies)
-
-                # 2. Search leads (could have company name)
-                leads = self.copper_client.search_leads({})
-                if leads:
-                    lead_matches = self.fuzzy_matcher.match_companies(entity_name, leads)
-                    all_matches.extend([(match, score, "lead") for match, score in lead_matches])
-                    total_search_count += len(leads)
-
-                # 3. Search opportunities (could have company name)
-                opportunities = self.copper_client.search_opportunities({})
-                if opportunities:
-                    opp_matches = self.fuzzy_matcher.match_opportunities(entity_name, opportunities)
-                    all_matches.extend([(match, score, "opportunity") for match, score in opp_matches])
-                    total_search_count += len(opportunities)
-
-                # Sort all matches by score
-                all_matches.sort(key=lambda x: x[1], reverse=True)
-
-                # Convert back to (entity, score) format, prioritizing companies
-                matches = []
-                for match, score, match_type in all_matches:
-                    # Boost company matches slightly
-                    if match_type == "company":
-                        score = min(100, score + 5)
-                    matches.append((match, score))
-
-            elif entity_type == "person":
-                # For person names, search across multiple entity types
-                # 1. Search actual people/contacts
-                people = self.copper_client.search_people({})
-                if people:
-                    person_matches = self.fuzzy_matcher.match_contacts(entity_name, people)
-                    all_matches.extend([(match, score, "person") for match, score in person_matches])
-                    total_search_count += len(people)
-
-                # 2. Search leads (could have contact person)
-                leads = self.copper_client.search_leads({})
-                if leads:
-                    # Match against lead contact names
-                    lead_matches = self.fuzzy_matcher.match_contacts(entity_name, leads)
-                    all_matches.extend([(match, score, "lead") for match, score in lead_matches])
-                    total_search_count += len(leads)
-
-                # 3. Search opportunities (could have associated contact)
-                opportunities = self.copper_client.search_opportunities({})
-                if opportunities:
-                    # Match against opportunity names (might contain person info)
-                    opp_matches = self.fuzzy_matcher.match_opportunities(entity_name, opportunities)
-                    all_matches.extend([(match, score, "opportunity") for match, score in opp_matches])
-                    total_search_count += len(opportunities)
-
-                # Sort all matches by score
-                all_matches.sort(key=lambda x: x[1], reverse=True)
-
-                # Convert back to (entity, score) format, prioritizing people
-                matches = []
-                for match, score, match_type in all_matches:
-                    # Boost person matches slightly
-                    if match_type == "person":
-                        score = min(100, score + 5)
-                    matches.append((match, score))
-
-            elif entity_type == "opportunity":
-                # For opportunities, search across multiple entity types
-                # 1. Search actual opportunities
-                opportunities = self.copper_client.search_opportunities({})
-                if opportunities:
-                    opp_matches = self.fuzzy_matcher.match_opportunities(entity_name, opportunities)
-                    all_matches.extend([(match, score, "opportunity") for match, score in opp_matches])
-                    total_search_count += len(opportunities)
-
-                # 2. Search companies (opportunity might be company-related)
-                companies = self.copper_client.search_companies({})
-                if companies:
-                    company_matches = self.fuzzy_matcher.match_companies(entity_name, companies)
-                    all_matches.extend([(match, score, "company") for match, score in company_matches])
-                    total_search_count += len(companies)
-
-                # 3. Search leads (could be pre-opportunity)
-                leads = self.copper_client.search_leads({})
-                if leads:
-                    lead_matches = self.fuzzy_matcher.match_companies(entity_name, leads)
-                    all_matches.extend([(match, score, "lead") for match, score in lead_matches])
-                    total_search_count += len(leads)
-
-                # Sort all matches by score
-                all_matches.sort(key=lambda x: x[1], reverse=True)
-
-                # Convert back to (entity, score) format, prioritizing opportunities
-                matches = []
-                for match, score, match_type in all_matches:
-                    # Boost opportunity matches slightly
-                    if match_type == "opportunity":
-                        score = min(100, score + 5)
-                    matches.append((match, score))
-
-            elif entity_type == "task":
-                # For tasks, search tasks by name or description
-                tasks = self.copper_client.search_tasks({})
-                if tasks:
-                    task_matches = self.fuzzy_matcher.match_tasks(entity_name, tasks)
-                    all_matches.extend([(match, score, "task") for match, score in task_matches])
-                    total_search_count = len(tasks)
-
-                # Sort all matches by score
-                all_matches.sort(key=lambda x: x[1], reverse=True)
-
-                # Convert back to (entity, score) format
-                matches = [(match, score) for match, score, _ in all_matches]
-
-            else:
-                # Fallback: Search all entity types
+            # Search every source in the plan for this entity type; unknown
+            # types fall back to searching companies, people, deals and leads
+            search_plan = self._search_plans.get(entity_type)
+            if search_plan is None:
                 logger.info(f"Unknown entity type '{entity_type}', searching all types")
-
-                # Search companies
-                companies = self.copper_client.search_companies({})
-                if companies:
-                    company_matches = self.fuzzy_matcher.match_companies(entity_name, companies)
-                    all_matches.extend([(match, score, "company") for match, score in company_matches])
-                    total_search_count += len(companies)
-
-                # Search people
-                people = self.copper_client.search_people({})
-                if people:
-                    person_matches = self.fuzzy_matcher.match_contacts(entity_name, people)
-                    all_matches.extend([(match, score, "person") for match, score in person_matches])
-                    total_search_count += len(people)
-
-                # Search opportunities
-                opportunities = self.copper_client.search_opportunities({})
-                if opportunities:
-                    opp_matches = self.fuzzy_matcher.match_opportunities(entity_name, opportunities)
-                    all_matches.extend([(match, score, "opportunity") for match, score in opp_matches])
-                    total_search_count += len(opportunities)
-
-                # Search leads
-                leads = self.copper_client.search_leads({})
-                if leads:
-                    lead_matches = self.fuzzy_matcher.match_companies(entity_name, leads)
-                    all_matches.extend([(match, score, "lead") for match, score in lead_matches])
-                    total_search_count += len(leads)
-
-                # Sort all matches by score
-                all_matches.sort(key=lambda x: x[1], reverse=True)
-
-                # Convert back to (entity, score) format
-                matches = [(match, score) for match, score, _ in all_matches]
+                search_plan = self._fallback_search_plan
+
+            for match_type, search, fuzzy_match in search_plan:
+                records = search({})
+                if records:
+                    all_matches.extend(
+                        [(record, score, match_type)
+                         for record, score in fuzzy_match(entity_name, records)]
+                    )
+                    total_search_count += len(records)
+
+            # Sort all matches by score
+            all_matches.sort(key=lambda x: x[1], reverse=True)
+
+            # Convert back to (entity, score) format, boosting matches of the
+            # requested type slightly
+            boost_type = entity_type if entity_type in BOOSTED_ENTITY_TYPES else None
+            matches = []
+            for match, score, match_type in all_matches:
+                if match_type == boost_type:
+                    score = min(100, score + 5)
+                matches.append((match, score))
 
             # Store debug info
             intelligence["debug_info"]["search_count"] = total_search_count
@@ -424,35 +380,38 @@ Examples:
 
         # Gather related data
         if intelligence["primary_entity"]:
-            primary_id = intelligence["primary_entity"].get("id")
-            primary_type = entity_type
-
-            if "contacts" in include or "all" in include:
-                intelligence["related_contacts"] = self._get_related_contacts(
-                    primary_id, primary_type
-                )
+            intelligence.update(self.gather_related(
+                intelligence["primary_entity"].get("id"), entity_type, include
+            ))
 
-            if "opportunities" in include or "deals" in include or "all" in include:
-                intelligence["related_opportunities"] = self._get_related_opportunities(
-                    primary_id, primary_type
-                )
+        return intelligence
 
-            if "leads" in include or "all" in include:
-                intelligence["related_leads"] = self._get_related_leads(
-                    primary_id, primary_type
-                )
+    def gather_related(
+        self, entity_id: int, entity_type: str, include: List[str]
+    ) -> Dict[str, JsonList]:
+        """Fetch the related records asked for in ``include`` concurrently.
 
-            if "tasks" in include or "all" in include:
-                intelligence["related_tasks"] = self._get_related_tasks(
-                    primary_id, primary_type
-                )
+        Args:
+            entity_id: ID of the primary entity
+            entity_type: Type of the primary entity
+            include: Kinds of related data requested (e.g. "contacts", "all")
 
-            if "companies" in include or "all" in include:
-                intelligence["related_companies"] = self._get_related_companies(
-                    primary_id, primary_type
-                )
+        Returns:
+            Related records keyed like the intelligence dict
+            (e.g. "related_contacts"), for the requested kinds only
+        """
+        requested = set(include)
+        fetches = [
+            (key, fetch) for key, keywords, fetch in self._related_fetchers
+            if not keywords.isdisjoint(requested)
+        ]
 
-        return intelligence
+        # The fetchers log and swallow their own errors
+        futures = {
+            key: self._related_pool.submit(fetch, entity_id, entity_type)
+            for key, fetch in fetches
+        }
+        return {key: future.result() for key, future in futures.items()}
 
     def _find_company_matches(self, name: str) -> List[MatchResult]:
         """Find company matches by name using fuzzy matching.
@@ -707,16 +666,10 @@ Examples:
         """Get tasks related to an entity."""
         try:
             # Tasks can be related to companies, people, or opportunities
-            search_criteria = {}
-            if entity_type == "company":
-                search_criteria["related_resource"] = {"id": entity_id, "type": "company"}
-            elif entity_type == "person":
-                search_criteria["related_resource"] = {"id": entity_id, "type": "person"}
-            elif entity_type == "opportunity":
-                search_criteria["related_resource"] = {"id": entity_id, "type": "opportunity"}
-
-            if search_criteria:
-                return self.copper_client.search_tasks(search_criteria)
+            if entity_type in TASK_RELATED_TYPES:
+                return self.copper_client.search_tasks(
+                    {"related_resource": {"id": entity_id, "type": entity_type}}
+                )
         except Exception as e:
             logger.error(f"Error getting related tasks: {e}")
         return []
@@ -0,0 +1,87 @@
+"""In-process TTL cache used to front slow Copper API calls."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    Expired entries are kept until evicted so callers can fall back to the
+    last known value (stale-on-error) when the backing service is down.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                used one is evicted
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for ``key`` if present and not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_stale(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for ``key`` even if it has expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: V, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def add(self, key: Hashable, value: V, ttl: float) -> bool:
+        """Store ``value`` only if ``key`` has no fresh entry.
+
+        Returns:
+            True if the value was stored, False if a fresh entry existed
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove ``key`` and return its value, or ``default`` if absent."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return entry[1] if entry is not None else default
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Remove every string key starting with ``prefix``."""
+        with self._lock:
+            for key in [k for k in self._entries if isinstance(k, str) and k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -19,6 +19,13 @@ class Config:
     COPPER_API_KEY = os.getenv("COPPER_API_KEY")
     COPPER_USER_EMAIL = os.getenv("COPPER_USER_EMAIL")
     COPPER_BASE_URL = "https://api.copper.com/developer_api/v1"
+    # Outbound Copper call pacing; Copper allows 180 requests per minute
+    COPPER_REQUESTS_PER_SECOND = float(os.getenv("COPPER_REQUESTS_PER_SECOND", "3"))
+    COPPER_REQUEST_BURST = int(os.getenv("COPPER_REQUEST_BURST", "10"))
+    # Share of that rate for bulk CSV checks, and how long an interactive
+    # call waits for its share before failing
+    COPPER_BULK_RATE_SHARE = float(os.getenv("COPPER_BULK_RATE_SHARE", "0.5"))
+    COPPER_RATE_MAX_WAIT_SECONDS = float(os.getenv("COPPER_RATE_MAX_WAIT_SECONDS", "10"))
 
     # Anthropic Claude Configuration (for NLP)
     ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
@@ -27,9 +34,33 @@ class Config:
 
     # Application Settings
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    DATA_DIR = os.getenv("DATA_DIR", "./data")
+
+    # Slack Event Handling: Socket Mode message threads and listener threads.
+    # A slow Copper query only ties up one listener thread.
+    SLACK_SOCKET_CONCURRENCY = int(os.getenv("SLACK_SOCKET_CONCURRENCY", "10"))
+    SLACK_LISTENER_WORKERS = int(os.getenv("SLACK_LISTENER_WORKERS", "32"))
+    QUERY_WORKERS = int(os.getenv("QUERY_WORKERS", "8"))
+    FILE_WORKERS = int(os.getenv("FILE_WORKERS", "2"))
+    # DMs from one user within this window are answered as one query (0 = off)
+    DM_COALESCE_SECONDS = float(os.getenv("DM_COALESCE_SECONDS", "1.5"))
+
+    # Approver DMs: cards arriving within the window after a send go out as one message
+    APPROVER_NOTIFY_WINDOW_SECONDS = float(os.getenv("APPROVER_NOTIFY_WINDOW_SECONDS", "5"))
+    APPROVER_NOTIFY_MAX_BATCH = int(os.getenv("APPROVER_NOTIFY_MAX_BATCH", "10"))
+
+    # Optional shared channel for approval cards instead of approver DMs,
+    # and a user group to mention there
+    APPROVALS_CHANNEL_ID = os.getenv("APPROVALS_CHANNEL_ID")
+    APPROVER_USERGROUP_ID = os.getenv("APPROVER_USERGROUP_ID")
+
+    # Seconds between approval state snapshots (only written when changed)
+    APPROVAL_STATE_FLUSH_SECONDS = float(os.getenv("APPROVAL_STATE_FLUSH_SECONDS", "1"))
 
     # CSV Processing Settings
     DEFAULT_PIPELINE_NAME = os.getenv("DEFAULT_PIPELINE_NAME", "Bid Intelligence - Supply")
+    CSV_MAX_WORKERS = int(os.getenv("CSV_MAX_WORKERS", "16"))
+    MAX_CSV_BYTES = int(os.getenv("MAX_CSV_BYTES", str(10 * 1024 * 1024)))
 
     @classmethod
     def validate(cls):
@@ -50,4 +81,10 @@ class Config:
                 "Please check your .env file."
             )
 
+        if not 0 < cls.COPPER_BULK_RATE_SHARE < 1:
+            raise ValueError(
+                "COPPER_BULK_RATE_SHARE must be between 0 and 1 (exclusive), "
+                f"got {cls.COPPER_BULK_RATE_SHARE}"
+            )
+
         return True
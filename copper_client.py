@@ -1,9 +1,12 @@
 """Copper CRM API Client."""
 
+import hashlib
+import json
 import logging
 from typing import Any, Dict, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -12,7 +15,9 @@ from tenacity import (
     before_sleep_log,
 )
 
+from cache import TTLCache
 from config import Config
+from rate_limiter import RateLimitTimeout, TokenBucket, is_bulk
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +26,29 @@ JsonDict = Dict[str, Any]
 JsonList = List[JsonDict]
 ApiResponse = Union[JsonDict, JsonList]
 
+# Seconds a search result stays fresh, per Copper resource. Records that
+# change often (deals, leads) get shorter TTLs.
+SEARCH_CACHE_TTLS: Dict[str, float] = {
+    "people": 60,
+    "companies": 60,
+    "opportunities": 15,
+    "leads": 10,
+    "tasks": 30,
+    "projects": 60,
+}
+
+# Maximum number of distinct search results kept in memory
+SEARCH_CACHE_MAXSIZE = 1000
+
+# Seconds a record fetched by ID stays fresh, and how many are kept. Names
+# and IDs shown on approval cards rarely change within minutes.
+RECORD_CACHE_TTL = 300
+RECORD_CACHE_MAXSIZE = 500
+
+# Largest page Copper's search endpoints return; also used as the number of
+# emails sent per bulk people search
+SEARCH_MAX_PAGE_SIZE = 200
+
 
 class RetryableAPIError(Exception):
     """Exception raised for API errors that should trigger a retry."""
@@ -41,6 +69,7 @@ class CopperClient:
 
     base_url: str
     headers: Dict[str, str]
+    session: requests.Session
 
     def __init__(self) -> None:
         """Initialize the Copper API client.
@@ -63,6 +92,35 @@ class CopperClient:
             'X-PW-UserEmail': user_email,
             'Content-Type': 'application/json'
         }
+        self._search_cache: TTLCache[JsonList] = TTLCache(maxsize=SEARCH_CACHE_MAXSIZE)
+        self._record_cache: TTLCache[JsonDict] = TTLCache(maxsize=RECORD_CACHE_MAXSIZE)
+
+        # One keep-alive session shared by every call (and every handler
+        # thread) so requests reuse pooled TLS connections. Retries are left
+        # to tenacity in _make_request_with_retry.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Paces every HTTP call (retries included) across all handler
+        # threads to Copper's account-wide quota, so bursts queue here
+        # instead of coming back as 429s. Cache hits don't take a token.
+        # Bulk calls (rate_limiter.bulk(), e.g. CSV row checks) get their own
+        # share of the quota so a big upload can't hold up interactive
+        # queries, which give up after COPPER_RATE_MAX_WAIT_SECONDS.
+        rate: float = Config.COPPER_REQUESTS_PER_SECOND
+        bulk_share: float = Config.COPPER_BULK_RATE_SHARE
+        self._rate_limiter = TokenBucket(
+            rate=rate * (1 - bulk_share),
+            capacity=Config.COPPER_REQUEST_BURST,
+        )
+        self._bulk_rate_limiter = TokenBucket(rate=rate * bulk_share, capacity=1)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
 
     @retry(
         stop=stop_after_attempt(3),
@@ -96,10 +154,16 @@ class CopperClient:
             RetryableAPIError: For 429 and 5xx errors (triggers retry)
             requests.exceptions.HTTPError: For 4xx client errors (no retry)
         """
-        response: requests.Response = requests.request(
+        if is_bulk():
+            waited = self._bulk_rate_limiter.acquire()
+        else:
+            waited = self._rate_limiter.acquire(max_wait=Config.COPPER_RATE_MAX_WAIT_SECONDS)
+        if waited:
+            logger.debug("Waited %.2fs for a Copper rate limit token", waited)
+
+        response: requests.Response = self.session.request(
             method=method,
             url=url,
-            headers=self.headers,
             json=data,
             timeout=30
         )
@@ -150,11 +214,21 @@ class CopperClient:
 
         Returns:
             API response as dictionary or list, or error dict on failure
+
+        Raises:
+            RateLimitTimeout: If an interactive call couldn't get a rate
+                limit token in time; nothing was sent
         """
         url: str = f"{self.base_url}/{endpoint}"
 
         try:
             response = self._make_request_with_retry(method, url, data)
+            if method != "GET" and not endpoint.endswith("/search"):
+                # A write may change what any cached search returns, and
+                # replaces or removes the record at this endpoint
+                resource = endpoint.split("/", 1)[0]
+                self._search_cache.invalidate_prefix(f"copper:{resource}:")
+                self._record_cache.pop(endpoint)
             return response.json() if response.content else {}
 
         except RetryableAPIError as e:
@@ -196,6 +270,98 @@ class CopperClient:
                 "status_code": 500
             }
 
+    def _cached_search(self, resource: str, criteria: JsonDict) -> JsonList:
+        """
+        Run a ``<resource>/search`` request through the search cache.
+
+        Fresh results are served from the cache. If Copper returns an error,
+        the last cached result for the same criteria is served instead, even
+        if it has expired; errors themselves are never cached.
+
+        Args:
+            resource: Copper resource name (people, companies, etc.)
+            criteria: Search criteria
+
+        Returns:
+            List of matching records
+
+        Raises:
+            RateLimitTimeout: If the request couldn't be sent in time and
+                nothing is cached, so callers don't mistake it for no matches
+        """
+        digest = hashlib.blake2b(
+            json.dumps(criteria, sort_keys=True, default=str).encode(),
+            digest_size=16,
+        ).hexdigest()
+        key = f"copper:{resource}:{digest}"
+
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        try:
+            result: ApiResponse = self._make_request("POST", f"{resource}/search", criteria)
+        except RateLimitTimeout:
+            stale = self._search_cache.get_stale(key)
+            if stale is None:
+                raise
+            logger.warning(f"Serving cached {resource} search while rate limited")
+            return list(stale)
+        if isinstance(result, dict) and "error" in result:
+            stale = self._search_cache.get_stale(key)
+            if stale is not None:
+                logger.warning(f"Serving cached {resource} search after API error")
+                return list(stale)
+            return []
+
+        records = result if isinstance(result, list) else []
+        self._search_cache.set(key, records, SEARCH_CACHE_TTLS[resource])
+        return list(records)
+
+    def _cached_get(self, resource: str, record_id: int) -> Optional[JsonDict]:
+        """
+        Fetch ``<resource>/<record_id>`` through the record cache.
+
+        Cached records are dropped when the same endpoint is updated or
+        deleted. As with searches, an expired record is served if Copper
+        returns an error (other than 404), and errors are never cached.
+
+        Args:
+            resource: Copper resource name (people, companies, etc.)
+            record_id: Record ID
+
+        Returns:
+            Record data or None
+
+        Raises:
+            RateLimitTimeout: If the request couldn't be sent in time and
+                nothing is cached
+        """
+        key = f"{resource}/{record_id}"
+
+        cached = self._record_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        try:
+            result: ApiResponse = self._make_request("GET", key)
+        except RateLimitTimeout:
+            stale = self._record_cache.get_stale(key)
+            if stale is None:
+                raise
+            return dict(stale)
+        if isinstance(result, dict) and "error" in result:
+            if result.get("status_code") == 404:
+                self._record_cache.pop(key)
+                return None
+            stale = self._record_cache.get_stale(key)
+            return dict(stale) if stale is not None else None
+        if not isinstance(result, dict):
+            return None
+
+        self._record_cache.set(key, result, RECORD_CACHE_TTL)
+        return dict(result)
+
     def search_people(self, criteria: JsonDict) -> JsonList:
         """
         Search for people in Copper.
@@ -206,10 +372,40 @@ class CopperClient:
         Returns:
             List of matching people
         """
-        result: ApiResponse = self._make_request("POST", "people/search", criteria)
-        if isinstance(result, dict) and "error" in result:
-            return []
-        return result if isinstance(result, list) else []
+        return self._cached_search("people", criteria)
+
+    def search_people_by_emails(self, emails: List[str]) -> JsonList:
+        """
+        Find people matching any of the given emails in as few requests as possible.
+
+        Emails are de-duplicated (case-insensitively) and sent in chunks
+        using Copper's ``emails`` array filter, paging through each chunk's
+        results.
+
+        Args:
+            emails: Email addresses to look up
+
+        Returns:
+            List of matching people (each person at most once per chunk)
+        """
+        unique_emails: List[str] = list(dict.fromkeys(e.lower() for e in emails if e))
+        people: JsonList = []
+
+        for start in range(0, len(unique_emails), SEARCH_MAX_PAGE_SIZE):
+            chunk = unique_emails[start:start + SEARCH_MAX_PAGE_SIZE]
+            page_number = 1
+            while True:
+                page = self.search_people({
+                    'emails': chunk,
+                    'page_size': SEARCH_MAX_PAGE_SIZE,
+                    'page_number': page_number,
+                })
+                people.extend(page)
+                if len(page) < SEARCH_MAX_PAGE_SIZE:
+                    break
+                page_number += 1
+
+        return people
 
     def search_companies(self, criteria: JsonDict) -> JsonList:
         """
@@ -221,10 +417,7 @@ class CopperClient:
         Returns:
             List of matching companies
         """
-        result: ApiResponse = self._make_request("POST", "companies/search", criteria)
-        if isinstance(result, dict) and "error" in result:
-            return []
-        return result if isinstance(result, list) else []
+        return self._cached_search("companies", criteria)
 
     def search_opportunities(self, criteria: JsonDict) -> JsonList:
         """
@@ -236,10 +429,7 @@ class CopperClient:
         Returns:
             List of matching opportunities
         """
-        result: ApiResponse = self._make_request("POST", "opportunities/search", criteria)
-        if isinstance(result, dict) and "error" in result:
-            return []
-        return result if isinstance(result, list) else []
+        return self._cached_search("opportunities", criteria)
 
     def search_leads(self, criteria: JsonDict) -> JsonList:
         """
@@ -251,10 +441,7 @@ class CopperClient:
         Returns:
             List of matching leads
         """
-        result: ApiResponse = self._make_request("POST", "leads/search", criteria)
-        if isinstance(result, dict) and "error" in result:
-            return []
-        return result if isinstance(result, list) else []
+        return self._cached_search("leads", criteria)
 
     def get_person(self, person_id: int) -> Optional[JsonDict]:
         """
@@ -266,10 +453,7 @@ class CopperClient:
         Returns:
             Person data or None
         """
-        result: ApiResponse = self._make_request("GET", f"people/{person_id}")
-        if isinstance(result, dict) and "error" in result:
-            return None
-        return result if isinstance(result, dict) else None
+        return self._cached_get("people", person_id)
 
     def get_company(self, company_id: int) -> Optional[JsonDict]:
         """
@@ -281,10 +465,7 @@ class CopperClient:
         Returns:
             Company data or None
         """
-        result: ApiResponse = self._make_request("GET", f"companies/{company_id}")
-        if isinstance(result, dict) and "error" in result:
-            return None
-        return result if isinstance(result, dict) else None
+        return self._cached_get("companies", company_id)
 
     def get_opportunity(self, opportunity_id: int) -> Optional[JsonDict]:
         """
@@ -296,10 +477,7 @@ class CopperClient:
         Returns:
             Opportunity data or None
         """
-        result: ApiResponse = self._make_request("GET", f"opportunities/{opportunity_id}")
-        if isinstance(result, dict) and "error" in result:
-            return None
-        return result if isinstance(result, dict) else None
+        return self._cached_get("opportunities", opportunity_id)
 
     def update_person(self, person_id: int, updates: JsonDict) -> Optional[JsonDict]:
         """
@@ -605,10 +783,7 @@ class CopperClient:
         Returns:
             List of matching tasks
         """
-        result: ApiResponse = self._make_request("POST", "tasks/search", criteria)
-        if isinstance(result, dict) and "error" in result:
-            return []
-        return result if isinstance(result, list) else []
+        return self._cached_search("tasks", criteria)
 
     def get_task(self, task_id: int) -> Optional[JsonDict]:
         """
@@ -620,10 +795,7 @@ class CopperClient:
         Returns:
             Task data or None
         """
-        result: ApiResponse = self._make_request("GET", f"tasks/{task_id}")
-        if isinstance(result, dict) and "error" in result:
-            return None
-        return result if isinstance(result, dict) else None
+        return self._cached_get("tasks", task_id)
 
     def update_task(self, task_id: int, updates: JsonDict) -> Optional[JsonDict]:
         """
@@ -652,10 +824,7 @@ class CopperClient:
         Returns:
             List of matching projects
         """
-        result: ApiResponse = self._make_request("POST", "projects/search", criteria)
-        if isinstance(result, dict) and "error" in result:
-            return []
-        return result if isinstance(result, list) else []
+        return self._cached_search("projects", criteria)
 
     def get_project(self, project_id: int) -> Optional[JsonDict]:
         """
@@ -667,10 +836,7 @@ class CopperClient:
         Returns:
             Project data or None
         """
-        result: ApiResponse = self._make_request("GET", f"projects/{project_id}")
-        if isinstance(result, dict) and "error" in result:
-            return None
-        return result if isinstance(result, dict) else None
+        return self._cached_get("projects", project_id)
 
     def update_project(self, project_id: int, updates: JsonDict) -> Optional[JsonDict]:
         """
@@ -815,7 +981,4 @@ class CopperClient:
         Returns:
             Lead data or None
         """
-        result: ApiResponse = self._make_request("GET", f"leads/{lead_id}")
-        if isinstance(result, dict) and "error" in result:
-            return None
-        return result if isinstance(result, dict) else None
+        return self._cached_get("leads", lead_id)
@@ -3,12 +3,21 @@
 import csv
 import io
 import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import (
+    IO, TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import Config
+from rate_limiter import bulk
 
 if TYPE_CHECKING:
     from copper_client import CopperClient
@@ -31,6 +40,29 @@ except ImportError:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Slack file download timeouts: (connect, read) seconds
+DOWNLOAD_TIMEOUT: Tuple[float, float] = (5, 60)
+
+# Downloads up to this size stay in memory; larger ones spill to a temp file
+DOWNLOAD_SPOOL_MAX_BYTES: int = 16 * 1024 * 1024
+
+# Uploads with fewer rows than this are checked sequentially; below it the
+# thread pool costs more than it saves
+CSV_PARALLEL_THRESHOLD: int = 64
+
+# Row fields that drive the contact/company/opportunity lookups; rows that
+# agree on all of them get identical results
+CSV_LOOKUP_FIELDS: Tuple[str, ...] = (
+    'email', 'name', 'contact_name',
+    'company', 'company_name',
+    'opportunity', 'opportunity_name', 'deal',
+)
+
+# Columns added to each row by process_csv_queries
+CRM_STATUS_COLUMNS: Tuple[str, ...] = (
+    'Contact is in CRM', 'Company is in CRM', 'Opportunity exists',
+)
+
 # Standard field mappings for opportunity imports
 OPPORTUNITY_FIELD_MAPPINGS: Dict[str, List[str]] = {
     # Name fields
@@ -50,6 +82,15 @@ OPPORTUNITY_FIELD_MAPPINGS: Dict[str, List[str]] = {
 }
 
 
+def _first_value(row: CsvRow, *keys: str) -> str:
+    """Return the first non-empty value among ``keys`` in ``row``, or ''."""
+    for key in keys:
+        value = row.get(key)
+        if value:
+            return value
+    return ''
+
+
 class CSVHandler:
     """Handle CSV file uploads and process batch queries."""
 
@@ -64,6 +105,29 @@ class CSVHandler:
         """
         self.copper_client = copper_client
 
+        # Search method per entity type (plural and singular forms)
+        self._search_dispatch: Dict[str, Callable[[SearchCriteria], List[JsonDict]]] = {
+            'people': copper_client.search_people,
+            'person': copper_client.search_people,
+            'companies': copper_client.search_companies,
+            'company': copper_client.search_companies,
+            'opportunities': copper_client.search_opportunities,
+            'opportunity': copper_client.search_opportunities,
+            'leads': copper_client.search_leads,
+            'lead': copper_client.search_leads,
+        }
+
+        # Keep-alive session for Slack file downloads, so repeated uploads
+        # reuse the TLS connection to files.slack.com. Transient 5xx from
+        # Slack's file servers are retried here; callers only see failures.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+
     def download_file(self, url: str, token: str) -> bytes:
         """
         Download a file from Slack.
@@ -77,13 +141,83 @@ class CSVHandler:
         """
         try:
             headers: Dict[str, str] = {'Authorization': f'Bearer {token}'}
-            response: requests.Response = requests.get(url, headers=headers, timeout=30)
+            response: requests.Response = self.session.get(
+                url, headers=headers, timeout=DOWNLOAD_TIMEOUT
+            )
             response.raise_for_status()
             return response.content
         except requests.RequestException as e:
             logger.error(f"Failed to download file: {str(e)}")
             raise
 
+    def open_download(self, url: str, token: str) -> IO[bytes]:
+        """
+        Open a streaming download of a file from Slack.
+
+        The body is read from the socket as the caller consumes it, so large
+        files are never held in memory. Close the returned stream when done.
+
+        Args:
+            url: File URL
+            token: Slack bot token
+
+        Returns:
+            Binary file-like object over the response body
+        """
+        try:
+            headers: Dict[str, str] = {'Authorization': f'Bearer {token}'}
+            response: requests.Response = self.session.get(
+                url, headers=headers, timeout=DOWNLOAD_TIMEOUT, stream=True
+            )
+            response.raise_for_status()
+            response.raw.decode_content = True
+            return response.raw
+        except requests.RequestException as e:
+            logger.error(f"Failed to download file: {str(e)}")
+            raise
+
+    def download_file_stream(self, url: str, token: str) -> IO[bytes]:
+        """
+        Download a file from Slack into a seekable spooled temp file.
+
+        Small files stay in memory; large ones spill to disk, so the full
+        content is never held as one bytes object. Close the returned file
+        when done.
+
+        Args:
+            url: File URL
+            token: Slack bot token
+
+        Returns:
+            Seekable binary file positioned at the start
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_MAX_BYTES)
+        try:
+            with self.open_download(url, token) as stream:
+                shutil.copyfileobj(stream, spool)
+        except Exception:
+            spool.close()
+            raise
+        spool.seek(0)
+        return spool
+
+    def iter_csv_rows(self, stream: IO[bytes]) -> Iterator[CsvRow]:
+        """
+        Lazily parse CSV rows from a binary stream.
+
+        Args:
+            stream: Binary file-like object with UTF-8 CSV content
+
+        Yields:
+            Dictionaries representing CSV rows
+        """
+        text_stream = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+        try:
+            yield from csv.DictReader(text_stream)
+        finally:
+            # Don't let the wrapper close the caller's stream
+            text_stream.detach()
+
     def parse_csv(self, content: bytes) -> List[CsvRow]:
         """
         Parse CSV content.
@@ -95,12 +229,7 @@ class CSVHandler:
             List of dictionaries representing CSV rows
         """
         try:
-            # Decode content
-            text: str = content.decode('utf-8')
-
-            # Parse CSV
-            reader: csv.DictReader[str] = csv.DictReader(io.StringIO(text))
-            rows: List[CsvRow] = list(reader)
+            rows: List[CsvRow] = list(self.iter_csv_rows(io.BytesIO(content)))
 
             logger.info(f"Parsed {len(rows)} rows from CSV")
             return rows
@@ -128,31 +257,39 @@ class CSVHandler:
         try:
             # Load workbook from bytes
             workbook = openpyxl.load_workbook(io.BytesIO(content), data_only=True)
-            sheet = workbook.active
-
-            rows: List[CsvRow] = []
-            headers: List[str] = []
-
-            for row_idx, row in enumerate(sheet.iter_rows(values_only=True)):
-                if row_idx == 0:
-                    # First row is headers
-                    headers = [
-                        str(cell).strip() if cell else f'column_{i}'
-                        for i, cell in enumerate(row)
-                    ]
-                else:
-                    # Skip empty rows
-                    if all(cell is None or str(cell).strip() == '' for cell in row):
-                        continue
-
-                    row_dict: CsvRow = {}
-                    for i, cell in enumerate(row):
-                        if i < len(headers):
-                            # Convert cell value to string
-                            value: str = str(cell).strip() if cell is not None else ''
-                            row_dict[headers[i]] = value
-                    rows.append(row_dict)
+            rows = self._rows_from_workbook(workbook)
+            logger.info(f"Parsed {len(rows)} rows from Excel")
+            return rows
+
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"Failed to parse Excel: {str(e)}")
+            raise
+
+    def parse_excel_stream(self, stream: IO[bytes]) -> List[CsvRow]:
+        """
+        Parse Excel (.xlsx) content from a seekable binary file.
+
+        Uses openpyxl's read-only mode, which reads rows lazily instead of
+        loading the whole workbook.
+
+        Args:
+            stream: Seekable binary file with Excel content
 
+        Returns:
+            List of dictionaries representing rows
+        """
+        if not EXCEL_SUPPORT:
+            raise ImportError(
+                "openpyxl is required for Excel support. "
+                "Install with: pip install openpyxl"
+            )
+
+        try:
+            workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+            try:
+                rows = self._rows_from_workbook(workbook)
+            finally:
+                workbook.close()
             logger.info(f"Parsed {len(rows)} rows from Excel")
             return rows
 
@@ -160,6 +297,45 @@ class CSVHandler:
             logger.error(f"Failed to parse Excel: {str(e)}")
             raise
 
+    def _rows_from_workbook(self, workbook: Any) -> List[CsvRow]:
+        """
+        Read the active sheet of a workbook into row dictionaries.
+
+        The first row is used as headers; empty rows are skipped.
+
+        Args:
+            workbook: Loaded openpyxl workbook
+
+        Returns:
+            List of dictionaries representing rows
+        """
+        sheet = workbook.active
+
+        rows: List[CsvRow] = []
+        headers: List[str] = []
+
+        for row_idx, row in enumerate(sheet.iter_rows(values_only=True)):
+            if row_idx == 0:
+                # First row is headers
+                headers = [
+                    str(cell).strip() if cell else f'column_{i}'
+                    for i, cell in enumerate(row)
+                ]
+            else:
+                # Skip empty rows
+                if all(cell is None or str(cell).strip() == '' for cell in row):
+                    continue
+
+                row_dict: CsvRow = {}
+                for i, cell in enumerate(row):
+                    if i < len(headers):
+                        # Convert cell value to string
+                        value: str = str(cell).strip() if cell is not None else ''
+                        row_dict[headers[i]] = value
+                rows.append(row_dict)
+
+        return rows
+
     def parse_file(self, content: bytes, filename: str) -> List[CsvRow]:
         """
         Parse a file based on its extension.
@@ -181,7 +357,74 @@ class CSVHandler:
             # Try CSV as default
             return self.parse_csv(content)
 
-    def process_csv_queries(self, rows: List[CsvRow]) -> ProcessingResults:
+    def parse_file_stream(self, stream: IO[bytes], filename: str) -> List[CsvRow]:
+        """
+        Parse a seekable binary file based on the original filename's extension.
+
+        Args:
+            stream: Seekable binary file, e.g. from download_file_stream
+            filename: Original filename
+
+        Returns:
+            List of dictionaries representing rows
+        """
+        if filename.lower().endswith(('.xlsx', '.xls')):
+            return self.parse_excel_stream(stream)
+
+        # CSV, also the default for unknown extensions
+        try:
+            rows: List[CsvRow] = list(self.iter_csv_rows(stream))
+            logger.info(f"Parsed {len(rows)} rows from CSV")
+            return rows
+
+        except (UnicodeDecodeError, csv.Error) as e:
+            logger.error(f"Failed to parse CSV: {str(e)}")
+            raise
+
+    def process_csv(self, file_path: str, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Check every row of an uploaded CSV/Excel file against Copper.
+
+        CSV files are parsed straight from disk without reading the whole
+        file into memory first.
+
+        Args:
+            file_path: Path of the downloaded upload
+            user_id: Slack user who uploaded the file (for logging)
+
+        Returns:
+            Dict with ``success`` and either ``output_file`` (path of the
+            enriched CSV) and ``summary``, or ``error``
+        """
+        try:
+            if file_path.lower().endswith(('.xlsx', '.xls')):
+                with open(file_path, 'rb') as f:
+                    rows: Iterable[CsvRow] = self.parse_excel_stream(f)
+                results = self.process_csv_queries(rows)
+            else:
+                with open(file_path, 'rb') as f:
+                    results = self.process_csv_queries(self.iter_csv_rows(f))
+
+            logger.info(
+                f"Checked {results['total_queries']} rows from {file_path} "
+                f"for user {user_id}"
+            )
+
+            fd, output_file = tempfile.mkstemp(prefix='enriched_', suffix='.csv')
+            with os.fdopen(fd, 'wb') as out:
+                self.write_enriched_csv(results['enriched_rows'], out)
+
+            return {
+                'success': True,
+                'output_file': output_file,
+                'summary': self.format_csv_results(results),
+            }
+
+        except (OSError, UnicodeDecodeError, csv.Error, ImportError, KeyError, ValueError) as e:
+            logger.error(f"Failed to process file {file_path}: {str(e)}")
+            return {'success': False, 'error': str(e)}
+
+    def process_csv_queries(self, rows: Iterable[CsvRow]) -> ProcessingResults:
         """
         Process CSV rows and check existence in Copper CRM.
 
@@ -191,11 +434,12 @@ class CSVHandler:
         - Opportunity existence
 
         Args:
-            rows: Parsed CSV rows
+            rows: Parsed CSV rows (any iterable, e.g. from iter_csv_rows)
 
         Returns:
             Results dictionary with enriched rows
         """
+        rows = list(rows)
         results: ProcessingResults = {
             'total_queries': len(rows),
             'successful': 0,
@@ -203,37 +447,112 @@ class CSVHandler:
             'enriched_rows': []
         }
 
+        # Only look up each distinct combination of lookup fields once, then
+        # fan the results back out to every row that shares it
+        unique_rows: Dict[Tuple[str, ...], Tuple[int, CsvRow]] = {}
+        row_keys: List[Tuple[str, ...]] = []
         for idx, row in enumerate(rows, 1):
-            try:
-                # Create enriched row with original data
-                enriched_row: EnrichedRow = dict(row)
+            key = tuple(row.get(field) or '' for field in CSV_LOOKUP_FIELDS)
+            row_keys.append(key)
+            unique_rows.setdefault(key, (idx, row))
 
-                # Check for contact/person
-                contact_exists: bool = self._check_contact_exists(row)
-                enriched_row['Contact is in CRM'] = 'Yes' if contact_exists else 'No'
+        if len(unique_rows) < len(rows):
+            logger.info(f"Checking {len(unique_rows)} unique lookups for {len(rows)} CSV rows")
 
-                # Check for company
-                company_exists: bool = self._check_company_exists(row)
-                enriched_row['Company is in CRM'] = 'Yes' if company_exists else 'No'
-
-                # Check for opportunity
-                opportunity_exists: bool = self._check_opportunity_exists(row)
-                enriched_row['Opportunity exists'] = 'Yes' if opportunity_exists else 'No'
-
-                results['enriched_rows'].append(enriched_row)
+        indexed_rows: List[Tuple[int, CsvRow]] = list(unique_rows.values())
+        if len(indexed_rows) < CSV_PARALLEL_THRESHOLD:
+            with bulk():
+                processed = [self._process_row(indexed_row) for indexed_row in indexed_rows]
+        else:
+            # Each row is three independent Copper round-trips, so overlap
+            # them. Lookups are I/O bound, so oversubscribe the CPUs, and give
+            # each worker one contiguous batch so none is left straggling.
+            num_workers: int = min(Config.CSV_MAX_WORKERS, (os.cpu_count() or 1) * 4)
+            batch_size: int = -(-len(indexed_rows) // num_workers)
+            batches = [
+                indexed_rows[i:i + batch_size]
+                for i in range(0, len(indexed_rows), batch_size)
+            ]
+            logger.info(
+                f"Checking {len(indexed_rows)} CSV rows with {num_workers} workers, "
+                f"batch_size={batch_size}"
+            )
+            # executor.map keeps batches, and so rows, in input order
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                processed = [
+                    result
+                    for batch_results in executor.map(self._process_batch, batches)
+                    for result in batch_results
+                ]
+
+        checked = dict(zip(unique_rows, processed))
+        for row, key in zip(rows, row_keys):
+            checked_row, ok = checked[key]
+            enriched_row: EnrichedRow = dict(row)
+            for column in CRM_STATUS_COLUMNS:
+                enriched_row[column] = checked_row[column]
+            results['enriched_rows'].append(enriched_row)
+            if ok:
                 results['successful'] += 1
-
-            except (KeyError, AttributeError) as e:
-                logger.error(f"Failed to process row {idx}: {str(e)}")
+            else:
                 results['failed'] += 1
-                enriched_row = dict(row)
-                enriched_row['Contact is in CRM'] = 'Error'
-                enriched_row['Company is in CRM'] = 'Error'
-                enriched_row['Opportunity exists'] = 'Error'
-                results['enriched_rows'].append(enriched_row)
 
         return results
 
+    def _process_batch(
+        self, batch: List[Tuple[int, CsvRow]]
+    ) -> List[Tuple[EnrichedRow, bool]]:
+        """
+        Check a contiguous batch of CSV rows against Copper CRM.
+
+        Runs on a pool thread, so it marks its own Copper calls as bulk.
+
+        Args:
+            batch: List of (1-based row number, CSV row data)
+
+        Returns:
+            List of (enriched row, whether the checks succeeded)
+        """
+        with bulk():
+            return [self._process_row(indexed_row) for indexed_row in batch]
+
+    def _process_row(self, indexed_row: Tuple[int, CsvRow]) -> Tuple[EnrichedRow, bool]:
+        """
+        Check a single CSV row against Copper CRM.
+
+        Args:
+            indexed_row: (1-based row number, CSV row data)
+
+        Returns:
+            Tuple of (enriched row, whether the checks succeeded)
+        """
+        idx, row = indexed_row
+        try:
+            # Create enriched row with original data
+            enriched_row: EnrichedRow = dict(row)
+
+            # Check for contact/person
+            contact_exists: bool = self._check_contact_exists(row)
+            enriched_row['Contact is in CRM'] = 'Yes' if contact_exists else 'No'
+
+            # Check for company
+            company_exists: bool = self._check_company_exists(row)
+            enriched_row['Company is in CRM'] = 'Yes' if company_exists else 'No'
+
+            # Check for opportunity
+            opportunity_exists: bool = self._check_opportunity_exists(row)
+            enriched_row['Opportunity exists'] = 'Yes' if opportunity_exists else 'No'
+
+            return enriched_row, True
+
+        except (KeyError, AttributeError) as e:
+            logger.error(f"Failed to process row {idx}: {str(e)}")
+            enriched_row = dict(row)
+            enriched_row['Contact is in CRM'] = 'Error'
+            enriched_row['Company is in CRM'] = 'Error'
+            enriched_row['Opportunity exists'] = 'Error'
+            return enriched_row, False
+
     def _check_contact_exists(self, row: CsvRow) -> bool:
         """
         Check if a contact/person exists in Copper.
@@ -246,17 +565,15 @@ class CSVHandler:
         """
         criteria: SearchCriteria = {}
 
-        # Try to find by email (most accurate)
-        if 'email' in row and row['email']:
-            criteria['emails'] = [row['email']]
-        # Try by name as fallback
-        elif 'name' in row and row['name']:
-            criteria['name'] = row['name']
-        # Try by contact_name
-        elif 'contact_name' in row and row['contact_name']:
-            criteria['name'] = row['contact_name']
+        # Try to find by email (most accurate), then by name
+        email = row.get('email')
+        if email:
+            criteria['emails'] = [email]
         else:
-            return False
+            name = _first_value(row, 'name', 'contact_name')
+            if not name:
+                return False
+            criteria['name'] = name
 
         results: List[JsonDict] = self.copper_client.search_people(criteria)
         return len(results) > 0
@@ -271,15 +588,11 @@ class CSVHandler:
         Returns:
             True if company exists, False otherwise
         """
-        criteria: SearchCriteria = {}
-
         # Try to find by company name
-        if 'company' in row and row['company']:
-            criteria['name'] = row['company']
-        elif 'company_name' in row and row['company_name']:
-            criteria['name'] = row['company_name']
-        else:
+        name = _first_value(row, 'company', 'company_name')
+        if not name:
             return False
+        criteria: SearchCriteria = {'name': name}
 
         results: List[JsonDict] = self.copper_client.search_companies(criteria)
         return len(results) > 0
@@ -294,17 +607,11 @@ class CSVHandler:
         Returns:
             True if opportunity exists, False otherwise
         """
-        criteria: SearchCriteria = {}
-
         # Try to find by opportunity name
-        if 'opportunity' in row and row['opportunity']:
-            criteria['name'] = row['opportunity']
-        elif 'opportunity_name' in row and row['opportunity_name']:
-            criteria['name'] = row['opportunity_name']
-        elif 'deal' in row and row['deal']:
-            criteria['name'] = row['deal']
-        else:
+        name = _first_value(row, 'opportunity', 'opportunity_name', 'deal')
+        if not name:
             return False
+        criteria: SearchCriteria = {'name': name}
 
         results: List[JsonDict] = self.copper_client.search_opportunities(criteria)
         return len(results) > 0
@@ -319,20 +626,36 @@ class CSVHandler:
         Returns:
             CSV content as bytes
         """
-        if not enriched_rows:
-            return b""
+        output: io.BytesIO = io.BytesIO()
+        self.write_enriched_csv(enriched_rows, output)
+        return output.getvalue()
 
-        output: io.StringIO = io.StringIO()
+    def write_enriched_csv(self, enriched_rows: List[EnrichedRow], out: IO[bytes]) -> None:
+        """
+        Write enriched rows as UTF-8 CSV straight into a binary file.
 
-        # Get all field names (original + new columns)
-        fieldnames: List[str] = list(enriched_rows[0].keys())
+        Rows are encoded as they are written, so no full copy of the output
+        is built in memory first. Nothing is written if there are no rows.
+
+        Args:
+            enriched_rows: Rows with added CRM existence columns
+            out: Binary file-like object to write to; left open
+        """
+        if not enriched_rows:
+            return
 
-        writer: csv.DictWriter[str] = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(enriched_rows)
+        text_out = io.TextIOWrapper(out, encoding='utf-8', newline='')
+        try:
+            # Get all field names (original + new columns)
+            fieldnames: List[str] = list(enriched_rows[0].keys())
 
-        # Convert to bytes
-        return output.getvalue().encode('utf-8')
+            writer: csv.DictWriter[str] = csv.DictWriter(text_out, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(enriched_rows)
+            text_out.flush()
+        finally:
+            # Don't let the wrapper close the caller's file
+            text_out.detach()
 
     def _build_criteria_from_row(
         self, row: CsvRow, entity_type: str
@@ -398,16 +721,8 @@ class CSVHandler:
         Returns:
             List of results
         """
-        if entity_type == 'people' or entity_type == 'person':
-            return self.copper_client.search_people(criteria)
-        elif entity_type == 'companies' or entity_type == 'company':
-            return self.copper_client.search_companies(criteria)
-        elif entity_type == 'opportunities' or entity_type == 'opportunity':
-            return self.copper_client.search_opportunities(criteria)
-        elif entity_type == 'leads' or entity_type == 'lead':
-            return self.copper_client.search_leads(criteria)
-        else:
-            return []
+        search = self._search_dispatch.get(entity_type)
+        return search(criteria) if search else []
 
     def format_csv_results(self, results: ProcessingResults) -> str:
         """
@@ -0,0 +1,220 @@
+"""Time-windowed batching of approver notifications."""
+
+import logging
+import threading
+import time
+from concurrent.futures import Executor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+
+from slack_sdk import WebClient
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+JsonDict = Dict[str, Any]
+# A queued approval card: (client, text, blocks)
+Card = Tuple[WebClient, str, Optional[List[JsonDict]]]
+
+# Slack rejects messages with more than 50 blocks
+SLACK_MAX_BLOCKS: int = 50
+
+
+class ApproverNotifier:
+    """Coalesce approval cards per approver into one DM per time window.
+
+    A card for an approver with no open window is sent straight away, and
+    sending opens a window. Cards that arrive while it is open wait until it
+    closes, or until ``max_batch`` are waiting, and go out as a single
+    message. A quiet period therefore costs one prompt DM per request, while
+    a burst costs one DM per approver per window.
+    """
+
+    def __init__(
+        self,
+        window: float = 5.0,
+        max_batch: int = 10,
+        executor: Optional[Executor] = None,
+        autostart: bool = True
+    ) -> None:
+        """Initialize the notifier.
+
+        Args:
+            window: Seconds after a send during which new cards are held
+            max_batch: Cards per approver that trigger an immediate flush
+            executor: Pool used to send the DMs; sent inline if omitted
+            autostart: Start the background worker on the first enqueue.
+                Without it, cards are only sent by ``start()`` or ``flush()``.
+        """
+        self.window = window
+        self.max_batch = max_batch
+        self._executor = executor
+        self._autostart = autostart
+        self._queues: Dict[str, List[Card]] = {}
+        self._deadlines: Dict[str, float] = {}
+        # When each approver's current window closes (monotonic time)
+        self._window_ends: Dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_stop = threading.Event()
+
+    def enqueue(
+        self,
+        client: WebClient,
+        approver_id: str,
+        text: str,
+        blocks: Optional[List[JsonDict]] = None
+    ) -> None:
+        """Queue a card for ``approver_id``.
+
+        It is sent at once if no window is open for the approver, otherwise
+        when the open window closes.
+
+        Args:
+            client: Slack client used to send the DM
+            approver_id: Slack user ID to notify
+            text: Message text (and notification fallback when blocks are set)
+            blocks: Optional Block Kit blocks
+        """
+        with self._cond:
+            queue = self._queues.setdefault(approver_id, [])
+            queue.append((client, text, blocks))
+            if len(queue) == 1:
+                # A window that already closed leaves a past deadline: due now
+                self._deadlines[approver_id] = self._window_ends.get(approver_id, 0.0)
+            if len(queue) >= self.max_batch:
+                self._deadlines[approver_id] = 0.0
+            if self._autostart:
+                self._start_worker()
+            self._cond.notify()
+
+    def start(self) -> None:
+        """Start the background worker that sends cards as windows close."""
+        with self._cond:
+            self._start_worker()
+
+    def stop(self) -> None:
+        """Stop the background worker; cards still queued wait for ``flush()``."""
+        with self._cond:
+            worker, self._worker = self._worker, None
+            self._worker_stop.set()
+            self._cond.notify_all()
+        if worker is not None:
+            worker.join()
+
+    def _start_worker(self) -> None:
+        """Start the worker thread if it isn't running (lock held)."""
+        if self._worker is None:
+            self._worker_stop = threading.Event()
+            self._worker = threading.Thread(
+                target=self._run, args=(self._worker_stop,), name="approver-notifier", daemon=True
+            )
+            self._worker.start()
+
+    def flush(self) -> None:
+        """Send every pending card now and wait for them, e.g. before shutdown.
+
+        With an executor the approvers are sent to in parallel, so the wait
+        is about one Slack round-trip rather than one per approver.
+        """
+        with self._cond:
+            due = list(self._queues)
+            batches = self._take(due)
+        if self._executor is None:
+            for approver_id, items in batches:
+                self._send(approver_id, items)
+            return
+        futures = [self._executor.submit(self._send, approver_id, items) for approver_id, items in batches]
+        for future in as_completed(futures):
+            future.result()
+
+    def _run(self, stop: threading.Event) -> None:
+        """Worker loop: wait for the earliest window to close, then send."""
+        while True:
+            with self._cond:
+                while True:
+                    if stop.is_set():
+                        return
+                    now = time.monotonic()
+                    due = [a for a, deadline in self._deadlines.items() if deadline <= now]
+                    if due:
+                        break
+                    timeout = min(self._deadlines.values()) - now if self._deadlines else None
+                    self._cond.wait(timeout)
+                batches = self._take(due)
+
+            for approver_id, items in batches:
+                if self._executor is not None:
+                    self._executor.submit(self._send, approver_id, items)
+                else:
+                    self._send(approver_id, items)
+
+    def _take(self, approver_ids: List[str]) -> List[Tuple[str, List[Card]]]:
+        """Remove and return the queued cards for ``approver_ids`` (lock held).
+
+        Each approver sent to gets a fresh window.
+        """
+        batches = []
+        window_end = time.monotonic() + self.window
+        for approver_id in approver_ids:
+            self._deadlines.pop(approver_id, None)
+            items = self._queues.pop(approver_id, None)
+            if items:
+                self._window_ends[approver_id] = window_end
+                batches.append((approver_id, items))
+        return batches
+
+    def _send(self, approver_id: str, items: List[Card]) -> None:
+        """Post ``items`` to one approver, combining them into as few DMs as fit."""
+        for chunk in self._chunks(items):
+            client = chunk[-1][0]
+            try:
+                if len(chunk) == 1:
+                    _, text, blocks = chunk[0]
+                    client.chat_postMessage(channel=approver_id, text=text, blocks=blocks)
+                else:
+                    client.chat_postMessage(
+                        channel=approver_id,
+                        text=f"{len(chunk)} pending approvals",
+                        blocks=self._combine(chunk)
+                    )
+            except Exception as e:
+                logger.error("Failed to notify approver %s: %s", approver_id, e)
+
+    def _chunks(self, items: List[Card]) -> List[List[Card]]:
+        """Split cards into groups of at most max_batch that fit Slack's block limit."""
+        chunks: List[List[Card]] = []
+        current: List[Card] = []
+        size = 1  # summary header
+        for item in items:
+            # Divider plus the card's blocks, or a text section if it has none
+            item_size = 1 + (len(item[2]) if item[2] else 1)
+            if current and (len(current) >= self.max_batch or size + item_size > SLACK_MAX_BLOCKS):
+                chunks.append(current)
+                current, size = [], 1
+            current.append(item)
+            size += item_size
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _combine(chunk: List[Card]) -> List[JsonDict]:
+        """Build one message's blocks from several approval cards.
+
+        Cards are usually built from the same template, so each card's
+        ``block_id`` gets the card's index appended; Slack rejects a message
+        that repeats one.
+        """
+        blocks: List[JsonDict] = [{
+            "type": "header",
+            "text": {"type": "plain_text", "text": f"{len(chunk)} pending approvals"}
+        }]
+        for i, (_, text, card_blocks) in enumerate(chunk):
+            blocks.append({"type": "divider"})
+            if card_blocks:
+                blocks.extend(
+                    {**block, "block_id": f"{block['block_id']}-{i}"} if "block_id" in block else block
+                    for block in card_blocks
+                )
+            else:
+                blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": text}})
+        return blocks
@@ -0,0 +1,83 @@
+"""Token bucket used to pace outbound Copper API calls."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_local = threading.local()
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a token isn't available within the caller's max wait."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks callers until a token is free.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    short bursts go straight through while sustained load is smoothed to
+    ``rate`` calls per second across every thread sharing the bucket.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize the bucket, starting full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Most tokens the bucket holds (the burst size)
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """Take one token, sleeping until one is available.
+
+        Args:
+            max_wait: Longest the caller will wait; None waits as long as needed
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitTimeout: If the token would take longer than ``max_wait``;
+                no token is taken
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if max_wait is not None and wait > max_wait:
+                raise RateLimitTimeout(f"No token free within {max_wait:.1f}s (needs {wait:.1f}s)")
+            # Reserve the token now; a negative balance queues later callers
+            # behind this one instead of letting them race for the refill
+            self._tokens -= 1
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+@contextmanager
+def bulk() -> Iterator[None]:
+    """Mark calls made by this thread inside the block as bulk traffic.
+
+    Clients pace bulk calls (e.g. CSV row checks) on their own bucket so a
+    large job can't queue interactive calls behind it.
+    """
+    previous = getattr(_local, "bulk", False)
+    _local.bulk = True
+    try:
+        yield
+    finally:
+        _local.bulk = previous
+
+
+def is_bulk() -> bool:
+    """Return True if the current thread is inside a ``bulk()`` block."""
+    return getattr(_local, "bulk", False)
@@ -0,0 +1,170 @@
+"""Slack helpers shared by app.py and app_old.py."""
+
+import atexit
+import logging
+import queue
+import re
+import ssl
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, FrozenSet, Optional, Pattern, TextIO
+
+from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+
+from cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Most log records held for the listener; records past this are dropped
+LOG_QUEUE_MAXSIZE = 10000
+
+# Ack posted while a query runs against Copper
+GATHERING_ACK = "🔍 Gathering intelligence from Copper CRM..."
+
+# File uploads the bot will process, matched by extension or Slack mimetype.
+# Files are parsed by extension, so a mimetype alone only admits CSV, the
+# default parser.
+SUPPORTED_FILE_RE: Pattern[str] = re.compile(r"\.(csv|xlsx|xls)$", re.IGNORECASE)
+SUPPORTED_FILE_MIMETYPES: FrozenSet[str] = frozenset({"text/csv"})
+SUPPORTED_FILETYPES: FrozenSet[str] = frozenset({"csv", "xlsx", "xls"})
+
+# Recently handled event IDs. Slack redelivers events it thinks weren't
+# acknowledged in time, so each one is only answered once.
+SEEN_EVENT_TTL_SECONDS = 3600
+_seen_events: TTLCache[bool] = TTLCache(maxsize=4096)
+
+# Pattern matching the bot's mention (``<@BOT_ID>``), built once from
+# auth.test and reused
+_bot_mention_re: Optional[Pattern[str]] = None
+_bot_mention_lock = threading.Lock()
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records when the queue is full instead of blocking."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put ``record`` on the queue, discarding it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def configure_logging(level: str, stream: Optional[TextIO] = None) -> QueueListener:
+    """Route the root logger through a bounded queue to a background listener.
+
+    The calling thread still merges each record's args and formats any
+    traceback (``QueueHandler.prepare``); the listener thread adds the prefix
+    and does the write, so a slow stream never blocks a Slack listener. If
+    the listener falls ``LOG_QUEUE_MAXSIZE`` records behind, new records are
+    dropped rather than held in memory. The listener is stopped at exit.
+
+    Args:
+        level: Logging level name, e.g. ``"INFO"``
+        stream: Stream to write to; stderr when None
+
+    Returns:
+        The started listener
+    """
+    stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    listener = QueueListener(log_queue, stream_handler)
+    logging.basicConfig(
+        level=getattr(logging, level),
+        format='%(message)s',  # merges args here; the listener adds the prefix
+        handlers=[_DroppingQueueHandler(log_queue)]
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def create_slack_client(token: str) -> WebClient:
+    """Build the app's Slack client.
+
+    slack_sdk opens a urllib connection per call and, without an explicit SSL
+    context, builds a fresh one (re-reading the CA bundle) every time; sharing
+    a context keeps that to once per process. Calls that hit a 429 are retried
+    after the Retry-After delay (plus jitter) instead of being dropped. Bolt
+    copies both onto the client it hands each listener.
+
+    Args:
+        token: Slack bot token
+
+    Returns:
+        Configured WebClient
+    """
+    client = WebClient(
+        token=token,
+        timeout=30,
+        ssl=ssl.create_default_context(),
+    )
+    client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=3))
+    return client
+
+
+def get_bot_mention_re(client: WebClient) -> Pattern[str]:
+    """Return the bot's mention pattern, calling auth.test only on first use.
+
+    Args:
+        client: Slack client
+
+    Returns:
+        Compiled pattern matching ``<@BOT_USER_ID>`` (with optional ``|name``)
+    """
+    global _bot_mention_re
+
+    if _bot_mention_re is None:
+        with _bot_mention_lock:
+            if _bot_mention_re is None:
+                bot_user_id = client.auth_test()['user_id']
+                _bot_mention_re = re.compile(rf"<@{re.escape(bot_user_id)}(?:\|[^>]*)?>")
+    return _bot_mention_re
+
+
+def strip_bot_mention(text: str, client: WebClient) -> str:
+    """Remove every bot mention from ``text`` and strip surrounding whitespace.
+
+    Mentions almost always lead the message, so a leading one is sliced off
+    after an anchored match before the rest is searched for more.
+
+    Args:
+        text: Message text
+        client: Slack client
+
+    Returns:
+        The text without any mention
+    """
+    pattern = get_bot_mention_re(client)
+    match = pattern.match(text)
+    if match:
+        text = text[match.end():]
+    return pattern.sub("", text).strip()
+
+
+def first_delivery(body: Dict[str, Any]) -> bool:
+    """Record the envelope's ``event_id``; False if it was already handled."""
+    event_id = body.get("event_id")
+    if event_id is None or _seen_events.add(event_id, True, ttl=SEEN_EVENT_TTL_SECONDS):
+        return True
+    logger.info("Ignoring redelivered event %s", event_id)
+    return False
+
+
+def ruled_out_by_stub(file_stub: Dict[str, Any]) -> bool:
+    """Return True if the event's file stub already shows an unsupported file.
+
+    Minimal ``file_shared`` payloads carry only the file ID; those return
+    False and are checked after ``files.info`` instead.
+    """
+    name = file_stub.get("name")
+    filetype = file_stub.get("filetype")
+    if not name and not filetype:
+        return False
+    return not (filetype in SUPPORTED_FILETYPES or
+                SUPPORTED_FILE_RE.search(name or "") or
+                file_stub.get("mimetype") in SUPPORTED_FILE_MIMETYPES)
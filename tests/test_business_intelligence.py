@@ -0,0 +1,57 @@
+"""Tests for business intelligence gathering."""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+from business_intelligence import BusinessIntelligence
+
+
+@pytest.fixture
+def mock_copper_client():
+    """Create a mock Copper client."""
+    client = Mock()
+    client.search_people.return_value = [{"id": 10, "name": "Jane Roe"}]
+    client.search_opportunities.return_value = [{"id": 20, "name": "Big Deal"}]
+    client.search_leads.return_value = []
+    client.search_tasks.return_value = [{"id": 30, "name": "Follow up"}]
+    return client
+
+
+@pytest.fixture
+def business_intel(mock_copper_client):
+    """Create a BusinessIntelligence instance for testing."""
+    return BusinessIntelligence(mock_copper_client)
+
+
+class TestGatherRelated:
+    """Test fetching related records."""
+
+    def test_only_requested_kinds_fetched(self, business_intel, mock_copper_client):
+        """Test that only the requested related records are fetched."""
+        related = business_intel.gather_related(1, "company", ["contacts", "deals"])
+
+        assert related == {
+            "related_contacts": [{"id": 10, "name": "Jane Roe"}],
+            "related_opportunities": [{"id": 20, "name": "Big Deal"}],
+        }
+        mock_copper_client.search_tasks.assert_not_called()
+
+    def test_all_fetched_concurrently(self, business_intel, mock_copper_client):
+        """Test that the related searches overlap instead of running in turn."""
+        barrier = threading.Barrier(4, timeout=2)
+
+        def search(criteria):
+            barrier.wait()
+            return []
+
+        for method in ("search_people", "search_opportunities", "search_leads", "search_tasks"):
+            getattr(mock_copper_client, method).side_effect = search
+
+        related = business_intel.gather_related(1, "company", ["all"])
+
+        assert set(related) == {
+            "related_contacts", "related_opportunities", "related_leads",
+            "related_tasks", "related_companies",
+        }
+        assert not barrier.broken
@@ -0,0 +1,59 @@
+"""Tests for the TTL cache."""
+
+from unittest.mock import patch
+
+from cache import TTLCache
+
+
+class TestTTLCache:
+    """Test expiry, eviction and invalidation."""
+
+    def test_get_returns_fresh_value(self):
+        """Test that a value is returned before its TTL elapses."""
+        cache = TTLCache()
+        cache.set("key", [1], ttl=60)
+
+        assert cache.get("key") == [1]
+
+    def test_expired_value_only_available_as_stale(self):
+        """Test that expired values are hidden from get but not get_stale."""
+        cache = TTLCache()
+        with patch('cache.time.monotonic', return_value=100.0):
+            cache.set("key", [1], ttl=10)
+        with patch('cache.time.monotonic', return_value=111.0):
+            assert cache.get("key") is None
+            assert cache.get_stale("key") == [1]
+
+    def test_add_only_stores_absent_or_expired_keys(self):
+        """Test that add refuses to overwrite a fresh entry."""
+        cache = TTLCache()
+        with patch('cache.time.monotonic', return_value=100.0):
+            assert cache.add("key", 1, ttl=10) is True
+            assert cache.add("key", 2, ttl=10) is False
+        with patch('cache.time.monotonic', return_value=111.0):
+            assert cache.add("key", 3, ttl=10) is True
+            assert cache.get("key") == 3
+
+    def test_least_recently_used_entry_evicted(self):
+        """Test that the LRU entry is dropped once maxsize is exceeded."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate_prefix(self):
+        """Test that only keys with the given prefix are removed."""
+        cache = TTLCache()
+        cache.set("copper:people:1", 1, ttl=60)
+        cache.set("copper:leads:1", 2, ttl=60)
+
+        cache.invalidate_prefix("copper:people:")
+
+        assert cache.get("copper:people:1") is None
+        assert cache.get("copper:leads:1") == 2
+        assert len(cache) == 1
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from copper_client import CopperClient
+from rate_limiter import RateLimitTimeout
 
 
 @pytest.fixture
@@ -12,13 +13,17 @@ def copper_client():
         mock_config.COPPER_BASE_URL = "https://api.copper.com/developer_api/v1"
         mock_config.COPPER_API_KEY = "test_key"
         mock_config.COPPER_USER_EMAIL = "test@example.com"
+        mock_config.COPPER_REQUESTS_PER_SECOND = 1000
+        mock_config.COPPER_REQUEST_BURST = 1000
+        mock_config.COPPER_BULK_RATE_SHARE = 0.5
+        mock_config.COPPER_RATE_MAX_WAIT_SECONDS = 10
         return CopperClient()
 
 
 class TestCopperClientSearch:
     """Test search operations."""
 
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_search_people_success(self, mock_request, copper_client):
         """Test successful people search."""
         mock_response = Mock()
@@ -34,7 +39,7 @@ class TestCopperClientSearch:
         assert results[0]["name"] == "John Doe"
         mock_request.assert_called_once()
 
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_search_companies_success(self, mock_request, copper_client):
         """Test successful company search."""
         mock_response = Mock()
@@ -49,8 +54,30 @@ class TestCopperClientSearch:
         assert len(results) == 1
         assert results[0]["name"] == "Acme Corp"
 
+    @patch('copper_client.requests.Session.request')
+    def test_search_people_by_emails_chunks_and_pages(self, mock_request, copper_client):
+        """Test that bulk email lookups are chunked and paged."""
+        full_page = Mock(status_code=200)
+        full_page.json.return_value = [{"id": i} for i in range(200)]
+        last_page = Mock(status_code=200)
+        last_page.json.return_value = [{"id": 200}]
+        second_chunk = Mock(status_code=200)
+        second_chunk.json.return_value = [{"id": 201}]
+        mock_request.side_effect = [full_page, last_page, second_chunk]
+
+        emails = [f"user{i}@example.com" for i in range(250)] + ["USER0@example.com"]
+        results = copper_client.search_people_by_emails(emails)
+
+        assert len(results) == 202
+        assert mock_request.call_count == 3
+        first_payload = mock_request.call_args_list[0].kwargs["json"]
+        assert len(first_payload["emails"]) == 200
+        assert first_payload["page_size"] == 200
+        assert mock_request.call_args_list[1].kwargs["json"]["page_number"] == 2
+        assert len(mock_request.call_args_list[2].kwargs["json"]["emails"]) == 50
+
     @patch('time.sleep', return_value=None)  # Skip retry delays in tests
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_search_rate_limit(self, mock_request, mock_sleep, copper_client):
         """Test rate limit handling with retries.
 
@@ -69,7 +96,7 @@ class TestCopperClientSearch:
         assert mock_request.call_count == 3
 
     @patch('time.sleep', return_value=None)
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_search_server_error_retries(self, mock_request, mock_sleep, copper_client):
         """Test server error (5xx) handling with retries."""
         mock_response = Mock()
@@ -84,7 +111,7 @@ class TestCopperClientSearch:
         assert mock_request.call_count == 3
 
     @patch('time.sleep', return_value=None)
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_search_connection_error_retries(self, mock_request, mock_sleep, copper_client):
         """Test connection error handling with retries."""
         import requests
@@ -97,7 +124,7 @@ class TestCopperClientSearch:
         assert mock_request.call_count == 3
 
     @patch('time.sleep', return_value=None)
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_search_retry_then_success(self, mock_request, mock_sleep, copper_client):
         """Test that search succeeds after initial failures."""
         # First call fails, second succeeds
@@ -118,10 +145,107 @@ class TestCopperClientSearch:
         assert mock_request.call_count == 2
 
 
+class TestCopperClientSearchCache:
+    """Test caching of search results."""
+
+    @patch('copper_client.requests.Session.request')
+    def test_repeated_search_served_from_cache(self, mock_request, copper_client):
+        """Test that identical searches only hit the API once."""
+        mock_response = Mock()
+        mock_response.json.return_value = [{"id": 1, "name": "Acme Corp"}]
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        first = copper_client.search_companies({"name": "Acme"})
+        second = copper_client.search_companies({"name": "Acme"})
+
+        assert first == second == [{"id": 1, "name": "Acme Corp"}]
+        mock_request.assert_called_once()
+
+    @patch('copper_client.requests.Session.request')
+    def test_task_and_project_searches_cached(self, mock_request, copper_client):
+        """Test that task and project searches are cached like other entities."""
+        mock_response = Mock()
+        mock_response.json.return_value = [{"id": 7, "name": "Follow up"}]
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        copper_client.search_tasks({"name": "Follow up"})
+        copper_client.search_tasks({"name": "Follow up"})
+        copper_client.search_projects({"name": "Launch"})
+        copper_client.search_projects({"name": "Launch"})
+
+        assert mock_request.call_count == 2
+
+    @patch('time.sleep', return_value=None)
+    @patch('copper_client.requests.Session.request')
+    def test_stale_result_served_on_error(self, mock_request, mock_sleep, copper_client):
+        """Test that an expired result is returned when the API fails."""
+        mock_success_response = Mock()
+        mock_success_response.status_code = 200
+        mock_success_response.json.return_value = [{"id": 1, "name": "John"}]
+
+        mock_fail_response = Mock()
+        mock_fail_response.status_code = 503
+
+        mock_request.side_effect = [mock_success_response] + [mock_fail_response] * 3
+
+        copper_client.search_people({"name": "John"})
+        with patch('cache.time.monotonic', return_value=float('inf')):
+            results = copper_client.search_people({"name": "John"})
+
+        assert results == [{"id": 1, "name": "John"}]
+        assert mock_request.call_count == 4
+
+    @patch('copper_client.requests.Session.request')
+    def test_rate_limit_timeout_raised_not_empty(self, mock_request, copper_client):
+        """Test that a search held back by the rate limiter raises instead of finding nothing."""
+        with patch.object(copper_client._rate_limiter, 'acquire', side_effect=RateLimitTimeout("busy")):
+            with pytest.raises(RateLimitTimeout):
+                copper_client.search_people({"name": "John"})
+
+        mock_request.assert_not_called()
+
+    @patch('copper_client.requests.Session.request')
+    def test_write_invalidates_cached_search(self, mock_request, copper_client):
+        """Test that updating a record clears cached searches for that type."""
+        mock_response = Mock()
+        mock_response.json.return_value = [{"id": 1, "name": "John"}]
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        copper_client.search_people({"name": "John"})
+        copper_client.update_person(1, {"name": "Jane"})
+        copper_client.search_people({"name": "John"})
+
+        assert mock_request.call_count == 3
+
+    @patch('copper_client.requests.Session.request')
+    def test_get_cached_until_record_written(self, mock_request, copper_client):
+        """Test that records fetched by ID are cached until updated or deleted."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": 1, "name": "John"}
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        first = copper_client.get_person(1)
+        first["name"] = "Mutated"
+        second = copper_client.get_person(1)
+        copper_client.get_company(1)
+        assert second == {"id": 1, "name": "John"}
+        assert mock_request.call_count == 2
+
+        copper_client.update_person(1, {"name": "Jane"})
+        copper_client.get_person(1)
+        copper_client.get_company(1)
+
+        assert mock_request.call_count == 4
+
+
 class TestCopperClientCreate:
     """Test create operations."""
 
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_create_person_success(self, mock_request, copper_client):
         """Test successful person creation."""
         mock_response = Mock()
@@ -140,7 +264,7 @@ class TestCopperClientCreate:
         assert result["id"] == 123
         assert result["name"] == "New Person"
 
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_create_company_success(self, mock_request, copper_client):
         """Test successful company creation."""
         mock_response = Mock()
@@ -161,7 +285,7 @@ class TestCopperClientCreate:
 class TestCopperClientUpdate:
     """Test update operations."""
 
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_update_person_success(self, mock_request, copper_client):
         """Test successful person update."""
         mock_response = Mock()
@@ -183,7 +307,7 @@ class TestCopperClientUpdate:
 class TestCopperClientDelete:
     """Test delete operations."""
 
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_delete_person_success(self, mock_request, copper_client):
         """Test successful person deletion."""
         mock_response = Mock()
@@ -195,7 +319,7 @@ class TestCopperClientDelete:
 
         assert result is True
 
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_delete_company_success(self, mock_request, copper_client):
         """Test successful company deletion."""
         mock_response = Mock()
@@ -211,7 +335,7 @@ class TestCopperClientDelete:
 class TestCopperClientGet:
     """Test get individual record operations."""
 
-    @patch('copper_client.requests.request')
+    @patch('copper_client.requests.Session.request')
     def test_get_person_success(self, mock_request, copper_client):
         """Test get person by ID."""
         mock_response = Mock()
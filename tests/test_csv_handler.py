@@ -1,5 +1,8 @@
 """Tests for CSV handler."""
 
+import io
+import os
+
 import pytest
 from unittest.mock import Mock, patch
 from csv_handler import CSVHandler
@@ -43,6 +46,55 @@ class TestCSVParsing:
 
         assert len(rows) == 0
 
+    def test_iter_csv_rows_is_lazy(self, csv_handler):
+        """Test that rows are yielded from the stream one at a time."""
+        stream = io.BytesIO(b"name,email\nJohn Doe,john@example.com\nJane Roe,jane@example.com\n")
+
+        rows = csv_handler.iter_csv_rows(stream)
+
+        assert next(rows) == {"name": "John Doe", "email": "john@example.com"}
+        assert next(rows) == {"name": "Jane Roe", "email": "jane@example.com"}
+        assert not stream.closed
+
+    def test_parse_file_stream_csv(self, csv_handler):
+        """Test parsing a CSV from a binary file object."""
+        stream = io.BytesIO(b"name,company\nJohn Doe,Acme Corp\n")
+
+        rows = csv_handler.parse_file_stream(stream, "contacts.CSV")
+
+        assert rows == [{"name": "John Doe", "company": "Acme Corp"}]
+
+    def test_parse_file_stream_excel(self, csv_handler):
+        """Test parsing an Excel workbook from a binary file object."""
+        openpyxl = pytest.importorskip("openpyxl")
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["name", "company"])
+        sheet.append(["John Doe", "Acme Corp"])
+        sheet.append([None, None])
+        stream = io.BytesIO()
+        workbook.save(stream)
+        stream.seek(0)
+
+        rows = csv_handler.parse_file_stream(stream, "contacts.xlsx")
+
+        assert rows == [{"name": "John Doe", "company": "Acme Corp"}]
+
+    def test_open_download_uses_pooled_session(self, csv_handler):
+        """Test that downloads go through the handler's keep-alive session."""
+        response = Mock()
+        response.raw = io.BytesIO(b"name\nJohn Doe\n")
+        with patch.object(csv_handler.session, 'get', return_value=response) as get:
+            stream = csv_handler.open_download("https://files.slack.com/f", "xoxb-token")
+
+        assert stream.read() == b"name\nJohn Doe\n"
+        get.assert_called_once_with(
+            "https://files.slack.com/f",
+            headers={'Authorization': 'Bearer xoxb-token'},
+            timeout=(5, 60),
+            stream=True
+        )
+
 
 class TestCSVEnrichment:
     """Test CSV enrichment functionality."""
@@ -71,6 +123,17 @@ class TestCSVEnrichment:
 
         assert exists is False
 
+    def test_check_falls_back_to_alias_columns(self, csv_handler, mock_copper_client):
+        """Test that blank columns fall through to the next alias."""
+        row = {"email": "", "name": "", "contact_name": "Jane Roe", "company_name": "Acme Corp"}
+
+        assert csv_handler._check_contact_exists(row) is True
+        assert csv_handler._check_company_exists(row) is True
+        assert csv_handler._check_opportunity_exists({"deal": ""}) is False
+        mock_copper_client.search_people.assert_called_once_with({'name': 'Jane Roe'})
+        mock_copper_client.search_companies.assert_called_once_with({'name': 'Acme Corp'})
+        mock_copper_client.search_opportunities.assert_not_called()
+
     def test_process_csv_queries(self, csv_handler):
         """Test processing CSV queries."""
         rows = [
@@ -88,6 +151,36 @@ class TestCSVEnrichment:
         assert enriched['Company is in CRM'] == 'Yes'
         assert enriched['Opportunity exists'] == 'No'
 
+    def test_process_csv_queries_preserves_row_order(self, csv_handler, mock_copper_client):
+        """Test that concurrently processed rows come back in input order."""
+        mock_copper_client.search_people.side_effect = (
+            lambda criteria: [{"id": 1}] if criteria.get('name', '').endswith('0') else []
+        )
+        rows = [{"name": f"Person {i}"} for i in range(100)]
+
+        results = csv_handler.process_csv_queries(rows)
+
+        assert [r['name'] for r in results['enriched_rows']] == [r['name'] for r in rows]
+        assert [r['Contact is in CRM'] for r in results['enriched_rows']] == [
+            'Yes' if i % 10 == 0 else 'No' for i in range(100)
+        ]
+        assert results['successful'] == 100
+
+    def test_process_csv_queries_deduplicates_lookups(self, csv_handler, mock_copper_client):
+        """Test that rows with the same lookup fields are only queried once."""
+        rows = [
+            {"email": "john@example.com", "company": "Acme Corp", "notes": "first"},
+            {"email": "john@example.com", "company": "Acme Corp", "notes": "second"},
+            {"email": "jane@example.com", "company": "Acme Corp", "notes": "third"},
+        ]
+
+        results = csv_handler.process_csv_queries(rows)
+
+        assert mock_copper_client.search_people.call_count == 2
+        assert [r['notes'] for r in results['enriched_rows']] == ["first", "second", "third"]
+        assert all(r['Contact is in CRM'] == 'Yes' for r in results['enriched_rows'])
+        assert results['successful'] == 3
+
     def test_generate_enriched_csv(self, csv_handler):
         """Test generating enriched CSV."""
         enriched_rows = [
@@ -106,3 +199,36 @@ class TestCSVEnrichment:
         assert b"Contact is in CRM" in csv_content
         assert b"Company is in CRM" in csv_content
         assert b"John Doe" in csv_content
+
+    def test_write_enriched_csv_streams_to_file(self, csv_handler):
+        """Test writing enriched rows into a caller-owned binary file."""
+        enriched_rows = [{"name": "Zoë Doe", "Contact is in CRM": "Yes"}]
+        out = io.BytesIO()
+
+        csv_handler.write_enriched_csv(enriched_rows, out)
+
+        assert not out.closed
+        assert out.getvalue() == csv_handler.generate_enriched_csv(enriched_rows)
+        assert out.getvalue() == "name,Contact is in CRM\r\nZoë Doe,Yes\r\n".encode('utf-8')
+
+    def test_process_csv_writes_enriched_file(self, csv_handler, tmp_path):
+        """Test processing an uploaded CSV file from disk."""
+        upload = tmp_path / "contacts.csv"
+        upload.write_bytes(b"name,email,company\nJohn Doe,john@example.com,Acme Corp\n")
+
+        result = csv_handler.process_csv(str(upload), "U123")
+
+        assert result['success'] is True
+        assert "Total rows: 1" in result['summary']
+        with open(result['output_file'], 'rb') as f:
+            content = f.read()
+        os.remove(result['output_file'])
+        assert b"Contact is in CRM" in content
+        assert b"John Doe" in content
+
+    def test_process_csv_missing_file(self, csv_handler, tmp_path):
+        """Test that an unreadable upload is reported as an error."""
+        result = csv_handler.process_csv(str(tmp_path / "missing.csv"), "U123")
+
+        assert result['success'] is False
+        assert 'error' in result
@@ -0,0 +1,147 @@
+"""Tests for approver notification batching."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from notifier import ApproverNotifier
+
+
+def _card(request_id):
+    return [{"type": "section", "text": {"type": "mrkdwn", "text": request_id}}]
+
+
+class TestApproverNotifier:
+    """Test coalescing, batch limits and flushing."""
+
+    def test_single_card_sent_unchanged(self):
+        """Test that a lone card is posted as-is on flush."""
+        notifier = ApproverNotifier(window=60, autostart=False)
+        client = Mock()
+        notifier.enqueue(client, "U1", "New request", _card("r1"))
+
+        notifier.flush()
+
+        client.chat_postMessage.assert_called_once_with(
+            channel="U1", text="New request", blocks=_card("r1")
+        )
+
+    def test_cards_coalesced_per_approver(self):
+        """Test that queued cards become one DM per approver."""
+        notifier = ApproverNotifier(window=60, autostart=False)
+        client = Mock()
+        for request_id in ("r1", "r2", "r3"):
+            notifier.enqueue(client, "U1", f"Request {request_id}", _card(request_id))
+        notifier.enqueue(client, "U2", "Request r1", _card("r1"))
+
+        notifier.flush()
+
+        assert client.chat_postMessage.call_count == 2
+        combined = client.chat_postMessage.call_args_list[0].kwargs
+        assert combined["channel"] == "U1"
+        assert combined["text"] == "3 pending approvals"
+        assert [b["type"] for b in combined["blocks"]].count("divider") == 3
+
+    def test_batches_split_at_max_batch(self):
+        """Test that more than max_batch cards are split across messages."""
+        notifier = ApproverNotifier(window=60, max_batch=10, autostart=False)
+        client = Mock()
+        for i in range(25):
+            notifier.enqueue(client, "U1", f"Request {i}", _card(str(i)))
+
+        notifier.flush()
+
+        texts = [call.kwargs["text"] for call in client.chat_postMessage.call_args_list]
+        assert texts == ["10 pending approvals", "10 pending approvals", "5 pending approvals"]
+
+    def test_first_card_sent_without_waiting_for_window(self):
+        """Test that the worker sends a card at once when no window is open."""
+        notifier = ApproverNotifier(window=60)
+        sent = threading.Event()
+        client = Mock()
+        client.chat_postMessage.side_effect = lambda **kwargs: sent.set()
+
+        notifier.enqueue(client, "U1", "New request", _card("r1"))
+
+        try:
+            assert sent.wait(timeout=2)
+        finally:
+            notifier.stop()
+        client.chat_postMessage.assert_called_once()
+
+    def test_cards_during_window_sent_when_it_closes(self):
+        """Test that cards arriving after a send are batched until the window closes."""
+        notifier = ApproverNotifier(window=0.3)
+        sends = threading.Semaphore(0)
+        client = Mock()
+        client.chat_postMessage.side_effect = lambda **kwargs: sends.release()
+
+        try:
+            notifier.enqueue(client, "U1", "Request r1", _card("r1"))
+            assert sends.acquire(timeout=2)
+            notifier.enqueue(client, "U1", "Request r2", _card("r2"))
+            notifier.enqueue(client, "U1", "Request r3", _card("r3"))
+            assert not sends.acquire(timeout=0.1)
+            assert sends.acquire(timeout=2)
+        finally:
+            notifier.stop()
+
+        texts = [call.kwargs["text"] for call in client.chat_postMessage.call_args_list]
+        assert texts == ["Request r1", "2 pending approvals"]
+
+    def test_combined_block_ids_unique(self):
+        """Test that repeated block_ids from card templates are made unique."""
+        notifier = ApproverNotifier(window=60, autostart=False)
+        client = Mock()
+        card = [{"type": "actions", "block_id": "approval", "elements": []}]
+        notifier.enqueue(client, "U1", "Request r1", card)
+        notifier.enqueue(client, "U1", "Request r2", card)
+
+        notifier.flush()
+
+        blocks = client.chat_postMessage.call_args.kwargs["blocks"]
+        assert [b["block_id"] for b in blocks if "block_id" in b] == ["approval-0", "approval-1"]
+        assert card[0]["block_id"] == "approval"
+
+    def test_without_autostart_cards_wait_for_start(self):
+        """Test that a notifier without autostart sends only once started."""
+        notifier = ApproverNotifier(window=0.01, autostart=False)
+        sent = threading.Event()
+        client = Mock()
+        client.chat_postMessage.side_effect = lambda **kwargs: sent.set()
+
+        notifier.enqueue(client, "U1", "New request", _card("r1"))
+        assert not sent.wait(timeout=0.1)
+
+        notifier.start()
+        try:
+            assert sent.wait(timeout=2)
+        finally:
+            notifier.stop()
+
+    def test_failure_is_logged_not_raised(self):
+        """Test that a failed DM does not stop other approvers."""
+        notifier = ApproverNotifier(window=60, autostart=False)
+        client = Mock()
+        client.chat_postMessage.side_effect = [Exception("boom"), None]
+        notifier.enqueue(client, "U1", "New request", _card("r1"))
+        notifier.enqueue(client, "U2", "New request", _card("r1"))
+
+        notifier.flush()
+
+        assert client.chat_postMessage.call_count == 2
+
+    def test_flush_fans_out_on_executor(self):
+        """Test that flush sends approvers in parallel and waits for all of them."""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            notifier = ApproverNotifier(window=60, executor=pool, autostart=False)
+            barrier = threading.Barrier(3, timeout=2)
+            client = Mock()
+            client.chat_postMessage.side_effect = lambda **kwargs: barrier.wait()
+            for approver_id in ("U1", "U2", "U3"):
+                notifier.enqueue(client, approver_id, "New request", _card("r1"))
+
+            notifier.flush()
+
+        assert client.chat_postMessage.call_count == 3
+        assert not barrier.broken
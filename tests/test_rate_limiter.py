@@ -0,0 +1,72 @@
+"""Tests for the Copper rate limiter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from rate_limiter import RateLimitTimeout, TokenBucket, bulk, is_bulk
+
+
+class TestTokenBucket:
+    """Test bursts, refill and queueing."""
+
+    def test_burst_passes_without_waiting(self):
+        """Test that up to capacity calls go straight through."""
+        with patch('rate_limiter.time.monotonic', return_value=100.0), \
+                patch('rate_limiter.time.sleep') as sleep:
+            bucket = TokenBucket(rate=2, capacity=3)
+            waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        sleep.assert_not_called()
+
+    def test_calls_past_burst_queue_at_rate(self):
+        """Test that callers past the burst wait their turn in order."""
+        with patch('rate_limiter.time.monotonic', return_value=100.0), \
+                patch('rate_limiter.time.sleep') as sleep:
+            bucket = TokenBucket(rate=2, capacity=1)
+            waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.5, 1.0]
+        assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+    def test_tokens_refill_over_time(self):
+        """Test that idle time refills the bucket up to capacity."""
+        with patch('rate_limiter.time.sleep'):
+            with patch('rate_limiter.time.monotonic', return_value=100.0):
+                bucket = TokenBucket(rate=2, capacity=2)
+                bucket.acquire()
+                bucket.acquire()
+            with patch('rate_limiter.time.monotonic', return_value=160.0):
+                assert bucket.acquire() == 0.0
+                assert bucket.acquire() == 0.0
+                assert bucket.acquire() == 0.5
+
+    def test_max_wait_exceeded_takes_no_token(self):
+        """Test that a caller unwilling to wait that long is refused without queueing."""
+        with patch('rate_limiter.time.monotonic', return_value=100.0), \
+                patch('rate_limiter.time.sleep') as sleep:
+            bucket = TokenBucket(rate=1, capacity=1)
+            bucket.acquire()
+            with pytest.raises(RateLimitTimeout):
+                bucket.acquire(max_wait=0.5)
+            waits = [bucket.acquire(max_wait=1.0)]
+
+        assert waits == [1.0]
+        sleep.assert_called_once_with(1.0)
+
+    def test_invalid_settings_rejected(self):
+        """Test that a non-positive rate is refused."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=5)
+
+
+class TestBulk:
+    """Test marking bulk traffic."""
+
+    def test_bulk_marks_only_the_block(self):
+        """Test that bulk() flags the current thread for the block only."""
+        assert not is_bulk()
+        with bulk():
+            assert is_bulk()
+        assert not is_bulk()
@@ -0,0 +1,89 @@
+"""Tests for the Slack helpers shared by both apps."""
+
+import logging
+import queue
+from unittest.mock import Mock
+
+import pytest
+
+import slack_common
+from slack_common import first_delivery, ruled_out_by_stub, strip_bot_mention
+
+
+@pytest.fixture
+def client():
+    """Slack client whose auth.test returns bot user U0BOT."""
+    slack_common._bot_mention_re = None
+    client = Mock()
+    client.auth_test.return_value = {"user_id": "U0BOT"}
+    yield client
+    slack_common._bot_mention_re = None
+
+
+class TestStripBotMention:
+    """Test removing the bot's mention from message text."""
+
+    def test_every_mention_removed(self, client):
+        """Test that leading and later mentions are all removed."""
+        text = strip_bot_mention("<@U0BOT> status of <@U0BOT|bot> PubX", client)
+
+        assert text == "status of  PubX"
+
+    def test_other_users_kept_and_auth_test_cached(self, client):
+        """Test that other mentions survive and auth.test runs once."""
+        assert strip_bot_mention("<@U0BOT> ask <@U123>", client) == "ask <@U123>"
+        assert strip_bot_mention("<@U0BOT>", client) == ""
+
+        client.auth_test.assert_called_once()
+
+
+class TestFirstDelivery:
+    """Test skipping redelivered events."""
+
+    def test_redelivery_rejected(self):
+        """Test that a repeated event_id is only handled once."""
+        assert first_delivery({"event_id": "Ev-test-1"})
+        assert not first_delivery({"event_id": "Ev-test-1"})
+
+    def test_missing_event_id_always_handled(self):
+        """Test that envelopes without an event_id are never dropped."""
+        assert first_delivery({})
+        assert first_delivery({})
+
+
+class TestRuledOutByStub:
+    """Test the early file type check on file_shared stubs."""
+
+    @pytest.mark.parametrize("stub", [
+        {"name": "leads.CSV"},
+        {"filetype": "xlsx"},
+        {"name": "export", "mimetype": "text/csv"},
+        {"id": "F1"},
+    ])
+    def test_supported_or_unknown_kept(self, stub):
+        """Test that supported files and bare ID stubs are not ruled out."""
+        assert not ruled_out_by_stub(stub)
+
+    @pytest.mark.parametrize("stub", [
+        {"name": "photo.png", "filetype": "png"},
+        {"name": "report", "mimetype": "application/vnd.ms-excel"},
+    ])
+    def test_unsupported_ruled_out(self, stub):
+        """Test that other files, including extensionless Excel, are ruled out."""
+        assert ruled_out_by_stub(stub)
+
+
+class TestDroppingQueueHandler:
+    """Test the bounded log queue."""
+
+    def test_full_queue_drops_record(self):
+        """Test that a record is dropped, not blocked on, when the queue is full."""
+        log_queue = queue.Queue(maxsize=1)
+        handler = slack_common._DroppingQueueHandler(log_queue)
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg %s", ("a",), None)
+
+        handler.emit(record)
+        handler.emit(record)
+
+        assert log_queue.qsize() == 1
+        assert log_queue.get_nowait().getMessage() == "msg a"